@@ -5,19 +5,25 @@ This module provides a clean HTTP API for job-candidate matching,
 following the same structure as the resume_generator_parser API.
 """
 
-import json
+import asyncio
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+import msgspec
+import orjson
+
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Form
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from models import JobDescription, CandidateMatch
-from semantic_matcher import SemanticMatcher
+from semantic_matcher import SemanticMatcher, ResumeIndex, job_rank_key
+from request_batcher import RequestBatcher
+from job_cache import SemanticJobCache
 from config import config
 
 # Configure logging
@@ -31,31 +37,128 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Initialize the semantic matcher
-try:
-    matcher = SemanticMatcher(
-        sbert_model=config.sbert_model,
-        device=config.device,
-        blend_alpha=config.blend_alpha,
-        title_weight=config.title_weight,
-    )
-    logger.info("✅ Semantic matcher initialized successfully")
-except Exception as e:
-    logger.error(f"❌ Failed to initialize semantic matcher: {e}")
-    matcher = None
+# The semantic matcher is built on first use (or at startup with CANDIDATE_PRELOAD),
+# so importing this module and serving /health never wait on torch + model loading
+matcher: Optional[SemanticMatcher] = None
+_matcher_lock = threading.Lock()
+
+# Pre-embedded resume corpora, keyed by resumes directory
+RESUME_INDEX: Dict[str, ResumeIndex] = {}
+_index_checked: Dict[str, float] = {}  # resumes directory -> monotonic time of its last change check
+_index_lock = threading.Lock()          # held while (re)building only
+
+# Coalesces job embeddings of concurrent requests into one encoder call
+batcher: Optional[RequestBatcher] = None
+
+# Reuses match results for near-duplicate jobs against the same index
+job_cache = SemanticJobCache(
+    threshold=config.job_cache_threshold,
+    max_entries=config.job_cache_size,
+    ttl_seconds=config.job_cache_ttl,
+)
+
+def get_matcher() -> Optional[SemanticMatcher]:
+    """Return the shared matcher, loading the model on the first call (None if that fails)."""
+    global matcher, batcher
+    with _matcher_lock:
+        if matcher is None:
+            try:
+                m = SemanticMatcher.get(
+                    sbert_model=config.sbert_model,
+                    device=config.device,
+                    blend_alpha=config.blend_alpha,
+                    title_weight=config.title_weight,
+                    cache_dir=config.embedding_cache_dir or None,
+                    use_onnx=config.use_onnx,
+                    quantize=config.quantize,
+                    ann_min_candidates=config.ann_min_candidates,
+                    ann_shortlist=config.ann_shortlist,
+                    embedding_dtype=config.embedding_dtype,
+                    num_threads=config.num_threads,
+                    precision=config.precision,
+                    jd_cache_size=config.jd_cache_size,
+                    passage_pooling=config.passage_pooling,
+                )
+                batcher = RequestBatcher(m.embed_jobs)
+                matcher = m
+                logger.info("✅ Semantic matcher initialized successfully")
+            except Exception as e:
+                logger.error(f"❌ Failed to initialize semantic matcher: {e}")
+        return matcher
+
+async def require_matcher() -> SemanticMatcher:
+    """Matcher for a request handler; loads it off the event loop if needed."""
+    m = matcher or await asyncio.to_thread(get_matcher)
+    if m is None:
+        raise HTTPException(status_code=500, detail="Semantic matcher not available")
+    return m
+
+def get_resume_index(resumes_dir: str, force: bool = False) -> ResumeIndex:
+    """
+    Return the index for a resumes directory, (re)building it when missing,
+    stale or when explicitly forced. Rebuilds only re-embed changed resumes
+    thanks to the matcher's embedding cache.
+    
+    Staleness (a stat of every resume file) is checked at most once per
+    `config.index_check_interval` seconds per directory, outside the lock.
+    """
+    index = RESUME_INDEX.get(resumes_dir)
+    if not force and index is not None:
+        now = time.monotonic()
+        if now - _index_checked.get(resumes_dir, 0.0) < config.index_check_interval:
+            return index
+        _index_checked[resumes_dir] = now  # concurrent requests skip the check meanwhile
+        if not index.is_stale():
+            return index
+    
+    with _index_lock:  # handlers run this in worker threads
+        current = RESUME_INDEX.get(resumes_dir)
+        if not force and current is not None and current is not index:
+            return current  # rebuilt by another request while we waited
+        index = matcher.index_resumes(resumes_dir)
+        RESUME_INDEX[resumes_dir] = index
+        _index_checked[resumes_dir] = time.monotonic()
+        logger.info(f"Indexed {len(index)} resumes from {resumes_dir}")
+        return index
+
+@app.on_event("startup")
+async def preload():
+    """
+    With CANDIDATE_PRELOAD, load the model and embed the default resume corpus
+    before taking traffic, so the first /match only has to embed the job.
+    """
+    if not config.preload or await asyncio.to_thread(get_matcher) is None:
+        return
+    try:
+        await asyncio.to_thread(get_resume_index, config.default_resumes_dir)
+    except Exception as e:
+        logger.error(f"❌ Failed to index resumes at startup: {e}")
+    batcher.start()
+
+@app.on_event("shutdown")
+async def stop_batcher():
+    """Stop the background embedding worker."""
+    if batcher is not None:
+        await batcher.stop()
 
 # Request/Response models
-class JobMatchRequest(BaseModel):
-    job: Dict[str, any]  # Job description data
+# /match bodies are decoded by msgspec against these strict schemas, skipping
+# pydantic validation on the hot path; responses are serialized with orjson.
+# Required job fields default to empty so that a missing one gets _build_job's
+# 400 "Missing required fields" rather than a decode error.
+class JobPayload(msgspec.Struct):
+    title: str = ""
+    description: str = ""
+    requirements: List[str] = []
+    company: str = ""
+    preferred_skills: List[str] = []
+
+class JobMatchRequest(msgspec.Struct):
+    job: JobPayload  # Job description data
     resumes_dir: Optional[str] = None
     top_n: Optional[int] = None
 
-class JobMatchResponse(BaseModel):
-    success: bool
-    data: Optional[List[Dict[str, any]]] = None
-    error: Optional[str] = None
-    processing_time: float
-    total_candidates: int
+_match_request_decoder = msgspec.json.Decoder(JobMatchRequest)
 
 class HealthResponse(BaseModel):
     status: str
@@ -78,7 +181,9 @@ async def root():
             "/": "API information",
             "/health": "Health check",
             "/models": "Available models",
-            "/match": "Match candidates to a job"
+            "/match": "Match candidates to a job",
+            "/match-file": "Match candidates to a job from an uploaded JSON file",
+            "/reindex": "Rebuild the resume index"
         },
         "usage": "Send POST requests to /match with job data to find candidate matches"
     }
@@ -86,14 +191,11 @@ async def root():
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    if matcher is None:
-        raise HTTPException(status_code=500, detail="Semantic matcher not initialized")
-    
     return HealthResponse(
         status="healthy",
         timestamp=datetime.utcnow().isoformat(),
-        matcher="initialized",
-        model=matcher.model_name if hasattr(matcher, 'model_name') else "unknown"
+        matcher="initialized" if matcher is not None else "not loaded",
+        model=config.sbert_model
     )
 
 @app.get("/models", response_model=ModelsResponse)
@@ -105,80 +207,101 @@ async def get_models():
         "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
     ]
     
-    current_model = matcher.model_name if hasattr(matcher, 'model_name') else "unknown"
+    current_model = config.sbert_model
     
     return ModelsResponse(
         models=available_models,
         current_model=current_model
     )
 
-@app.post("/match", response_model=JobMatchResponse)
-async def match_candidates(request: JobMatchRequest):
-    """Match candidates to a job description."""
-    if matcher is None:
-        raise HTTPException(status_code=500, detail="Semantic matcher not available")
+def _json_response(payload: Dict[str, Any]) -> Response:
+    # orjson straight to bytes; no pydantic response-model pass
+    return Response(content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY), media_type="application/json")
+
+def _build_job(job_data: Dict[str, Any]) -> JobDescription:
+    """Validate a job dict (from either match endpoint) and build the JobDescription."""
+    required_fields = ['title', 'description', 'requirements']
+    missing_fields = [field for field in required_fields if not job_data.get(field)]
+    if missing_fields:
+        raise HTTPException(status_code=400, detail=f"Missing required fields: {missing_fields}")
+    
+    return JobDescription(
+        title=job_data.get('title', ''),
+        company=job_data.get('company', ''),
+        description=job_data.get('description', ''),
+        requirements=job_data.get('requirements', []),
+        preferred_skills=job_data.get('preferred_skills', [])
+    )
+
+def _serialize_matches(matches: List[CandidateMatch]) -> List[Dict[str, Any]]:
+    """Convert matches to dictionaries for the JSON response."""
+    return [
+        {
+            "name": match.name,
+            "filename": match.filename,
+            "title": match.title,
+            "match_score": match.match_score,
+            "skills_match": match.skills_match,
+            "summary": match.summary
+        }
+        for match in matches
+    ]
+
+async def _run_match(job_data: Dict[str, Any], resumes_dir: Optional[str], top_n: Optional[int]) -> Response:
+    """
+    Shared body of /match and /match-file: embed the job (batched with concurrent
+    requests), score it against the pre-embedded corpus in a worker thread so the
+    event loop stays free, reuse cached results for near-duplicate jobs.
+    """
+    matcher = await require_matcher()
     
     start_time = time.time()
     
     try:
-        # Extract job data
-        job_data = request.job
-        resumes_dir = request.resumes_dir or config.default_resumes_dir
-        top_n = request.top_n or config.default_top_n
-        
-        # Validate required fields
-        required_fields = ['title', 'description', 'requirements']
-        missing_fields = [field for field in required_fields if not job_data.get(field)]
-        if missing_fields:
-            raise HTTPException(status_code=400, detail=f"Missing required fields: {missing_fields}")
-        
-        # Create JobDescription object
-        job = JobDescription(
-            title=job_data.get('title', ''),
-            company=job_data.get('company', ''),
-            description=job_data.get('description', ''),
-            requirements=job_data.get('requirements', []),
-            preferred_skills=job_data.get('preferred_skills', [])
-        )
-        
-        # Perform matching
-        matches = matcher.match_candidates(job, resumes_dir, top_n=top_n)
-        
-        # Convert matches to dictionaries for JSON response
-        match_data = []
-        for match in matches:
-            match_data.append({
-                "name": match.name,
-                "filename": match.filename,
-                "title": match.title,
-                "match_score": match.match_score,
-                "skills_match": match.skills_match,
-                "summary": match.summary
-            })
+        job = _build_job(job_data)
+        resumes_dir = resumes_dir or config.default_resumes_dir
+        top_n = top_n or config.default_top_n
         
-        processing_time = time.time() - start_time
+        jd_vec = await batcher.submit(job)
+        index = await asyncio.to_thread(get_resume_index, resumes_dir)
+        # Only the embedding is matched fuzzily: skills and title (which also feed
+        # skills_match and the blended score) must be identical for a cache hit
+        scope = (resumes_dir, index.signature, top_n, job_rank_key(job))
+        matches = job_cache.get(jd_vec, scope)
+        if matches is None:
+            matches = await asyncio.to_thread(matcher.score_against_index, job, index, top_n, jd_vec)
+            job_cache.put(jd_vec, scope, matches)
         
-        return JobMatchResponse(
-            success=True,
-            data=match_data,
-            error=None,
-            processing_time=processing_time,
-            total_candidates=len(match_data)
-        )
+        match_data = _serialize_matches(matches)
+        return _json_response({
+            "success": True,
+            "data": match_data,
+            "error": None,
+            "processing_time": time.time() - start_time,
+            "total_candidates": len(match_data)
+        })
         
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error during candidate matching: {e}")
-        processing_time = time.time() - start_time
-        
-        return JobMatchResponse(
-            success=False,
-            data=None,
-            error=str(e),
-            processing_time=processing_time,
-            total_candidates=0
-        )
+        return _json_response({
+            "success": False,
+            "data": None,
+            "error": str(e),
+            "processing_time": time.time() - start_time,
+            "total_candidates": 0
+        })
+
+@app.post("/match")
+async def match_candidates(http_request: Request):
+    """Match candidates to a job description (body: JobMatchRequest as JSON)."""
+    try:
+        request = _match_request_decoder.decode(await http_request.body())
+    except msgspec.DecodeError as e:  # malformed JSON or schema mismatch
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    return await _run_match(msgspec.structs.asdict(request.job), request.resumes_dir, request.top_n)
 
 @app.post("/match-file")
 async def match_candidates_file(
@@ -187,75 +310,33 @@ async def match_candidates_file(
     top_n: Optional[int] = Form(None)
 ):
     """Match candidates to a job description from uploaded file."""
-    if matcher is None:
-        raise HTTPException(status_code=500, detail="Semantic matcher not available")
+    try:
+        job_data = orjson.loads(await job_file.read())  # bytes in, no separate UTF-8 decode
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON file")
+    
+    return await _run_match(job_data, resumes_dir, top_n)
+
+@app.post("/reindex")
+async def reindex_resumes(resumes_dir: Optional[str] = None):
+    """Rebuild the resume index for a directory (defaults to the configured one)."""
+    matcher = await require_matcher()
     
     start_time = time.time()
+    resumes_dir = resumes_dir or config.default_resumes_dir
     
     try:
-        # Read and parse job file
-        content = await job_file.read()
-        try:
-            job_data = json.loads(content.decode('utf-8'))
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON file")
-        
-        resumes_dir = resumes_dir or config.default_resumes_dir
-        top_n = top_n or config.default_top_n
-        
-        # Validate required fields
-        required_fields = ['title', 'description', 'requirements']
-        missing_fields = [field for field in required_fields if not job_data.get(field)]
-        if missing_fields:
-            raise HTTPException(status_code=400, detail=f"Missing required fields: {missing_fields}")
-        
-        # Create JobDescription object
-        job = JobDescription(
-            title=job_data.get('title', ''),
-            company=job_data.get('company', ''),
-            description=job_data.get('description', ''),
-            requirements=job_data.get('requirements', []),
-            preferred_skills=job_data.get('preferred_skills', [])
-        )
-        
-        # Perform matching
-        matches = matcher.match_candidates(job, resumes_dir, top_n=top_n)
-        
-        # Convert matches to dictionaries for JSON response
-        match_data = []
-        for match in matches:
-            match_data.append({
-                "name": match.name,
-                "filename": match.filename,
-                "title": match.title,
-                "match_score": match.match_score,
-                "skills_match": match.skills_match,
-                "summary": match.summary
-            })
-        
-        processing_time = time.time() - start_time
-        
-        return {
-            "success": True,
-            "data": match_data,
-            "error": None,
-            "processing_time": processing_time,
-            "total_candidates": len(match_data)
-        }
-        
-    except HTTPException:
-        raise
+        index = await asyncio.to_thread(get_resume_index, resumes_dir, True)
     except Exception as e:
-        logger.error(f"Error during candidate matching: {e}")
-        processing_time = time.time() - start_time
-        
-        return {
-            "success": False,
-            "data": None,
-            "error": str(e),
-            "processing_time": processing_time,
-            "total_candidates": 0
-        }
+        logger.error(f"Error rebuilding resume index: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return {
+        "success": True,
+        "resumes_dir": resumes_dir,
+        "total_candidates": len(index),
+        "processing_time": time.time() - start_time
+    }
 
 @app.exception_handler(404)
 async def not_found(request, exc):
@@ -31,20 +31,43 @@ class CandidateRecommendationConfig:
         """
         # Sentence Transformer Model Configuration
         self.sbert_model = os.getenv("CANDIDATE_SBERT_MODEL", "sentence-transformers/all-mpnet-base-v2")
-        self.device = os.getenv("CANDIDATE_DEVICE", "cpu")  # Device: 'gpu' or 'cpu'
+        self.device = os.getenv("CANDIDATE_DEVICE", "cpu")  # Device: 'gpu' (CUDA, FP16) or 'cpu'
+        self.use_onnx = os.getenv("CANDIDATE_USE_ONNX", "false").lower() == "true"  # ONNX Runtime on CPU (needs optimum)
+        self.quantize = os.getenv("CANDIDATE_QUANTIZE", "false").lower() == "true"  # Dynamic INT8 weights on CPU
+        self.precision = os.getenv("CANDIDATE_PRECISION", "auto")  # Encoder weights: 'auto' (fp16 on GPU, else fp32), 'fp32', 'fp16', 'bf16'
+        self.num_threads = int(os.getenv("CANDIDATE_THREADS", "0"))  # CPU inference threads (0: detect from affinity / cgroup quota)
+        
+        # Embedding Cache (set to an empty string to disable)
+        self.embedding_cache_dir = os.getenv("CANDIDATE_EMBEDDING_CACHE_DIR", "~/.cache/candidate_recommendation/embeddings")
+        self.embedding_dtype = os.getenv("CANDIDATE_EMBEDDING_DTYPE", "float16")  # Resume embedding storage: 'float16' or 'float32'
+        self.passage_pooling = os.getenv("CANDIDATE_PASSAGE_POOLING", "false").lower() == "true"  # Mean-pool title/experience/skills passages
         
         # Matching Algorithm Parameters
         self.blend_alpha = float(os.getenv("CANDIDATE_BLEND_ALPHA", "0.25"))  # Weight for skills Jaccard vs embedding similarity
         self.title_weight = float(os.getenv("CANDIDATE_TITLE_WEIGHT", "0.10"))  # Extra weight for title alignment
         
+        # Approximate Retrieval (faiss, optional): shortlist by embedding, then re-rank
+        self.ann_min_candidates = int(os.getenv("CANDIDATE_ANN_MIN_CANDIDATES", "10000"))  # Corpus size that enables faiss
+        self.ann_shortlist = int(os.getenv("CANDIDATE_ANN_SHORTLIST", "200"))  # Candidates re-ranked per job
+        
+        # Job Embedding Cache: exact repeats of a job text skip the encoder (size 0 disables)
+        self.jd_cache_size = int(os.getenv("CANDIDATE_JD_CACHE_SIZE", "128"))  # Job embeddings kept in memory (LRU)
+        
+        # Semantic Job Cache: reuse results for near-duplicate jobs with the same skill terms and title (size 0 disables)
+        self.job_cache_threshold = float(os.getenv("CANDIDATE_JOB_CACHE_THRESHOLD", "0.95"))  # Min cosine similarity for a hit
+        self.job_cache_size = int(os.getenv("CANDIDATE_JOB_CACHE_SIZE", "256"))  # Max cached jobs (LRU)
+        self.job_cache_ttl = float(os.getenv("CANDIDATE_JOB_CACHE_TTL", "300"))  # Seconds before an entry expires
+        
         # Default Paths
         self.default_resumes_dir = os.getenv("CANDIDATE_DEFAULT_RESUMES_DIR", "../resume_generator_parser/example_output/parsed")
         self.default_top_n = int(os.getenv("CANDIDATE_DEFAULT_TOP_N", "10"))
+        self.index_check_interval = float(os.getenv("CANDIDATE_INDEX_CHECK_INTERVAL", "10"))  # Seconds between checks of a resumes directory for changes (0: every request)
         
         # API Configuration
         self.api_host = os.getenv("CANDIDATE_API_HOST", "0.0.0.0")
         self.api_port = int(os.getenv("CANDIDATE_API_PORT", "8001"))  # Different port from resume parser
         self.api_debug = os.getenv("CANDIDATE_API_DEBUG", "false").lower() == "true"
+        self.preload = os.getenv("CANDIDATE_PRELOAD", "false").lower() == "true"  # Load the model + default index at startup
 
 # Create global configuration instance
 # This instance is imported throughout the system to access configuration
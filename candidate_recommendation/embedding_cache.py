@@ -0,0 +1,140 @@
+"""
+Persistent on-disk embedding cache for candidate resumes.
+
+Resume embeddings live in one flat row-major file per model and precision,
+read through ``np.memmap``, with an ``index.json`` mapping each content key to
+its row. The key is a BLAKE2b digest of the model name and the candidate text
+that was embedded. Only new or changed resumes go through the model; new rows
+are appended to the file and the index is replaced atomically afterwards, so a
+crash can at worst leave unreferenced rows behind.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Serialize writers across processes (e.g. several API workers) where supported
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Bump when the on-disk layout or the text -> embedding contract changes
+CACHE_VERSION = "v2"
+
+
+def content_hash(model_name: str, text: str) -> str:
+    """Return the hex BLAKE2b key of a text as embedded by a given model."""
+    return hashlib.blake2b(f"{model_name}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Content-addressed store of embeddings for a single model.
+
+    Files live under ``<cache_dir>/<model-slug>-<CACHE_VERSION>/`` so that
+    switching models never mixes vectors from different embedding spaces:
+    ``emb.<dtype>`` holds the rows and ``index.<dtype>.json`` the key -> row map.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str, dtype: np.dtype = np.float32):
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "__", model_name)
+        self.root = Path(cache_dir).expanduser() / f"{slug}-{CACHE_VERSION}"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.dtype = np.dtype(dtype)  # on-disk precision; float16 halves the cache size
+        self._data_path = self.root / f"emb.{self.dtype.name}"
+        self._index_path = self.root / f"index.{self.dtype.name}.json"
+
+    @contextmanager
+    def _locked(self):
+        with open(self.root / ".lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _read_index(self) -> Dict:
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"dim": 0, "rows": {}}
+        except Exception as e:
+            logger.warning(f"Discarding unreadable embedding cache index: {e}")
+            return {"dim": 0, "rows": {}}
+
+    def _write_index(self, index: Dict) -> None:
+        tmp = self._index_path.with_name(self._index_path.name + ".tmp")
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        tmp.replace(self._index_path)  # atomic, so readers never see a partial index
+
+    def _append(self, index: Dict, keys: List[str], embeddings: np.ndarray) -> None:
+        """Append rows for `keys` to the data file and record them in `index`."""
+        dim = embeddings.shape[1]
+        if index["dim"] != dim:  # first write, or an unexpected model change: start over
+            index.update(dim=dim, rows={})
+            self._data_path.unlink(missing_ok=True)
+
+        row_bytes = dim * self.dtype.itemsize
+        size = self._data_path.stat().st_size if self._data_path.exists() else 0
+        first = size // row_bytes
+        with open(self._data_path, "ab") as f:
+            f.truncate(first * row_bytes)  # drop a torn row left by an interrupted write
+            f.write(np.ascontiguousarray(embeddings, dtype=self.dtype).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+        for offset, key in enumerate(keys):
+            index["rows"][key] = first + offset
+
+    def __len__(self) -> int:
+        return len(self._read_index()["rows"])
+
+    def encode(
+        self,
+        texts: List[str],
+        encode_fn: Callable[[List[str]], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Return float32 embeddings for ``texts``, calling ``encode_fn`` only on cache misses.
+        """
+        keys = [content_hash(self.model_name, t) for t in texts]
+
+        with self._locked():
+            index = self._read_index()
+            rows = index["rows"]
+            hit_idx = [i for i, k in enumerate(keys) if k in rows]
+            miss_idx = [i for i, k in enumerate(keys) if k not in rows]
+
+            parts = []
+            if hit_idx:
+                row_bytes = index["dim"] * self.dtype.itemsize
+                n_rows = self._data_path.stat().st_size // row_bytes
+                store = np.memmap(self._data_path, dtype=self.dtype, mode="r", shape=(n_rows, index["dim"]))
+                hit_rows = np.fromiter((rows[keys[i]] for i in hit_idx), dtype=np.int64, count=len(hit_idx))
+                parts.append((hit_idx, np.asarray(store[hit_rows], dtype=np.float32)))
+                del store
+
+            if miss_idx:
+                fresh = np.asarray(encode_fn([texts[i] for i in miss_idx]), dtype=np.float32)
+                # round-trip through the storage dtype so cold and warm runs agree bit for bit
+                parts.append((miss_idx, fresh.astype(self.dtype).astype(np.float32, copy=False)))
+                try:
+                    self._append(index, [keys[i] for i in miss_idx], fresh)
+                    self._write_index(index)
+                except Exception as e:
+                    logger.warning(f"Failed to update embedding cache: {e}")
+
+        logger.info(f"Embedding cache: {len(hit_idx)} hits, {len(miss_idx)} misses")
+        out = np.empty((len(texts), parts[0][1].shape[1]) if parts else (0, 0), dtype=np.float32)
+        for idx, embs in parts:
+            out[idx] = embs
+        return out
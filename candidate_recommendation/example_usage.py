@@ -6,10 +6,17 @@ This file demonstrates various ways to integrate and use the candidate recommend
 system, from simple matching to advanced integration scenarios.
 """
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from models import JobDescription
-from semantic_matcher import SemanticMatcher
+from semantic_matcher import SemanticMatcher, _iter_combined
 
 def example_1_basic_usage():
     """Example 1: Basic job-candidate matching."""
@@ -185,53 +192,57 @@ def example_4_integration_with_resume_parser():
     print("=" * 60)
     
     # Simulate getting parsed resumes from the resume parser
-    def load_parsed_resumes(parser_output_dir):
-        """Load resumes from the resume parser output directory."""
+    def find_parsed_resumes(parser_output_dir):
+        """
+        Count the resumes in the resume parser output directory.
+        Returns (count, source): `source` is what the matcher should index.
+        """
         parser_dir = Path(parser_output_dir)
         
         if not parser_dir.exists():
             print(f"Warning: Directory {parser_output_dir} not found")
             print("Make sure to run the resume parser first to generate parsed resumes")
-            return []
-        
-        # Look for combined.json or individual resume files
-        resumes = []
+            return 0, parser_dir
         
         # Try combined.json first
         combined_file = parser_dir / "combined.json"
         if combined_file.exists():
             try:
-                with open(combined_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict) and "results" in data:
-                        resumes = data["results"]
-                    else:
-                        resumes = [data]
-                print(f"Loaded {len(resumes)} resumes from combined.json")
+                # Streamed one resume at a time (memory-mapped ijson when installed),
+                # so the corpus is never held in memory; the matcher indexes it the same way
+                count = sum(1 for _ in _iter_combined(combined_file))
+                print(f"Loaded {count} resumes from combined.json")
+                if count:
+                    return count, combined_file
             except Exception as e:
                 print(f"Error loading combined.json: {e}")
         
         # If no combined.json, look for individual files
-        if not resumes:
-            json_files = list(parser_dir.glob("*.json"))
-            json_files = [f for f in json_files if not f.name.endswith('.error.json')]
-            
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r') as f:
-                        resume_data = json.load(f)
-                        resumes.append(resume_data)
-                except Exception as e:
-                    print(f"Error loading {json_file}: {e}")
-            
-            print(f"Loaded {len(resumes)} resumes from individual files")
+        json_files = [f for f in parser_dir.glob("*.json") if not f.name.endswith('.error.json')]
+        
+        def check_one(json_file):
+            try:
+                json_loads(json_file.read_bytes())
+                return json_file.name, None
+            except Exception as e:
+                return json_file.name, e
+        
+        # File reads release the GIL, so a thread pool overlaps the I/O
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            results = list(ex.map(check_one, json_files))
+        
+        errors = [(name, err) for name, err in results if err is not None]
+        for name, err in errors:
+            print(f"Error loading {name}: {err}")
         
-        return resumes
+        count = len(results) - len(errors)
+        print(f"Loaded {count} resumes from individual files")
+        return count, parser_dir
     
-    # Load resumes from parser output
-    resumes = load_parsed_resumes("../resume_generator_parser/example_output/parsed")
+    # Find resumes in the parser output
+    resume_count, resume_source = find_parsed_resumes("../resume_generator_parser/example_output/parsed")
     
-    if not resumes:
+    if not resume_count:
         print("No resumes found. Please run the resume parser first.")
         return
     
@@ -258,10 +269,10 @@ def example_4_integration_with_resume_parser():
     matcher = SemanticMatcher()
     
     # Match against the loaded resumes
-    matches = matcher.match_candidates(job, "../resume_generator_parser/example_output/parsed", top_n=5)
+    matches = matcher.match_candidates(job, str(resume_source), top_n=5)
     
     print(f"Job: {job.title} at {job.company}")
-    print(f"Resumes loaded: {len(resumes)}")
+    print(f"Resumes loaded: {resume_count}")
     print(f"Top matches found: {len(matches)}")
     print("\nTop Matches:")
     print("-" * 30)
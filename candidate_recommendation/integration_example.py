@@ -7,7 +7,6 @@ into existing applications with minimal code changes.
 """
 
 from models import JobDescription
-from semantic_matcher import SemanticMatcher
 
 class CandidateRecommendationService:
     """
@@ -22,7 +21,9 @@ class CandidateRecommendationService:
         Args:
             model_name (str): Name of the sentence transformer model to use
         """
-        self.matcher = SemanticMatcher(sbert_model=model_name)
+        from semantic_matcher import SemanticMatcher  # deferred: importing this module stays cheap
+
+        self.matcher = SemanticMatcher.get(model_name)  # shared across service instances
     
     def find_candidates(self, job_data, resumes_path, top_n=10):
         """
@@ -0,0 +1,72 @@
+"""
+Semantic cache for near-duplicate job descriptions.
+
+Match results are stored against the job's normalized embedding. A later job
+whose embedding has cosine similarity >= threshold with a cached one (and the
+same scope: resumes index, top_n, and the job's skill terms and title tokens,
+which the ranking reads besides the embedding) reuses the cached matches
+instead of scoring the corpus again. Entries expire after a TTL and are evicted LRU-first.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import numpy as np
+
+
+class SemanticJobCache:
+    """Cosine-similarity keyed LRU/TTL cache over job embeddings."""
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256, ttl_seconds: float = 300.0):
+        self.threshold = float(threshold)
+        self.max_entries = int(max_entries)
+        self.ttl = float(ttl_seconds)
+        self._vecs: Optional[np.ndarray] = None             # (max_entries, d), one row per slot
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # slot -> (scope, value, stored_at)
+        self._free = list(range(self.max_entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self, now: float) -> None:
+        for slot in [s for s, (_, _, ts) in self._entries.items() if now - ts > self.ttl]:
+            del self._entries[slot]
+            self._free.append(slot)
+
+    def get(self, vec: np.ndarray, scope: Hashable) -> Optional[Any]:
+        """Return the value cached for the most similar job in `scope`, if similar enough."""
+        if self.max_entries <= 0 or not self._entries:
+            return None
+        self._expire(time.monotonic())
+
+        slots = [s for s, (sc, _, _) in self._entries.items() if sc == scope]
+        if not slots:
+            return None
+        sims = self._vecs[slots] @ vec
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+
+        slot = slots[best]
+        self._entries.move_to_end(slot)
+        return self._entries[slot][1]
+
+    def put(self, vec: np.ndarray, scope: Hashable, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        now = time.monotonic()
+        self._expire(now)
+        if self._vecs is None:
+            self._vecs = np.zeros((self.max_entries, vec.shape[0]), dtype=np.float32)
+        if not self._free:
+            oldest, _ = self._entries.popitem(last=False)
+            self._free.append(oldest)
+
+        slot = self._free.pop()
+        self._vecs[slot] = vec
+        self._entries[slot] = (scope, value, now)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._free = list(range(self.max_entries))
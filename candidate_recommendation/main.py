@@ -6,13 +6,12 @@ Provides a clean interface for backend integration and CLI usage.
 
 import argparse
 import logging
-import uvicorn
+import os
 from pathlib import Path
 from typing import List
 
 from config import config
 from models import JobDescription
-from semantic_matcher import SemanticMatcher
 
 # Configure logging
 logging.basicConfig(
@@ -26,12 +25,24 @@ class CandidateRecommendationProcessor:
     
     def __init__(self):
         """Initialize the processor with semantic matcher."""
+        from semantic_matcher import SemanticMatcher  # heavy (numpy, faiss, numba); not needed for --help or --api
+
         try:
-            self.matcher = SemanticMatcher(
+            self.matcher = SemanticMatcher.get(
                 sbert_model=config.sbert_model,
                 device=config.device,
                 blend_alpha=config.blend_alpha,
                 title_weight=config.title_weight,
+                cache_dir=config.embedding_cache_dir or None,
+                use_onnx=config.use_onnx,
+                quantize=config.quantize,
+                ann_min_candidates=config.ann_min_candidates,
+                ann_shortlist=config.ann_shortlist,
+                embedding_dtype=config.embedding_dtype,
+                num_threads=config.num_threads,
+                precision=config.precision,
+                jd_cache_size=config.jd_cache_size,
+                passage_pooling=config.passage_pooling,
             )
             logger.info("✅ Semantic matcher initialized successfully")
         except Exception as e:
@@ -90,25 +101,33 @@ class CandidateRecommendationProcessor:
         )
         return [software_job, data_job]
     
-    def match_candidates(self, job: JobDescription, resumes_dir: str, top_n: int = 10) -> List[dict]:
-        """Match candidates to a job and return results."""
-        logger.info(f"Matching candidates for: {job.title} at {job.company}")
-        
-        matches = self.matcher.match_candidates(job, resumes_dir, top_n=top_n)
-        
-        # Convert to dictionary format for easier handling
-        results = []
-        for match in matches:
-            results.append({
+    @staticmethod
+    def _to_dicts(matches) -> List[dict]:
+        """Convert CandidateMatch objects to dictionaries for easier handling."""
+        return [
+            {
                 "name": match.name,
                 "filename": match.filename,
                 "title": match.title,
                 "match_score": match.match_score,
                 "skills_match": match.skills_match,
                 "summary": match.summary
-            })
+            }
+            for match in matches
+        ]
+
+    def match_candidates(self, job: JobDescription, resumes_dir: str, top_n: int = 10) -> List[dict]:
+        """Match candidates to a job and return results."""
+        logger.info(f"Matching candidates for: {job.title} at {job.company}")
         
-        return results
+        matches = self.matcher.match_candidates(job, resumes_dir, top_n=top_n)
+        return self._to_dicts(matches)
+
+    def match_candidates_batch(self, jobs: List[JobDescription], resumes_dir: str, top_n: int = 10) -> List[List[dict]]:
+        """Match candidates to several jobs, loading and embedding the resumes once."""
+        logger.info(f"Matching candidates for {len(jobs)} jobs")
+
+        return [self._to_dicts(m) for m in self.matcher.match_candidates_batch(jobs, resumes_dir, top_n=top_n)]
     
     def run_cli_demo(self, resumes_dir: str, top_n: int):
         """Run the CLI demo with sample jobs."""
@@ -120,12 +139,20 @@ class CandidateRecommendationProcessor:
         print("SEMANTIC MATCHING RESULTS")
         print("=" * 60)
 
-        for job in sample_jobs:
+        try:
+            all_matches = self.match_candidates_batch(sample_jobs, resumes_dir, top_n)
+        except Exception as e:
+            # Retry job by job, so a failing job only costs its own results
+            logger.error(f"Error matching candidates in one batch, matching jobs one by one: {e}")
+            all_matches = [None] * len(sample_jobs)
+
+        for job, matches in zip(sample_jobs, all_matches):
             print(f"\n🔍 Job: {job.title} at {job.company}")
             print("-" * 50)
             
             try:
-                matches = self.match_candidates(job, resumes_dir, top_n)
+                if matches is None:
+                    matches = self.match_candidates(job, resumes_dir, top_n)
                 
                 for i, match in enumerate(matches, 1):
                     print(f"{i:2d}. {match['name']} ({match['title']})  score={match['match_score']:.3f}")
@@ -158,11 +185,18 @@ def main():
                     help="API server port (when using --api)")
     ap.add_argument("--reload", action="store_true",
                     help="Enable auto-reload for development (when using --api)")
+    ap.add_argument("--preload", action="store_true",
+                    help="Load the model and index resumes before serving (when using --api)")
     
     args = ap.parse_args()
     
     if args.api:
+        if args.preload:
+            config.preload = True
+            os.environ["CANDIDATE_PRELOAD"] = "true"  # for the server process spawned by --reload
         # Start FastAPI server
+        import uvicorn
+
         logger.info(f"Starting FastAPI server on {args.host}:{args.port}")
         uvicorn.run(
             "api:app",
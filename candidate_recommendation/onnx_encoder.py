@@ -0,0 +1,103 @@
+"""
+ONNX Runtime backend for the sentence transformer.
+
+Exports the configured Hugging Face model to ONNX once (via optimum), keeps the
+export on disk, and reproduces SentenceTransformer.encode() for mean-pooled,
+L2-normalized sentence embeddings using ONNX Runtime's CPU kernels.
+
+Requires: pip install "optimum[onnxruntime]"
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import onnxruntime as ort
+from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ONNX_CACHE_DIR = "~/.cache/candidate_recommendation/onnx"
+
+
+def _cpu_quantization_config():
+    """Dynamic INT8 config matching the host CPU: VNNI int8 GEMM kernels when available."""
+    try:
+        flags = Path("/proc/cpuinfo").read_text()
+    except OSError:  # not Linux; AVX2 is the safe common denominator
+        flags = ""
+    if "avx512_vnni" in flags:
+        return AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    if "avx512f" in flags:
+        return AutoQuantizationConfig.avx512(is_static=False, per_channel=False)
+    return AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+
+
+class OnnxEncoder:
+    """
+    Drop-in replacement for the parts of SentenceTransformer used by SemanticMatcher:
+    `encode(texts, batch_size=...)` and a `tokenizer` attribute.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: str = DEFAULT_ONNX_CACHE_DIR,
+        max_seq_length: int = 384,  # sentence-transformers default for mpnet/MiniLM models
+        quantize: bool = False,     # dynamic INT8 weights, tuned to the CPU's instruction set
+        num_threads: int = 0,       # intra-op threads (0: let ONNX Runtime decide)
+    ):
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "__", model_name)
+        export_dir = Path(cache_dir).expanduser() / slug
+
+        if not (export_dir / "model.onnx").exists():
+            logger.info(f"Exporting {model_name} to ONNX under {export_dir} (one-time)")
+            ORTModelForFeatureExtraction.from_pretrained(model_name, export=True).save_pretrained(export_dir)
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(export_dir)
+
+        file_name = "model.onnx"
+        if quantize:
+            file_name = "model_quantized.onnx"  # name written by ORTQuantizer
+            if not (export_dir / file_name).exists():
+                qconfig = _cpu_quantization_config()
+                logger.info(f"Quantizing ONNX model to INT8 under {export_dir} (one-time)")
+                quantizer = ORTQuantizer.from_pretrained(export_dir, file_name="model.onnx")
+                quantizer.quantize(save_dir=export_dir, quantization_config=qconfig)
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = num_threads
+        session_options.inter_op_num_threads = 1
+
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            export_dir,
+            file_name=file_name,
+            provider="CPUExecutionProvider",
+            session_options=session_options,
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        self.max_seq_length = max_seq_length
+
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress_bar: bool = False, **kwargs) -> np.ndarray:
+        """Return an (len(texts), d) float32 array of L2-normalized embeddings."""
+        out = []
+        for i in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[i:i + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            hidden = self.model(**inputs).last_hidden_state  # (b, t, d)
+
+            # Mean-pool over real tokens, then L2-normalize
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            out.append(pooled / (np.linalg.norm(pooled, axis=1, keepdims=True) + 1e-9))
+
+        return np.vstack(out).astype(np.float32, copy=False)
@@ -0,0 +1,87 @@
+"""
+Micro-batching of job embeddings for concurrent API requests.
+
+Each in-flight /match request submits its job and awaits a future. A single
+background task drains the queue (up to BATCH_MAX jobs or BATCH_TIMEOUT_MS of
+waiting), embeds the whole batch with one encoder call in a worker thread and
+resolves every future with its own row. The event loop never blocks on the
+model.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX = 16
+BATCH_TIMEOUT_MS = 5
+
+
+class RequestBatcher:
+    """Coalesces concurrent embedding requests into batched encoder calls."""
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[Any]], np.ndarray],
+        max_batch: int = BATCH_MAX,
+        timeout_ms: float = BATCH_TIMEOUT_MS,
+    ):
+        self.encode_fn = encode_fn
+        self.max_batch = max_batch
+        self.timeout = timeout_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop (idempotent)."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def submit(self, item: Any) -> np.ndarray:
+        """Queue one item for embedding and wait for its vector."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.timeout
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            items = [item for item, _ in batch]
+            try:
+                embeddings = await asyncio.to_thread(self.encode_fn, items)
+            except Exception as e:
+                logger.error(f"Batched encode of {len(items)} items failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), emb in zip(batch, embeddings):
+                if not future.done():  # the request may have been cancelled meanwhile
+                    future.set_result(emb)
@@ -0,0 +1,87 @@
+"""
+Fused score combination for SemanticMatcher.
+
+    final = (1 - alpha) * cosine + alpha * skills_jaccard + title_weight * title_overlap
+
+The weights are fixed for the lifetime of a matcher, so make_scorer() partially
+evaluates the formula: it generates the kernel source with the weights baked in
+as literals (terms with a zero weight are dropped altogether) and compiles it.
+When numba is installed the kernel is JIT-compiled into a single pass over
+contiguous float32 arrays; otherwise the same expression runs as in-place numpy
+operations.
+
+The kernel is deliberately not `parallel=True`: the API scores from several
+worker threads at once, which numba's default threading layer does not support
+(concurrent launches hang), and the loop is memory-bound anyway.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+# -------------------------
+# Optional dependency (JIT)
+# -------------------------
+HAVE_NUMBA = False
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except Exception:
+    HAVE_NUMBA = False
+
+Scorer = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+# Eager signature: (cos, jacc, title, out), all 1-D contiguous float32
+_KERNEL_SIGNATURE = "void(float32[::1], float32[::1], float32[::1], float32[::1])"
+
+
+def _kernel_source(alpha: float, title_weight: float) -> str:
+    terms = [f"{1.0 - alpha!r} * cos[i]"]
+    if alpha:
+        terms.append(f"{alpha!r} * jacc[i]")
+    if title_weight:
+        terms.append(f"{title_weight!r} * title[i]")
+    return (
+        "def kernel(cos, jacc, title, out):\n"
+        "    for i in range(cos.shape[0]):\n"
+        f"        out[i] = {' + '.join(terms)}\n"
+    )
+
+
+def make_scorer(alpha: float, title_weight: float) -> Scorer:
+    """
+    Return `scorer(cos, jacc, title) -> float32 scores` specialized to the given
+    weights. Compilation happens here, once, not on the first request.
+    """
+    alpha, title_weight = float(alpha), float(title_weight)
+
+    if HAVE_NUMBA:
+        namespace: dict = {}
+        exec(_kernel_source(alpha, title_weight), namespace)
+        # exec'd code has no source file, so numba's on-disk cache cannot be used
+        kernel = njit(_KERNEL_SIGNATURE, fastmath=True)(namespace["kernel"])
+
+        def scorer(cos: np.ndarray, jacc: np.ndarray, title: np.ndarray) -> np.ndarray:
+            cos = np.ascontiguousarray(cos, dtype=np.float32)
+            out = np.empty_like(cos)
+            kernel(
+                cos,
+                np.ascontiguousarray(jacc, dtype=np.float32),
+                np.ascontiguousarray(title, dtype=np.float32),
+                out,
+            )
+            return out
+
+        return scorer
+
+    w_cos, w_skill, w_title = np.float32(1.0 - alpha), np.float32(alpha), np.float32(title_weight)
+
+    def scorer(cos: np.ndarray, jacc: np.ndarray, title: np.ndarray) -> np.ndarray:
+        out = np.asarray(cos, dtype=np.float32) * w_cos
+        if w_skill:
+            out += w_skill * np.asarray(jacc, dtype=np.float32)
+        if w_title:
+            out += w_title * np.asarray(title, dtype=np.float32)
+        return out
+
+    return scorer
@@ -1,12 +1,140 @@
-import json
+import logging
+import math
+import mmap
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, FrozenSet, Iterable, Iterator, Tuple, Optional
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 from models import JobDescription, CandidateMatch
+from embedding_cache import EmbeddingCache
+from scoring import make_scorer
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Optional dependency (ANN search)
+# -------------------------
+HAVE_FAISS = False
+try:
+    import faiss
+    HAVE_FAISS = True
+except Exception:
+    HAVE_FAISS = False
+
+# -------------------------
+# Optional dependency (fast JSON); stdlib json also accepts bytes
+# -------------------------
+HAVE_ORJSON = False
+try:
+    import orjson
+    _json_loads = orjson.loads
+    HAVE_ORJSON = True
+except Exception:
+    import json
+    _json_loads = json.loads
+    HAVE_ORJSON = False
+
+# -------------------------
+# Optional dependency (streaming JSON)
+# -------------------------
+HAVE_IJSON = False
+try:
+    import ijson
+    HAVE_IJSON = True
+except Exception:
+    HAVE_IJSON = False
+
+# Above this many resumes an exact flat index gives way to HNSW
+_HNSW_MIN_CANDIDATES = 100_000
+
+# Rows of a half-precision matrix widened to float32 at a time when scoring
+_MATVEC_BLOCK = 4096
+
+# -------------------------
+# CPU thread pinning
+# -------------------------
+_threads_configured = False
+
+def _effective_cpus() -> int:
+    """CPUs this process may actually use: its affinity mask, capped by a cgroup v2 CPU quota."""
+    try:
+        n = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        n = os.cpu_count() or 1
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()[:2]
+        if quota != "max":
+            n = min(n, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return n
+
+def _configure_threads(num_threads: Optional[int]) -> int:
+    """
+    Pin torch / BLAS / OpenMP to the CPUs the container actually has, instead of
+    the host's core count. Process-wide, so it is applied once. Returns the count.
+    """
+    global _threads_configured
+    n = num_threads if num_threads and num_threads > 0 else int(os.getenv("OMP_NUM_THREADS") or _effective_cpus())
+    if _threads_configured:
+        return n
+
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ.setdefault(var, str(n))
+    try:
+        import torch
+        torch.set_num_threads(n)
+        torch.backends.mkldnn.enabled = True
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # only settable before the first inter-op parallel region
+    except Exception as e:
+        logger.warning(f"Could not pin torch threads: {e}")
+
+    logger.info(f"Using {n} CPU thread(s) for inference")
+    _threads_configured = True
+    return n
+
+# -------------------------
+# Devices
+# -------------------------
+def _resolve_device(device: Optional[str]) -> str:
+    """Map config values ('cpu', 'gpu', 'cuda[:n]', ...) to a torch device, falling back to CPU."""
+    device = (device or "cpu").lower()
+    if device == "gpu":
+        device = "cuda"
+    if device.startswith("cuda"):
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return device
+        except Exception:
+            pass
+        logger.warning(f"Device '{device}' requested but CUDA is not available, using CPU")
+        return "cpu"
+    return device
+
+def _device_matvec(M, v: np.ndarray) -> np.ndarray:
+    # M: torch fp16 matrix resident on the GPU; only v goes up and the scores come back
+    import torch
+    with torch.inference_mode():
+        return (M @ torch.from_numpy(v).to(M.device, M.dtype)).float().cpu().numpy()
+
+def _device_matmat(M, Q: np.ndarray) -> np.ndarray:
+    # batched _device_matvec: (J, d) queries against the resident matrix, (J, N) back
+    import torch
+    with torch.inference_mode():
+        return (torch.from_numpy(Q).to(M.device, M.dtype) @ M.T).float().cpu().numpy()
 
 # -------------------------
 # Text + skills utilities
@@ -16,21 +144,116 @@ the a an and or with to in of for on at by from your our you we they is are be t
 """.split())
 
 _TOKEN_RE = re.compile(r"[a-z0-9+#.\-]+")
+_TOKEN_OR_BREAK_RE = re.compile(r"[a-z0-9+#.\-]+|\n")
 
+# Skill names and titles repeat heavily across resumes, so both are memoized
+@lru_cache(maxsize=4096)
 def _norm(s: str) -> str:
     if not s:
         return ""
-    s = s.lower()
-    return re.sub(r"\s+", " ", s).strip()
+    return " ".join(s.lower().split())  # collapses and strips all whitespace
+
+@lru_cache(maxsize=4096)
+def _tokenize(s: str) -> Tuple[str, ...]:
+    return tuple(_TOKEN_RE.findall(_norm(s)))
+
+def _tokenize_many(texts: List[str]) -> List[Tuple[str, ...]]:
+    """
+    _tokenize for many strings in a single regex pass. _norm turns every newline
+    into a space, so a newline can safely separate the documents.
+    """
+    if not texts:
+        return []
+    out: List[Tuple[str, ...]] = []
+    cur: List[str] = []
+    for tok in _TOKEN_OR_BREAK_RE.findall("\n".join(_norm(t) for t in texts)):
+        if tok == "\n":
+            out.append(tuple(cur))
+            cur = []
+        else:
+            cur.append(tok)
+    out.append(tuple(cur))
+    return out
+
+def _l2_normalize(X: np.ndarray) -> np.ndarray:
+    # X: (n, d) -> rows scaled to unit length
+    return X / (np.linalg.norm(X, axis=1, keepdims=True) + 1e-9)
+
+def _matvec(M: np.ndarray, v: np.ndarray) -> np.ndarray:
+    # M @ v in float32. Half-precision matrices are upcast one cache-sized block at
+    # a time, so DRAM only ever streams the compact FP16 rows.
+    if M.dtype == np.float32:
+        return M @ v
+    out = np.empty(M.shape[0], dtype=np.float32)
+    for i in range(0, M.shape[0], _MATVEC_BLOCK):
+        out[i:i + _MATVEC_BLOCK] = M[i:i + _MATVEC_BLOCK].astype(np.float32) @ v
+    return out
+
+def _matmat(M: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    # (Q @ M.T) as a (J, N) float32 matrix, one contiguous row of scores per query:
+    # a single GEMM for J queries instead of J matvecs, with the same block upcast.
+    if M.dtype == np.float32:
+        return Q @ M.T
+    out = np.empty((Q.shape[0], M.shape[0]), dtype=np.float32)
+    for i in range(0, M.shape[0], _MATVEC_BLOCK):
+        out[:, i:i + _MATVEC_BLOCK] = Q @ M[i:i + _MATVEC_BLOCK].astype(np.float32).T
+    return out
+
+# popcount of each byte, for numpy builds without np.bitwise_count (< 2.0)
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def _popcount64(X: np.ndarray) -> np.ndarray:
+    # (n, w) uint64 -> (n,) number of set bits per row
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(X).sum(axis=1, dtype=np.int64)
+    return _POPCOUNT8[X.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+def _term_bitsets(term_sets: List[frozenset]) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+    """
+    Intern every term (resume skill, title token) to a dense id (sorted, so the
+    layout is deterministic) and pack each resume's terms into a row of uint64
+    words, so set intersection becomes bitwise AND + popcount. Also returns the
+    number of terms per resume.
+    """
+    vocab = {t: i for i, t in enumerate(sorted(set().union(*term_sets)))}
+    words = max(1, (len(vocab) + 63) // 64)
+    counts = np.fromiter((len(ts) for ts in term_sets), dtype=np.int64, count=len(term_sets))
+    rows = np.repeat(np.arange(len(term_sets)), counts)
+    ids = np.fromiter((vocab[t] for ts in term_sets for t in ts), dtype=np.int64, count=int(counts.sum()))
+    # set bits in place: a bool (N, V) staging matrix would cost N * V bytes
+    bits = np.zeros((len(term_sets), words), dtype=np.uint64)
+    np.bitwise_or.at(bits, (rows, ids >> 6), np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)))
+    return vocab, bits, counts
+
+def _query_bits(vocab: Dict[str, int], n_words: int, terms: Iterable[str]) -> np.ndarray:
+    # a query's terms in a corpus bit layout; terms outside the vocabulary are dropped
+    bits = np.zeros(n_words, dtype=np.uint64)
+    for t in terms:
+        pos = vocab.get(t)
+        if pos is not None:
+            bits[pos >> 6] |= np.uint64(1) << np.uint64(pos & 63)
+    return bits
 
-def _tokenize(s: str) -> List[str]:
-    return _TOKEN_RE.findall(_norm(s))
+def _overlap_counts(bits: np.ndarray, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+    # |row & query| for the given rows, touching only the words the query sets
+    words = np.flatnonzero(query)
+    if not words.size:
+        return np.zeros(len(rows), dtype=np.int64)
+    return _popcount64(bits[np.ix_(rows, words)] & query[words])
 
-def _cosine(A: np.ndarray, B: np.ndarray) -> np.ndarray:
-    # A: (n, d), B: (m, d) -> (n, m)
-    A = A / (np.linalg.norm(A, axis=1, keepdims=True) + 1e-9)
-    B = B / (np.linalg.norm(B, axis=1, keepdims=True) + 1e-9)
-    return A @ B.T
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    # indices of the k largest scores, best first, without sorting the tail
+    k = min(k, scores.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    n = scores.size
+    if k < n:
+        # partition at n - k instead of negating: no (N,) temporary
+        part = np.argpartition(scores, n - k)[n - k:]
+        part.sort()  # equal scores within the top k then rank by corpus position
+    else:
+        part = np.arange(n)
+    return part[np.argsort(-scores[part], kind="stable")]
 
 def _skills_from_resume_data(data: Dict[str, Any]) -> List[str]:
     skills = data.get("skills") or {}
@@ -44,6 +267,11 @@ def _skills_from_resume_data(data: Dict[str, Any]) -> List[str]:
     # normalize
     return [t for t in (_norm(x) for x in out) if t]
 
+@lru_cache(maxsize=256)
+def _skill_terms(text: str) -> Tuple[str, ...]:
+    toks = [t for t in _tokenize(text) if t not in _STOP and not t.isdigit()]
+    return tuple(sorted(set(toks)))
+
 def _skills_from_jd(job: JobDescription) -> List[str]:
     # lightweight extractor; replace with curated skill list if you have one
     text = "\n".join([
@@ -53,50 +281,99 @@ def _skills_from_jd(job: JobDescription) -> List[str]:
         "\n".join(job.requirements or []),
         "\n".join(job.preferred_skills or []),
     ])
-    toks = [t for t in _tokenize(text) if t not in _STOP and not t.isdigit()]
-    return sorted(set(toks))
+    return list(_skill_terms(text))  # memoized: the same job is often queried repeatedly
 
-def _jaccard(a: List[str], b: List[str]) -> float:
-    A, B = set(a), set(b)
-    if not A and not B:
-        return 0.0
-    return len(A & B) / max(1, len(A | B))
+def job_rank_key(job: JobDescription) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """
+    Everything ranking reads from a job besides its embedding: the skill terms
+    and the title tokens. Jobs with equal keys and near-identical embeddings
+    rank the same, so results may be shared between them (see job_cache).
+    """
+    title = frozenset(_tokenize(job.title)) if job.title else frozenset()
+    return tuple(_skills_from_jd(job)), title
 
-def _title_align(jd_title: str, cand_title: str) -> float:
-    if not jd_title or not cand_title:
-        return 0.0
-    a = set(_tokenize(jd_title))
-    b = set(_tokenize(cand_title))
-    if not a or not b:
-        return 0.0
-    return len(a & b) / max(3, len(a))
+def _job_text(job: JobDescription) -> str:
+    # composite text the JD is embedded from
+    return "\n".join([
+        job.title or "",
+        job.company or "",
+        job.description or "",
+        "Requirements:\n" + "\n".join(job.requirements or []),
+        "Preferred:\n" + "\n".join(job.preferred_skills or []),
+    ]).strip()
 
 # -------------------------
 # File loading
 # -------------------------
-def _load_resume_jsons(parsed_path: Path) -> List[Dict[str, Any]]:
+# Fields of a parsed resume that indexing and ranking read. Everything else
+# (contact details, education, long work-history text, ...) is dropped right
+# after parsing, so the long-lived ResumeIndex only holds what it uses.
+_RESUME_FIELDS = ("name", "title", "summary", "skills", "experience")
+_RECORD_FIELDS = _RESUME_FIELDS + ("data", "source_pdf", "filename")
+_SUMMARY_EXPERIENCE = 3  # experience entries folded into a surrogate summary
+
+def _project_resume(res: Any) -> Any:
+    """Keep only the ranking fields of a resume record (either schema)."""
+    if not isinstance(res, dict):
+        return res
+    out = {k: res[k] for k in _RECORD_FIELDS if k in res}
+    for rec in (out, out.get("data")):
+        if isinstance(rec, dict) and isinstance(rec.get("experience"), list):
+            rec["experience"] = rec["experience"][:_SUMMARY_EXPERIENCE]
+    if isinstance(out.get("data"), dict):
+        out["data"] = {k: out["data"][k] for k in _RESUME_FIELDS if k in out["data"]}
+    return out
+
+# Resume files are small and reading them is I/O-bound, so oversubscribe the cores
+_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _read_json(path: Path) -> Tuple[Any, Optional[Exception]]:
+    try:
+        return _project_resume(_json_loads(path.read_bytes())), None
+    except Exception as e:
+        return None, e
+
+def _iter_combined(path: Path) -> Iterator[Dict[str, Any]]:
     """
-    Accepts a directory of per-resume JSONs (e.g., llm_parsed_resumes/*.json)
-    or a single combined.json. Skips *.error.json.
+    Yield the resumes of a combined.json ({"results": [...]}) or single-resume file.
+    With ijson the file is memory-mapped and parsed incrementally, so the raw
+    bytes and the full parse tree are never resident at once.
     """
-    out: List[Dict[str, Any]] = []
+    if HAVE_IJSON and path.stat().st_size > 0:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            found = False
+            for res in ijson.items(mm, "results.item", use_float=True):
+                found = True
+                yield _project_resume(res)
+            if found:
+                return
+
+    # No "results" array (a single resume), or no ijson: parse in one go
+    data = _json_loads(path.read_bytes())
+    if isinstance(data, dict) and "results" in data:
+        yield from map(_project_resume, data["results"])
+    else:
+        yield _project_resume(data)
 
+def _load_resume_jsons(parsed_path: Path) -> Iterable[Dict[str, Any]]:
+    """
+    Accepts a directory of per-resume JSONs (e.g., llm_parsed_resumes/*.json)
+    or a single combined.json (streamed). Skips *.error.json.
+    """
     if parsed_path.is_file():
-        data = json.loads(parsed_path.read_text(encoding="utf-8"))
-        if isinstance(data, dict) and "results" in data:
-            out = data["results"]
-        else:
-            out = [data]
-        return out
+        return _iter_combined(parsed_path)
 
-    for jf in sorted(parsed_path.glob("*.json")):
-        if jf.name.endswith(".error.json") or jf.name == "combined.json":
-            continue
-        try:
-            out.append(json.loads(jf.read_text(encoding="utf-8")))
-        except Exception:
-            continue
-    return out
+    files = [
+        jf for jf in sorted(parsed_path.glob("*.json"))
+        if not jf.name.endswith(".error.json") and jf.name != "combined.json"
+    ]
+    with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as ex:
+        loaded = list(ex.map(_read_json, files))
+
+    failed = [jf.name for jf, (_, err) in zip(files, loaded) if err is not None]
+    if failed:
+        logger.warning(f"Skipped {len(failed)} unreadable resume file(s): {', '.join(failed[:10])}")
+    return [data for data, err in loaded if err is None]
 
 # -------------------------
 # Candidate text builder
@@ -121,7 +398,7 @@ def _candidate_summary_text(res: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         # fold in a bit of experience if needed
         exps = data.get("experience", [])
         if isinstance(exps, list) and exps:
-            parts.append("; ".join([f"{x.get('title','')} at {x.get('company','')}" for x in exps[:3]]))
+            parts.append("; ".join([f"{x.get('title','')} at {x.get('company','')}" for x in exps[:_SUMMARY_EXPERIENCE]]))
         sk = _skills_from_resume_data(data)
         if sk:
             parts.append("Skills: " + ", ".join(sk[:20]))
@@ -129,9 +406,88 @@ def _candidate_summary_text(res: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
 
     return summary, data
 
+def _candidate_passages(data: Dict[str, Any]) -> List[str]:
+    """
+    Split a resume into short passages (title + summary, experience, skills) that
+    each fit the encoder's window, instead of one long text that gets truncated.
+    """
+    head = ". ".join(p for p in (data.get("title") or "", data.get("summary") or "") if p)
+    exps = data.get("experience", [])
+    exp = ""
+    if isinstance(exps, list) and exps:
+        exp = "; ".join([f"{x.get('title','')} at {x.get('company','')}" for x in exps[:_SUMMARY_EXPERIENCE]])
+    sk = _skills_from_resume_data(data)
+    return [p for p in (head, exp, "Skills: " + ", ".join(sk) if sk else "") if p]
+
+# -------------------------
+# Resume index
+# -------------------------
+def _build_ann(embeddings: np.ndarray):
+    """Inner-product faiss index over normalized embeddings (cosine search)."""
+    d = embeddings.shape[1]
+    if len(embeddings) >= _HNSW_MIN_CANDIDATES:
+        ann = faiss.IndexHNSWFlat(d, 32, faiss.METRIC_INNER_PRODUCT)
+    else:
+        ann = faiss.IndexFlatIP(d)
+    ann.add(np.ascontiguousarray(embeddings, dtype=np.float32))
+    return ann
+
+def _source_signature(parsed_path: Path) -> Tuple[int, int]:
+    """
+    Cheap change detector for a resume source: (file count, newest mtime in ns).
+    The directory's own mtime is included so deletions are noticed too.
+    """
+    if not parsed_path.exists():
+        return (0, 0)
+    if parsed_path.is_file():
+        return (1, parsed_path.stat().st_mtime_ns)
+    files = list(parsed_path.glob("*.json"))
+    newest = max([parsed_path.stat().st_mtime_ns] + [f.stat().st_mtime_ns for f in files])
+    return (len(files), newest)
+
+@dataclass
+class ResumeIndex:
+    """
+    Pre-embedded resume corpus. Row i of `embeddings` (L2-normalized, float16
+    or float32) belongs to texts[i] / metas[i] / filenames[i].
+    """
+    source: str
+    embeddings: np.ndarray
+    texts: List[str]
+    metas: List[Dict[str, Any]]
+    filenames: List[str]
+    signature: Tuple[int, int] = (0, 0)
+    ann: Optional[Any] = None  # faiss index over `embeddings` for large corpora
+    device_embeddings: Optional[Any] = None  # fp16 torch copy of `embeddings` kept on the GPU
+    skill_sets: List[frozenset] = field(default_factory=list)    # normalized skills per resume
+    skill_vocab: Dict[str, int] = field(default_factory=dict)    # skill -> bit position
+    skill_bits: Optional[np.ndarray] = None    # (N, ceil(V/64)) uint64 skill bitsets
+    skill_counts: Optional[np.ndarray] = None  # (N,) number of skills per resume
+    title_vocab: Dict[str, int] = field(default_factory=dict)    # title token -> bit position
+    title_bits: Optional[np.ndarray] = None    # (N, ceil(T/64)) uint64 title token bitsets
+
+    def jd_skill_bits(self, jd_skills: List[str]) -> np.ndarray:
+        """Pack a job's skills into the same bit layout as `skill_bits` (unknown skills dropped)."""
+        return _query_bits(self.skill_vocab, self.skill_bits.shape[1], jd_skills)
+
+    def jd_title_bits(self, jd_title: Iterable[str]) -> np.ndarray:
+        """Pack a job's title tokens into the same bit layout as `title_bits`."""
+        return _query_bits(self.title_vocab, self.title_bits.shape[1], jd_title)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def is_stale(self) -> bool:
+        """True if the files under `source` changed since the index was built."""
+        return _source_signature(Path(self.source)) != self.signature
+
 # -------------------------
 # SemanticMatcher
 # -------------------------
+# Loaded matchers keyed by their constructor arguments; see SemanticMatcher.get()
+_MATCHER_CACHE: Dict[Tuple, "SemanticMatcher"] = {}
+_MATCHER_CACHE_LOCK = threading.Lock()
+
 class SemanticMatcher:
     """
     Sentence-BERT based matcher with an optional skill-blended + title score.
@@ -142,36 +498,209 @@ class SemanticMatcher:
         device: Optional[str] = None,
         blend_alpha: float = 0.25,     # weight for skills Jaccard vs embedding similarity
         title_weight: float = 0.10,    # small extra weight for title alignment
+        cache_dir: Optional[str] = None,  # persist resume embeddings here (None disables)
+        use_onnx: bool = False,        # run the encoder on ONNX Runtime (CPU only)
+        quantize: bool = False,        # dynamic INT8 quantization of Linear layers (CPU only)
+        ann_min_candidates: int = 10_000,  # use faiss retrieval from this corpus size on
+        ann_shortlist: int = 200,      # candidates retrieved by faiss before re-ranking
+        embedding_dtype: str = "float16",  # storage precision of resume embeddings
+        num_threads: Optional[int] = None,  # CPU threads for inference (None: detect)
+        precision: str = "auto",       # encoder weights: 'auto' (fp16 on CUDA, else fp32), 'fp32', 'fp16', 'bf16'
+        jd_cache_size: int = 128,      # recently embedded job texts kept in memory (0 disables)
+        passage_pooling: bool = False,  # embed resumes as mean-pooled passages instead of one summary
     ):
         self.model_name = sbert_model
-        self.model = SentenceTransformer(self.model_name, device=device or None)
+        self.num_threads = _configure_threads(num_threads)
+        self.device = _resolve_device(device)
+        self.on_gpu = self.device.startswith("cuda")
+        self.quantized = False
+        self.precision = "fp32"
+        self._inference_mode = nullcontext  # torch.inference_mode once a torch encoder is loaded
+        self.model = self._load_model(self.device, use_onnx, quantize, precision)
         self.blend_alpha = float(blend_alpha)
         self.title_weight = float(title_weight)
+        self._scorer = make_scorer(self.blend_alpha, self.title_weight)  # weights baked in
+        self.ann_min_candidates = int(ann_min_candidates)
+        self.ann_shortlist = int(ann_shortlist)
+        self.embedding_dtype = np.dtype(embedding_dtype)
+        self.passage_pooling = bool(passage_pooling)
 
-    def match_candidates(
-        self,
-        job: JobDescription,
-        parsed_resumes_dir: str,
-        top_n: int = 10,
-    ) -> List[CandidateMatch]:
+        # LRU of job text -> embedding; repeated queries for a job skip the encoder
+        self.jd_cache_size = int(jd_cache_size)
+        self._jd_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._jd_lock = threading.Lock()  # embed_jobs runs in worker threads
+
+        # INT8 / reduced-precision vectors differ slightly from FP32 ones, so they get their own cache namespace
+        variant = "qint8" if self.quantized else self.precision
+        cache_namespace = self.model_name if variant == "fp32" else f"{self.model_name}-{variant}"
+        self.cache = EmbeddingCache(cache_dir, cache_namespace, dtype=self.embedding_dtype) if cache_dir else None
+
+    @classmethod
+    def get(cls, sbert_model: str = "sentence-transformers/all-mpnet-base-v2", **kwargs) -> "SemanticMatcher":
         """
-        Rank candidates from a directory (or combined.json) against the job.
-        Returns a list[CandidateMatch] sorted by score desc.
+        Return a shared matcher for these arguments, loading the model only on first use.
+        Services constructed repeatedly (e.g. per call) should use this instead of the constructor.
+        """
+        key = (sbert_model, tuple(sorted(kwargs.items())))
+        with _MATCHER_CACHE_LOCK:  # a second caller waits instead of loading the model again
+            matcher = _MATCHER_CACHE.get(key)
+            if matcher is None:
+                matcher = _MATCHER_CACHE[key] = cls(sbert_model=sbert_model, **kwargs)
+        return matcher
+
+    def _load_model(self, device: str, use_onnx: bool, quantize: bool, precision: str = "auto"):
+        """
+        Load the encoder: ONNX Runtime when requested on CPU and available,
+        otherwise the regular SentenceTransformer. Optionally INT8-quantized,
+        or with FP16/BF16 weights (embeddings are always returned as float32).
+        """
+        on_cpu = device == "cpu"
+        if use_onnx and on_cpu:
+            try:
+                from onnx_encoder import OnnxEncoder
+                encoder = OnnxEncoder(self.model_name, quantize=quantize, num_threads=self.num_threads)
+                self.quantized = quantize
+                return encoder
+            except Exception as e:
+                logger.warning(f"ONNX Runtime backend unavailable, using PyTorch: {e}")
+
+        # Deferred so importing this module does not pull in torch/transformers
+        from sentence_transformers import SentenceTransformer
+
+        import torch
+
+        model = SentenceTransformer(self.model_name, device=device)
+        # No autograd bookkeeping at all (older sentence-transformers only use no_grad)
+        self._inference_mode = torch.inference_mode
+        if on_cpu:
+            torch.set_float32_matmul_precision("medium")  # lets oneDNN use bf16 kernels where the CPU has them
+        if quantize and on_cpu:
+            try:
+                first = model._first_module()
+                first.auto_model = torch.quantization.quantize_dynamic(
+                    first.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                self.quantized = True
+                return model
+            except Exception as e:
+                logger.warning(f"Dynamic INT8 quantization failed, using FP32 weights: {e}")
+
+        if precision == "auto":
+            precision = "fp16" if self.on_gpu else "fp32"
+        if precision == "fp16" and not self.on_gpu:
+            logger.warning("FP16 inference needs CUDA, using FP32 weights on CPU")
+            precision = "fp32"
+        if precision == "fp16":
+            model.half()  # tensor-core matmuls, half the memory traffic
+        elif precision == "bf16":
+            model.bfloat16()  # AMX / AVX512-BF16 CPUs and Ampere+ GPUs
+        elif precision != "fp32":
+            raise ValueError(f"Unknown precision '{precision}' (expected auto, fp32, fp16 or bf16)")
+        self.precision = precision
+        return model
+
+    def _encode_sorted(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Smart batching: encode texts in buckets of similar token length so each
+        batch pads to a near-uniform length, then restore the input order.
+        """
+        batch_size = batch_size or (256 if self.on_gpu else 64)
+        # One batched call into the (Rust) fast tokenizer instead of a Python loop;
+        # only the lengths are needed, so skip special tokens and tensors
+        input_ids = self.model.tokenizer(texts, add_special_tokens=False, verbose=False)["input_ids"]
+        lens = [len(ids) for ids in input_ids]
+        order = np.argsort(lens, kind="stable")
+        sorted_texts = [texts[i] for i in order]
+
+        with self._inference_mode():
+            batches = [
+                self.model.encode(
+                    sorted_texts[i:i + batch_size],
+                    batch_size=batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                )
+                for i in range(0, len(sorted_texts), batch_size)
+            ]
+        sorted_embs = np.vstack(batches).astype(np.float32, copy=False)
+
+        out = np.empty_like(sorted_embs)
+        out[order] = sorted_embs
+        return out
+
+    def _encode_candidates(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed candidate texts, going through the on-disk cache when one is configured.
+        """
+        if self.cache is None:
+            return self._encode_sorted(texts)
+        return self.cache.encode(texts, self._encode_sorted)
+
+    def _encode_passages(self, metas: List[Dict[str, Any]], fallback_texts: List[str]) -> np.ndarray:
+        """
+        Embed every candidate's passages in one smart-batched (and cached) call and
+        mean-pool them per candidate. The passages are short, so no signal is lost to
+        truncation and attention cost stays low.
+        """
+        passages = [_candidate_passages(m) or [t] for m, t in zip(metas, fallback_texts)]
+        counts = np.fromiter((len(p) for p in passages), dtype=np.int64, count=len(passages))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        flat = [p for ps in passages for p in ps]
+        embs = _l2_normalize(self._encode_candidates(flat))
+        # the mean is the sum up to a scale, which normalization removes
+        return _l2_normalize(np.add.reduceat(embs, starts, axis=0))
+
+    def encode_job_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed job-side texts in a single forward pass (one batch for all of them).
+        Returns an L2-normalized (len(texts), d) float32 array in input order; the
+        encoder normalizes, so the vectors go straight into the resume GEMV.
+        """
+        with self._inference_mode():
+            embs = self.model.encode(
+                texts,
+                batch_size=max(1, len(texts)),
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+        return np.ascontiguousarray(embs, dtype=np.float32)
+
+    def embed_jobs(self, jobs: List[JobDescription]) -> np.ndarray:
+        """
+        Embed one or more job descriptions together; row j belongs to jobs[j].
+        Recently embedded job texts come from an in-memory LRU; the rest are
+        encoded in one batch.
+        """
+        texts = [_job_text(job) for job in jobs]
+        if self.jd_cache_size <= 0:
+            return self.encode_job_texts(texts)
+
+        with self._jd_lock:
+            found = {t: self._jd_cache[t] for t in texts if t in self._jd_cache}
+            for t in found:
+                self._jd_cache.move_to_end(t)
+
+        misses = list(dict.fromkeys(t for t in texts if t not in found))  # unique, in order
+        if misses:
+            fresh = dict(zip(misses, self.encode_job_texts(misses)))
+            found.update(fresh)
+            with self._jd_lock:
+                self._jd_cache.update(fresh)
+                while len(self._jd_cache) > self.jd_cache_size:
+                    self._jd_cache.popitem(last=False)
+
+        return np.vstack([found[t] for t in texts])
+
+    def index_resumes(self, parsed_resumes_dir: str) -> ResumeIndex:
+        """
+        Load and embed every resume from a directory (or combined.json) once,
+        so that many jobs can be scored against the same corpus.
         """
         root = Path(parsed_resumes_dir)
+        signature = _source_signature(root)
         items = _load_resume_jsons(root)
-        if not items:
-            return []
-
-        # Build JD text + skills
-        jd_text = "\n".join([
-            job.title or "",
-            job.company or "",
-            job.description or "",
-            "Requirements:\n" + "\n".join(job.requirements or []),
-            "Preferred:\n" + "\n".join(job.preferred_skills or []),
-        ]).strip()
-        jd_skills = _skills_from_jd(job)
 
         # Candidate texts and metadata
         cand_texts: List[str] = []
@@ -186,40 +715,185 @@ class SemanticMatcher:
             src = res.get("source_pdf") or res.get("filename") or ""
             filenames.append(Path(src).name if src else "")
 
-        if not cand_texts:
+        if cand_texts and self.passage_pooling:
+            embeddings = self._encode_passages(metas, cand_texts)
+        elif cand_texts:
+            # Fresh rows arrive normalized; this re-normalizes rows read back from
+            # the reduced-precision cache (and entries written before normalization)
+            embeddings = _l2_normalize(self._encode_candidates(cand_texts))
+        else:
+            embeddings = np.zeros((0, 0), dtype=np.float32)
+
+        embeddings = np.ascontiguousarray(embeddings, dtype=self.embedding_dtype)
+        ann = None
+        if HAVE_FAISS and len(cand_texts) >= self.ann_min_candidates:
+            ann = _build_ann(embeddings)
+
+        device_embeddings = None
+        if self.on_gpu and len(cand_texts):
+            import torch
+            device_embeddings = torch.from_numpy(embeddings).to(self.device, dtype=torch.float16)
+
+        skill_sets = [frozenset(_skills_from_resume_data(m)) for m in metas]
+        skill_vocab, skill_bits, skill_counts = _term_bitsets(skill_sets)
+        title_vocab, title_bits, _ = _term_bitsets(
+            [frozenset(t) for t in _tokenize_many([m.get("title") or "" for m in metas])]
+        )
+
+        return ResumeIndex(
+            source=str(parsed_resumes_dir),
+            embeddings=embeddings,
+            texts=cand_texts,
+            metas=metas,
+            filenames=filenames,
+            signature=signature,
+            ann=ann,
+            device_embeddings=device_embeddings,
+            skill_sets=skill_sets,
+            skill_vocab=skill_vocab,
+            skill_bits=skill_bits,
+            skill_counts=skill_counts,
+            title_vocab=title_vocab,
+            title_bits=title_bits,
+        )
+
+    def score_against_index(
+        self,
+        job: JobDescription,
+        index: ResumeIndex,
+        top_n: int = 10,
+        jd_vec: Optional[np.ndarray] = None,
+    ) -> List[CandidateMatch]:
+        """
+        Rank the candidates of a prebuilt ResumeIndex against the job.
+        `jd_vec` may carry a precomputed job embedding (see embed_jobs).
+        Returns a list[CandidateMatch] sorted by score desc.
+        """
+        if len(index) == 0:
             return []
 
-        # Embeddings
-        jd_emb = self.model.encode([jd_text], show_progress_bar=False)
-        cand_embs = self.model.encode(cand_texts, batch_size=64, show_progress_bar=False)
+        # JD embedding
+        if jd_vec is None:
+            jd_vec = self.embed_jobs([job])[0]
 
-        # Cosine similarity
-        sims = _cosine(cand_embs, jd_emb)[:, 0]  # shape (N,)
+        # Cosine similarity: resumes are pre-normalized, so one matmul suffices.
+        # Large corpora go through the ANN index for a shortlist that is re-ranked below.
+        if index.ann is not None:
+            k = min(len(index), max(self.ann_shortlist, top_n))
+            D, I = index.ann.search(jd_vec.reshape(1, -1).astype(np.float32), k)
+            keep = I[0] >= 0
+            cand_idx, sims = I[0][keep], D[0][keep]
+        else:
+            cand_idx = np.arange(len(index))
+            if index.device_embeddings is not None:
+                sims = _device_matvec(index.device_embeddings, jd_vec)  # shape (N,)
+            else:
+                sims = _matvec(index.embeddings, jd_vec)  # shape (N,)
 
-        # Skills Jaccard + Title alignment
-        skill_sims = np.zeros(len(metas), dtype=float)
-        title_sims = np.zeros(len(metas), dtype=float)
-        for i, meta in enumerate(metas):
-            rskills = _skills_from_resume_data(meta)
-            skill_sims[i] = _jaccard(jd_skills, rskills)
-            title_sims[i] = _title_align(job.title, meta.get("title", ""))
+        return self._rank(job, index, top_n, cand_idx, sims)
+
+    def score_jobs_against_index(
+        self,
+        jobs: List[JobDescription],
+        index: ResumeIndex,
+        top_n: int = 10,
+        jd_vecs: Optional[np.ndarray] = None,
+    ) -> List[List[CandidateMatch]]:
+        """
+        Rank the candidates of a prebuilt ResumeIndex against several jobs at once.
+        The jobs are embedded in one batch and scored with a single (J, d) x (d, N)
+        product (or one batched ANN search); result j belongs to jobs[j].
+        """
+        if not jobs:
+            return []
+        if len(index) == 0:
+            return [[] for _ in jobs]
+
+        if jd_vecs is None:
+            jd_vecs = self.embed_jobs(jobs)
+        jd_vecs = np.ascontiguousarray(jd_vecs, dtype=np.float32)
+
+        if index.ann is not None:
+            k = min(len(index), max(self.ann_shortlist, top_n))
+            D, I = index.ann.search(jd_vecs, k)
+            return [
+                self._rank(job, index, top_n, I[j][I[j] >= 0], D[j][I[j] >= 0])
+                for j, job in enumerate(jobs)
+            ]
+
+        cand_idx = np.arange(len(index))
+        if index.device_embeddings is not None:
+            sims = _device_matmat(index.device_embeddings, jd_vecs)  # shape (J, N)
+        else:
+            sims = _matmat(index.embeddings, jd_vecs)  # shape (J, N)
+        return [self._rank(job, index, top_n, cand_idx, sims[j]) for j, job in enumerate(jobs)]
+
+    def _rank(
+        self,
+        job: JobDescription,
+        index: ResumeIndex,
+        top_n: int,
+        cand_idx: np.ndarray,
+        sims: np.ndarray,
+    ) -> List[CandidateMatch]:
+        """Blend cosine `sims` of the candidates `cand_idx` with skill and title overlap, keep the top_n."""
+        jd_skills = _skills_from_jd(job)
+
+        # Skills Jaccard over bitsets: |A & B| by AND + popcount, restricted to the
+        # words the JD touches; |A | B| = |A| + |B| - |A & B| (|A| counts skills no
+        # resume has, exactly like the set formulation).
+        inter = _overlap_counts(index.skill_bits, cand_idx, index.jd_skill_bits(jd_skills))
+        union = len(jd_skills) + index.skill_counts[cand_idx] - inter
+        skill_sims = np.where(union > 0, inter / np.maximum(union, 1), 0.0)
+
+        # Title alignment: shared title tokens over the same kind of bitsets
+        jd_title = frozenset(_tokenize(job.title)) if job.title else frozenset()
+        title_den = max(3, len(jd_title))
+        title_sims = (
+            _overlap_counts(index.title_bits, cand_idx, index.jd_title_bits(jd_title)) / np.float32(title_den)
+        ).astype(np.float32)
 
         # Final blended score
-        final = (1.0 - self.blend_alpha) * sims + self.blend_alpha * skill_sims + self.title_weight * title_sims
+        final = self._scorer(sims, skill_sims, title_sims)
 
-        # Package results
-        ordered_idx = np.argsort(-final)
+        # Package results; the skills list is only built for the winners
+        metas = index.metas
         results: List[CandidateMatch] = []
-        for idx in ordered_idx[:top_n]:
+        for pos in _top_k(final, top_n):
+            idx = cand_idx[pos]
             meta = metas[idx]
             results.append(
                 CandidateMatch(
                     name=meta.get("name", ""),
-                    filename=filenames[idx],
+                    filename=index.filenames[idx],
                     title=meta.get("title", ""),
-                    match_score=float(final[idx]),
-                    skills_match=sorted(set(_skills_from_resume_data(meta)))[:25],
-                    summary=meta.get("summary", cand_texts[idx]),
+                    match_score=float(final[pos]),
+                    skills_match=sorted(index.skill_sets[idx])[:25],
+                    summary=meta.get("summary", index.texts[idx]),
                 )
             )
         return results
+
+    def match_candidates(
+        self,
+        job: JobDescription,
+        parsed_resumes_dir: str,
+        top_n: int = 10,
+    ) -> List[CandidateMatch]:
+        """
+        Rank candidates from a directory (or combined.json) against the job.
+        Returns a list[CandidateMatch] sorted by score desc.
+        """
+        return self.score_against_index(job, self.index_resumes(parsed_resumes_dir), top_n=top_n)
+
+    def match_candidates_batch(
+        self,
+        jobs: List[JobDescription],
+        parsed_resumes_dir: str,
+        top_n: int = 10,
+    ) -> List[List[CandidateMatch]]:
+        """
+        Rank candidates from a directory (or combined.json) against several jobs.
+        Resumes are loaded and embedded once; result j belongs to jobs[j].
+        """
+        return self.score_jobs_against_index(jobs, self.index_resumes(parsed_resumes_dir), top_n=top_n)
@@ -2,18 +2,32 @@
 Simple API interface for the resume parser and summarizer.
 Provides HTTP endpoints for backend integration.
 """
-import json
+import asyncio
+import codecs
+import hashlib
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from collections import OrderedDict, deque
+from functools import lru_cache
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from models import ResumeStruct, ParsedResume, SummaryRequest
-from resume_parser import get_parser
+from config import config
+from models import ResumeStruct, ParsedResume, SummaryRequest, json_bytes
+from resume_parser import get_parser, parse_text
 from llm_summarizer import get_summarizer
 from resume_generator import generate_resumes
 
@@ -21,16 +35,156 @@ from resume_generator import generate_resumes
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class BytesJSONResponse(JSONResponse):
+    """JSONResponse rendered with `json_bytes` (orjson when installed)."""
+
+    def render(self, content) -> bytes:
+        return json_bytes(content, indent=False)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Resume Parser API",
     description="API for parsing resumes and generating LLM-powered summaries",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=BytesJSONResponse,
 )
 
+# Parsed resumes and summaries are verbose, highly compressible JSON
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize components
 parser = get_parser()
-summarizer = get_summarizer()
+# Started as `python api.py`, this file is re-run as "__mp_main__" in each parse-pool
+# (and uvicorn worker) process; only the importable `api` module serves, so the
+# summarizer (cache load, model warm-up) is not created there.
+summarizer = get_summarizer() if __name__ != "__mp_main__" else None
+
+# Model reported for each provider; config is immutable, so this is built once
+_PROVIDER_MODEL = MappingProxyType({
+    "groq": config.groq_model,
+    "local": config.local_model_path or "local",
+    "llamacpp": config.llamacpp_model_path or "llamacpp",
+})
+
+def _model_for(provider: str) -> str:
+    return _PROVIDER_MODEL.get(provider, "unknown")
+
+# /providers payload per provider; only "available" (and "model", shown when available) vary per request
+_PROVIDER_TEMPLATE = MappingProxyType({
+    name: ({"provider": name, "available": True, "model": model},
+           {"provider": name, "available": False, "model": None})
+    for name, model in _PROVIDER_MODEL.items()
+})
+
+# Parsing is CPU-bound, so /parse-batch fans it out over processes (created on first use)
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # Not fork: this process runs threads (model warm-up, LLM calls) whose locks a
+        # forked child could inherit held. Workers fork from a forkserver that has
+        # only imported the main script (without a summarizer, see above) and the parser.
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload(["__main__", "resume_parser"])
+        else:
+            context = multiprocessing.get_context("spawn")
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+    return _PARSE_POOL
+
+@app.on_event("shutdown")
+async def _shutdown_parse_pool():
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(cancel_futures=True)
+
+# Parsed resumes by content hash, so re-uploads and batch re-runs skip parsing (LRU, bounded)
+_PARSE_CACHE: "OrderedDict[bytes, ResumeStruct]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+def _content_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+def _parse_cache_get(key: bytes) -> Optional[ResumeStruct]:
+    with _PARSE_CACHE_LOCK:
+        resume_data = _PARSE_CACHE.get(key)
+        if resume_data is not None:
+            _PARSE_CACHE.move_to_end(key)
+        return resume_data
+
+def _parse_cache_put(key: bytes, resume_data: ResumeStruct) -> None:
+    if config.parse_cache_size <= 0:
+        return
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = resume_data
+        _PARSE_CACHE.move_to_end(key)
+        while len(_PARSE_CACHE) > config.parse_cache_size:
+            _PARSE_CACHE.popitem(last=False)
+
+def _parse_cached(text: str) -> ResumeStruct:
+    """Parse resume text, reusing the result for content seen before (results are shared, not copied)."""
+    key = _content_key(text)
+    resume_data = _parse_cache_get(key)
+    if resume_data is None:
+        resume_data = parser.parse_markdown(text)
+        _parse_cache_put(key, resume_data)
+    return resume_data
+
+async def _read_and_parse_cached(pool: ProcessPoolExecutor, file_path: Path) -> Tuple[str, ResumeStruct]:
+    """Read a resume file and parse it in `pool`, unless the same content was parsed before."""
+    content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
+    key = _content_key(content)
+    resume_data = _parse_cache_get(key)
+    if resume_data is None:
+        resume_data = await asyncio.get_running_loop().run_in_executor(pool, parse_text, content)
+        _parse_cache_put(key, resume_data)
+    return content, resume_data
+
+@lru_cache(maxsize=256)
+def _split_focus(focus_areas: str) -> Tuple[str, ...]:
+    # the same comma-separated focus string tends to be sent over and over
+    return tuple(a for a in (x.strip() for x in focus_areas.split(",")) if a)
+
+# Uploads are read (and decoded) in chunks of this size
+_UPLOAD_CHUNK = 1 << 16
+
+async def _read_upload_text(file: UploadFile) -> str:
+    """Decode an uploaded file as UTF-8 chunk by chunk, rejecting it once it exceeds the size limit."""
+    max_bytes = int(config.max_upload_mb * 1024 * 1024)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts = []
+    size = 0
+    while chunk := await file.read(_UPLOAD_CHUNK):
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail=f"File exceeds the {config.max_upload_mb:g} MB upload limit")
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+def _iter_markdown_files(root: Path) -> Iterator[Path]:
+    """
+    Yield the *.md files directly under `root` (like glob("*.md")). scandir reports
+    the entry type from the directory listing, so regular files need no stat.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file():
+                yield Path(entry.path)
+
+def _write_combined(path: Path, header: Dict, results: List[Dict]) -> None:
+    """
+    Write {**header, "results": results} as compact JSON, one result at a time,
+    so the whole document is never built as a single string.
+    """
+    with path.open("wb") as f:
+        f.write(json_bytes(header, indent=False)[:-1])
+        f.write(b',"results":[')
+        for i, result in enumerate(results):
+            if i:
+                f.write(b",")
+            f.write(json_bytes(result, indent=False))
+        f.write(b"]}")
 
 # Request/Response models
 class ParseRequest(BaseModel):
@@ -56,10 +210,42 @@ class GenerateRequest(BaseModel):
     count: int = 10
     make_pdf: bool = False
 
-class ProviderInfo(BaseModel):
-    provider: str
-    available: bool
-    model: Optional[str] = None
+def _parsed_resume(filename: str, resume_data: ResumeStruct, summary: str, provider: str, model) -> ParsedResume:
+    """ParsedResume stamped with the current time (a plain dataclass, so nothing is re-validated)."""
+    return ParsedResume(
+        filename=filename,
+        parsed_at=datetime.utcnow(),
+        data=resume_data,
+        summary=summary,
+        llm_provider=provider,
+        llm_model=str(model)
+    )
+
+def _error_response(start_ns: int, e: Exception) -> ParseResponse:
+    """Failed ParseResponse for a request that started at `start_ns` (perf_counter_ns)."""
+    return ParseResponse(
+        success=False,
+        error=str(e),
+        processing_time=(time.perf_counter_ns() - start_ns) / 1e9
+    )
+
+def _summarize(
+    resume_data: ResumeStruct,
+    max_length: int,
+    tone: str,
+    focus_areas: Optional[List[str]],
+) -> Tuple[str, str, str]:
+    """
+    Summarize a parsed resume (the summarizer reuses cached summaries and
+    fails over to another provider if needed). Returns (summary, llm_provider, llm_model).
+    """
+    summary, llm_provider = summarizer.summarize_with_provider(SummaryRequest(
+        resume_data=resume_data,
+        max_length=max_length,
+        tone=tone,
+        focus_areas=focus_areas
+    ))
+    return summary, llm_provider, _model_for(llm_provider)
 
 @app.get("/")
 async def root():
@@ -73,6 +259,8 @@ async def root():
             "/parse-batch": "Parse multiple resume files from a directory",
             "/generate": "Generate synthetic resumes for testing",
             "/providers": "Get available LLM providers",
+            "/cache/stats": "Summary cache statistics",
+            "/cache/clear": "Clear the summary cache",
             "/health": "Health check endpoint"
         }
     }
@@ -82,70 +270,44 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
-@app.get("/providers", response_model=List[ProviderInfo])
+@app.get("/providers")
 async def get_providers():
     """Get available LLM providers and their status."""
     available = summarizer.get_available_providers()
-    providers = []
-    
-    for name, status in available.items():
-        if name == "groq" and status:
-            model = config.groq_model
-        elif name == "local" and status:
-            model = config.local_model_path or "local"
-        else:
-            model = None
-            
-        provider_info = ProviderInfo(
-            provider=name,
-            available=status,
-            model=model
-        )
-        providers.append(provider_info)
-    
-    return providers
+    return [
+        _PROVIDER_TEMPLATE[name][0 if status else 1] if name in _PROVIDER_TEMPLATE
+        else {"provider": name, "available": status, "model": None}
+        for name, status in available.items()
+    ]
 
 @app.post("/parse", response_model=ParseResponse)
 async def parse_resume(request: ParseRequest):
     """Parse a resume from text content and generate summary."""
-    start_time = datetime.utcnow()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Set LLM provider if specified
         if hasattr(request, 'llm_provider') and request.llm_provider:
             summarizer.set_provider(request.llm_provider)
         
-        # Parse the resume content
-        resume_data = parser.parse_markdown(request.content)
+        # Parse the resume content (CPU-bound work and the LLM call run in worker threads)
+        resume_data = await asyncio.to_thread(_parse_cached, request.content)
         
-        # Generate summary
-        summary = summarizer.summarize_resume(
+        # Generate summary (or reuse a cached one)
+        summary, llm_provider, llm_model = await asyncio.to_thread(
+            _summarize,
             resume_data,
             max_length=request.max_length,
             tone=request.tone,
             focus_areas=request.focus_areas
         )
         
-        # Get provider info
-        llm_provider = summarizer.get_current_provider_name()
-        if llm_provider == "groq":
-            llm_model = config.groq_model
-        elif llm_provider == "local":
-            llm_model = config.local_model_path or "local"
-        else:
-            llm_model = "unknown"
-        
         # Create response
-        parsed_resume = ParsedResume(
-            filename=request.filename or "uploaded_resume",
-            parsed_at=datetime.utcnow(),
-            data=resume_data,
-            summary=summary,
-            llm_provider=llm_provider,
-            llm_model=str(llm_model)
+        parsed_resume = _parsed_resume(
+            request.filename or "uploaded_resume", resume_data, summary, llm_provider, llm_model
         )
         
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         return ParseResponse(
             success=True,
@@ -154,14 +316,8 @@ async def parse_resume(request: ParseRequest):
         )
         
     except Exception as e:
-        logger.error(f"Error parsing resume: {e}")
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
-        
-        return ParseResponse(
-            success=False,
-            error=str(e),
-            processing_time=processing_time
-        )
+        logger.exception("Error parsing resume")
+        return _error_response(start_ns, e)
 
 @app.post("/parse-file", response_model=ParseResponse)
 async def parse_resume_file(
@@ -172,53 +328,35 @@ async def parse_resume_file(
     llm_provider: Optional[str] = Form(None)
 ):
     """Parse a resume from uploaded file and generate summary."""
-    start_time = datetime.utcnow()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Read file content
-        content = await file.read()
-        text_content = content.decode('utf-8')
+        text_content = await _read_upload_text(file)
         
         # Parse focus areas if provided
-        focus_list = None
-        if focus_areas:
-            focus_list = [area.strip() for area in focus_areas.split(',') if area.strip()]
+        focus_list = list(_split_focus(focus_areas)) if focus_areas else None
         
         # Set LLM provider if specified
         if llm_provider:
             summarizer.set_provider(llm_provider)
         
-        # Parse the resume
-        resume_data = parser.parse_markdown(text_content)
+        # Parse the resume (CPU-bound: keep the event loop free for other uploads)
+        resume_data = await asyncio.to_thread(_parse_cached, text_content)
         
-        # Generate summary
-        summary = summarizer.summarize_resume(
+        # Generate summary (or reuse a cached one)
+        summary, llm_provider_name, llm_model = await asyncio.to_thread(
+            _summarize,
             resume_data,
             max_length=max_length,
             tone=tone,
             focus_areas=focus_list
         )
         
-        # Get provider info
-        llm_provider_name = summarizer.get_current_provider_name()
-        if llm_provider_name == "groq":
-            llm_model = config.groq_model
-        elif llm_provider_name == "local":
-            llm_model = config.local_model_path or "local"
-        else:
-            llm_model = "unknown"
-        
         # Create response
-        parsed_resume = ParsedResume(
-            filename=file.filename,
-            parsed_at=datetime.utcnow(),
-            data=resume_data,
-            summary=summary,
-            llm_provider=llm_provider_name,
-            llm_model=str(llm_model)
-        )
+        parsed_resume = _parsed_resume(file.filename, resume_data, summary, llm_provider_name, llm_model)
         
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         return ParseResponse(
             success=True,
@@ -226,15 +364,11 @@ async def parse_resume_file(
             processing_time=processing_time
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error parsing file: {e}")
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
-        
-        return ParseResponse(
-            success=False,
-            error=str(e),
-            processing_time=processing_time
-        )
+        logger.exception("Error parsing file")
+        return _error_response(start_ns, e)
 
 @app.post("/parse-batch")
 async def parse_batch(
@@ -247,7 +381,7 @@ async def parse_batch(
         input_path = Path(input_dir)
         output_path = Path(output_dir)
         
-        if not input_path.exists():
+        if not input_path.is_dir():
             raise HTTPException(status_code=400, detail=f"Input directory does not exist: {input_dir}")
         
         # Set LLM provider if specified
@@ -255,67 +389,71 @@ async def parse_batch(
             summarizer.set_provider(request.llm_provider)
         
         # Find markdown files
-        files = list(input_path.glob("*.md"))
+        files = list(_iter_markdown_files(input_path))
         if not files:
             raise HTTPException(status_code=400, detail=f"No markdown files found in {input_dir}")
         
+        # Parse all files in parallel across processes (content parsed before is reused)
+        pool = _get_parse_pool()
+        parsed = await asyncio.gather(
+            *[_read_and_parse_cached(pool, file_path) for file_path in files],
+            return_exceptions=True
+        )
+        
+        # Summarize all parsed resumes at once (cached ones are reused; the summarizer
+        # keeps at most config.llm_concurrency requests in flight)
+        parsed_files = []
+        for file_path, item in zip(files, parsed):
+            if isinstance(item, BaseException):
+                logger.error(f"Failed to process {file_path.name}: {item}")
+            else:
+                parsed_files.append((file_path, item[1]))
+        outcomes = await summarizer.summarize_many_async([
+            SummaryRequest(
+                resume_data=resume_data,
+                max_length=request.max_length,
+                tone=request.tone,
+                focus_areas=request.focus_areas
+            )
+            for _, resume_data in parsed_files
+        ])
+        
         results = []
-        for file_path in files:
-            try:
-                # Parse file
-                resume_data = parser.parse_file(file_path)
-                
-                # Generate summary
-                summary = summarizer.summarize_resume(
-                    resume_data,
-                    max_length=request.max_length,
-                    tone=request.tone,
-                    focus_areas=request.focus_areas
-                )
-                
-                # Get provider info
-                llm_provider = summarizer.get_current_provider_name()
-                if llm_provider == "groq":
-                    llm_model = config.groq_model
-                elif llm_provider == "local":
-                    llm_model = config.local_model_path or "local"
-                else:
-                    llm_model = "unknown"
-                
-                # Create result
-                parsed_resume = ParsedResume(
-                    filename=file_path.name,
-                    parsed_at=datetime.utcnow(),
-                    data=resume_data,
-                    summary=summary,
-                    llm_provider=llm_provider,
-                    llm_model=str(llm_model)
-                )
-                
-                results.append(parsed_resume)
-                
-            except Exception as e:
-                logger.error(f"Failed to process {file_path.name}: {e}")
+        for (file_path, resume_data), outcome in zip(parsed_files, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to process {file_path.name}: {outcome}")
+            else:
+                summary, llm_provider = outcome
+                results.append(_parsed_resume(
+                    file_path.name, resume_data, summary, llm_provider, _model_for(llm_provider)
+                ))
         
         # Save results
         output_path.mkdir(parents=True, exist_ok=True)
         
+        # Each result is converted to a dict once, for both its own file and the combined one
+        result_dicts = [result.to_dict() for result in results]
+        
         # Save individual results
-        for result in results:
-            output_file = output_path / f"{Path(result.filename).stem}.json"
-            output_file.write_text(result.to_json(), encoding="utf-8")
+        await asyncio.gather(*[
+            asyncio.to_thread(
+                (output_path / f"{Path(result.filename).stem}.json").write_bytes,
+                json_bytes(result_dict)
+            )
+            for result, result_dict in zip(results, result_dicts)
+        ])
         
         # Save combined results
-        combined_file = output_path / "combined_results.json"
-        combined_data = {
+        combined_header = {
             "processed_at": datetime.utcnow().isoformat() + "Z",
             "total_files": len(files),
             "successful_parses": len(results),
             "llm_provider": results[0].llm_provider if results else "unknown",
             "llm_model": results[0].llm_model if results else "unknown",
-            "results": [r.to_dict() for r in results]
         }
-        combined_file.write_text(json.dumps(combined_data, indent=2), encoding="utf-8")
+        await asyncio.to_thread(
+            _write_combined, output_path / "combined_results.json", combined_header, result_dicts
+        )
         
         return {
             "success": True,
@@ -325,19 +463,36 @@ async def parse_batch(
             "message": f"Processed {len(results)} out of {len(files)} files"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in batch processing: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# /generate output directories; the oldest are deleted once more than this many exist
+_GENERATED_DIRS_KEPT = 16
+_GENERATED_DIRS: "deque[Path]" = deque()
+_GENERATED_DIRS_LOCK = threading.Lock()
+
+def _track_generated_dir(path: Path) -> None:
+    with _GENERATED_DIRS_LOCK:
+        _GENERATED_DIRS.append(path)
+        expired = [_GENERATED_DIRS.popleft() for _ in range(len(_GENERATED_DIRS) - _GENERATED_DIRS_KEPT)]
+    for old in expired:
+        shutil.rmtree(old, ignore_errors=True)
+
 @app.post("/generate")
 async def generate_synthetic_resumes(request: GenerateRequest):
     """Generate synthetic resumes for testing."""
     try:
-        output_dir = Path("/tmp/synthetic_resumes")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # A fresh directory per request, so concurrent calls never overwrite each other
+        output_dir = Path(tempfile.mkdtemp(prefix="synthetic_resumes_"))
+        _track_generated_dir(output_dir)
         
-        # Generate resumes
-        resumes = generate_resumes(output_dir, request.count, request.make_pdf)
+        # Generate resumes (file and PDF writing would otherwise block the event loop);
+        # PDFs render in the parse pool, whose workers are not forked from this process
+        pool = _get_parse_pool() if request.make_pdf else None
+        resumes = await asyncio.to_thread(generate_resumes, output_dir, request.count, request.make_pdf, pool)
         
         return {
             "success": True,
@@ -351,6 +506,17 @@ async def generate_synthetic_resumes(request: GenerateRequest):
         logger.error(f"Error generating resumes: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Summary cache statistics."""
+    return summarizer.cache.stats()
+
+@app.post("/cache/clear")
+async def cache_clear():
+    """Drop all cached summaries."""
+    summarizer.cache.clear()
+    return {"success": True, "message": "Summary cache cleared"}
+
 @app.post("/set-provider")
 async def set_llm_provider(provider: str):
     """Set the LLM provider for summarization."""
@@ -366,4 +532,5 @@ async def set_llm_provider(provider: str):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Each worker process loads its own summarizer (and local model, if used)
+    uvicorn.run("api:app", host="0.0.0.0", port=8000, workers=config.api_workers)
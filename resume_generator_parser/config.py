@@ -2,7 +2,7 @@
 Configuration file for the resume parser and summarizer system.
 
 This module manages all configuration settings for the system, including:
-- LLM provider selection (Groq API vs Local models)
+- LLM provider selection (Groq API vs Local models vs llama.cpp GGUF models)
 - API keys and authentication
 - Model parameters and settings
 - Device configuration for local models
@@ -12,46 +12,115 @@ Environment variables can be set in a .env file or directly in the shell.
 """
 
 import os
-from typing import Optional
+from typing import NamedTuple, Optional, Tuple
 
-class LLMConfig:
+class LLMConfig(NamedTuple):
     """
-    Configuration class for LLM providers and settings.
+    Configuration for LLM providers and settings.
     
     This class centralizes all configuration options and provides
     a clean interface for accessing settings throughout the system.
+    Values are read from the environment once, at import (see `load_config`),
+    and are immutable afterwards.
     """
     
-    def __init__(self):
-        """
-        Initialize configuration with values from environment variables.
-        
-        Sets sensible defaults for all configuration options and
-        allows override through environment variables.
-        """
-        # LLM Provider selection
-        # Controls which LLM service to use: 'groq' for cloud API, 'local' for local models
-        self.provider = os.getenv("RESUME_PROVIDER", "groq")
-        
-        # Groq API Configuration
-        # These settings control the Groq cloud-based LLM service
-        self.groq_api_key = os.getenv("GROQ_API_KEY")  # Required for Groq API access
-        self.groq_model = os.getenv("RESUME_GROQ_MODEL", "llama3-8b-8192")  # Model to use
-        self.groq_max_tokens = int(os.getenv("RESUME_GROQ_MAX_TOKENS", "500"))  # Max output length
-        self.groq_temperature = float(os.getenv("RESUME_GROQ_TEMPERATURE", "0.3"))  # Creativity level (0.0-1.0)
-        
-        # Local/Open Source Model Configuration
-        # These settings control local model inference
-        self.local_model_path = os.getenv("RESUME_LOCAL_MODEL_PATH", "Qwen/Qwen2.5-7B-Instruct")  # Model path/name
-        self.local_device = os.getenv("RESUME_LOCAL_DEVICE", "gpu")  # Device: 'gpu' or 'cpu'
-        self.local_max_tokens = int(os.getenv("RESUME_LOCAL_MAX_TOKENS", "500"))  # Max output length
-        self.local_temperature = float(os.getenv("RESUME_LOCAL_TEMPERATURE", "0.3"))  # Creativity level (0.0-1.0)
+    # LLM Provider selection
+    # Controls which LLM service to use: 'groq' for cloud API, 'local' for local models
+    provider: str
+    
+    # Groq API Configuration
+    # These settings control the Groq cloud-based LLM service
+    groq_api_key: Optional[str]  # Required for Groq API access
+    groq_model: str              # Model to use
+    groq_max_tokens: int         # Max output length
+    groq_temperature: float      # Creativity level (0.0-1.0)
+    
+    # Local/Open Source Model Configuration
+    # These settings control local model inference
+    local_model_path: str        # Model path/name
+    local_device: str            # Device: 'gpu' or 'cpu'
+    local_max_tokens: int        # Max output length
+    local_temperature: float     # Creativity level (0.0-1.0)
+    local_dtype: str             # 'auto' (fp16 on GPU, bf16 on CPUs with native bf16, else fp32) or a torch dtype name
+    local_compile: bool          # torch.compile the model's forward pass (opt-in, experimental)
+    local_threads: int           # CPU threads for inference (0: torch default)
+    local_quantization: str      # '' (unquantized), 'int8' or 'int4' (bitsandbytes, GPU only)
+    warmup: bool                 # Load the selected provider's model in the background at startup
+    
+    # Failover
+    failover_providers: Tuple[str, ...]  # Fallbacks that may be loaded on demand (and are warmed up); others only once loaded
+    
+    # llama.cpp Configuration
+    # Quantized GGUF models for CPU inference (needs llama-cpp-python)
+    llamacpp_model_path: str     # GGUF file ("" disables the provider)
+    llamacpp_ctx: int            # Context window in tokens (prompt + summary)
+    
+    # API Server
+    api_workers: int             # Worker processes for `python api.py`
+    
+    # API Uploads
+    max_upload_mb: float         # Larger /parse-file uploads are rejected (413)
+    
+    # API Batch Processing
+    llm_concurrency: int         # Concurrent summarization calls in /parse-batch
+    
+    # Parse Cache
+    parse_cache_size: int        # Parsed resumes kept by content hash (0 disables)
+    
+    # Summary Cache
+    # Reuses summaries for resubmitted (or near-identical) resumes instead of calling the LLM again
+    cache_sim_threshold: Optional[float]  # Min cosine similarity for a near-duplicate hit (None: exact matches only)
+    cache_size: int              # Max cached summaries (0 disables)
+    cache_ttl: float             # Seconds before an entry expires
+    cache_embed_model: str       # Needs sentence-transformers
+    cache_path: str              # Pickle file the cache is saved to / loaded from ("" = memory only)
+
+def load_config() -> LLMConfig:
+    """
+    Build the configuration from environment variables.
+    
+    Sets sensible defaults for all configuration options and
+    allows override through environment variables.
+    """
+    env = os.environ.get
+    return LLMConfig(
+        provider=env("RESUME_PROVIDER", "groq"),
+        
+        groq_api_key=env("GROQ_API_KEY"),
+        groq_model=env("RESUME_GROQ_MODEL", "llama3-8b-8192"),
+        groq_max_tokens=int(env("RESUME_GROQ_MAX_TOKENS", "500")),
+        groq_temperature=float(env("RESUME_GROQ_TEMPERATURE", "0.3")),
+        
+        local_model_path=env("RESUME_LOCAL_MODEL_PATH", "Qwen/Qwen2.5-7B-Instruct"),
+        local_device=env("RESUME_LOCAL_DEVICE", "gpu"),
+        local_max_tokens=int(env("RESUME_LOCAL_MAX_TOKENS", "500")),
+        local_temperature=float(env("RESUME_LOCAL_TEMPERATURE", "0.3")),
+        local_dtype=env("RESUME_LOCAL_DTYPE", "auto"),
+        local_compile=env("RESUME_LOCAL_COMPILE", "0") == "1",
+        local_threads=int(env("RESUME_LOCAL_THREADS", "0")),
+        local_quantization=env("RESUME_LOCAL_QUANTIZATION", ""),
+        warmup=env("RESUME_WARMUP", "1") == "1",
+        
+        failover_providers=tuple(p.strip() for p in env("RESUME_FAILOVER_PROVIDERS", "").split(",") if p.strip()),
+        
+        llamacpp_model_path=env("RESUME_LLAMACPP_MODEL_PATH", ""),
+        llamacpp_ctx=int(env("RESUME_LLAMACPP_CTX", "4096")),
+        
+        api_workers=int(env("RESUME_API_WORKERS", "1")),
+        
+        max_upload_mb=float(env("RESUME_MAX_UPLOAD_MB", "8")),
+        
+        llm_concurrency=int(env("RESUME_LLM_CONCURRENCY", "8")),
+        
+        parse_cache_size=int(env("RESUME_PARSE_CACHE_SIZE", "4096")),
+        
+        cache_sim_threshold=float(env("RESUME_CACHE_SIM_THRESHOLD")) if env("RESUME_CACHE_SIM_THRESHOLD") else None,
+        cache_size=int(env("RESUME_CACHE_SIZE", "512")),
+        cache_ttl=float(env("RESUME_CACHE_TTL", "3600")),
+        cache_embed_model=env("RESUME_CACHE_EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2"),
+        cache_path=env("RESUME_CACHE_PATH", ""),
+    )
 
 # Create global configuration instance
 # This instance is imported throughout the system to access configuration
-config = LLMConfig()
-
-# Ensure API keys are properly loaded from environment
-# This handles cases where environment variables might be set after import
-if not config.groq_api_key:
-    config.groq_api_key = os.getenv("GROQ_API_KEY")
+config = load_config()
@@ -17,13 +17,18 @@ Usage:
 
 import os
 import re
+import string
+import sys
 import json
+import itertools
 import random
 import argparse
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache, partial
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 # -------------------------------
 # Optional dependency (PDF)
@@ -37,10 +42,23 @@ try:
 except Exception:
     HAVE_REPORTLAB = False
 
+# -------------------------------
+# Optional dependency (fast JSON)
+# -------------------------------
+HAVE_ORJSON = False
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 # -------------------------------
 # Data models
 # -------------------------------
-@dataclass
+# Thousands of these are created in bulk runs; slots drop the per-instance __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Education:
     institution: str
     degree: str
@@ -49,7 +67,7 @@ class Education:
     gpa: Optional[float] = None
     location: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class Experience:
     company: str
     title: str
@@ -58,7 +76,7 @@ class Experience:
     location: str
     highlights: List[str]
 
-@dataclass
+@dataclass(**_SLOTS)
 class ResumeStruct:
     name: str
     title: str
@@ -117,11 +135,14 @@ SKILL_GROUPS = {
 }
 
 MONTHS = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
+INSTITUTIONS = ["State University", "Tech University", "City College", "Institute of Technology"]
+EXP_CITIES = [city for city, _ in CITIES_ST]
+EXP_STATES = [st for _, st in CITIES_ST]
+PHONE_PREFIXES = range(200, 1000)
 
 def rand_phone() -> str:
     # US-ish
-    a = random.randint(200, 999)
-    b = random.randint(200, 999)
+    a, b = random.choices(PHONE_PREFIXES, k=2)  # one call for both prefixes
     c = random.randint(1000, 9999)
     return f"({a}) {b}-{c}"
 
@@ -140,26 +161,45 @@ def rand_year_range() -> (str, str):
         end = f"{random.choice(MONTHS)} {end_year}"
     return start, end
 
-def make_highlight() -> str:
-    return random.choice(HIGHLIGHT_TEMPLATES).format(
-        thing=random.choice(["a microservice", "a data pipeline", "a CI/CD system", "an internal SDK", "a real-time API"]),
-        tech=random.choice(["Python", "Go", "TypeScript", "Kubernetes", "AWS", "PostgreSQL"]),
-        metric=random.choice(["latency", "cost", "CPU usage", "error rate", "MTTR"]),
-        percent=random.choice([15, 20, 25, 30, 40]),
-        count=random.randint(3, 8),
-        project=random.choice(["a payments module", "recommendation engine", "feature store", "ETL replatform"]),
-        approach=random.choice(["caching", "asynchronous processing", "schema optimization", "observability tooling"]),
-        component=random.choice(["auth gateway", "ingestion pipeline", "model serving layer", "monitoring stack"]),
-        system=random.choice(["monolith", "cron farm", "VM cluster"]),
-        cloud=random.choice(["AWS", "GCP", "Azure"])
+HIGHLIGHT_VALUES = {
+    "thing": ["a microservice", "a data pipeline", "a CI/CD system", "an internal SDK", "a real-time API"],
+    "tech": ["Python", "Go", "TypeScript", "Kubernetes", "AWS", "PostgreSQL"],
+    "metric": ["latency", "cost", "CPU usage", "error rate", "MTTR"],
+    "percent": [15, 20, 25, 30, 40],
+    "count": range(3, 9),
+    "project": ["a payments module", "recommendation engine", "feature store", "ETL replatform"],
+    "approach": ["caching", "asynchronous processing", "schema optimization", "observability tooling"],
+    "component": ["auth gateway", "ingestion pipeline", "model serving layer", "monitoring stack"],
+    "system": ["monolith", "cron farm", "VM cluster"],
+    "cloud": ["AWS", "GCP", "Azure"],
+}
+def _compile_highlight(template: str):
+    """Parse a template once into (bound positional str.format, value pool per placeholder)."""
+    chunks = list(string.Formatter().parse(template))
+    fields = list(dict.fromkeys(f for _, f, _, _ in chunks if f))
+    positional = "".join(
+        lit.replace("{", "{{").replace("}", "}}") + (f"{{{fields.index(f)}}}" if f else "")
+        for lit, f, _, _ in chunks
     )
+    return positional.format, tuple(HIGHLIGHT_VALUES[f] for f in fields)
+
+# Only the placeholders a template uses are drawn, and no kwargs dict is built per call
+HIGHLIGHT_FORMATS = [_compile_highlight(t) for t in HIGHLIGHT_TEMPLATES]
+
+def make_highlight() -> str:
+    fmt, pools = random.choice(HIGHLIGHT_FORMATS)
+    return fmt(*[random.choice(pool) for pool in pools])
+
+# Per group: sample size range 3..min(5, len), and every ordered pick of each size.
+# A random.sample(items, n) is then one choice among them (groups are small: 6 items -> 1200 picks).
+SKILL_DRAWS = [
+    (group, sizes, {n: list(itertools.permutations(items, n)) for n in sizes})
+    for group, items in SKILL_GROUPS.items()
+    for sizes in [range(3, min(5, len(items)) + 1)]
+]
 
 def pick_skills() -> Dict[str, List[str]]:
-    out = {}
-    for group, items in SKILL_GROUPS.items():
-        n = random.randint(3, min(5, len(items)))
-        out[group] = random.sample(items, n)
-    return out
+    return {group: list(random.choice(picks[random.choice(sizes)])) for group, sizes, picks in SKILL_DRAWS}
 
 def generate_resume() -> ResumeStruct:
     first = random.choice(FIRST_NAMES)
@@ -175,11 +215,10 @@ def generate_resume() -> ResumeStruct:
     edu_count = random.choice([1, 1, 2])
     edus: List[Education] = []
     grad_year = random.randint(2016, 2023)
-    institutions = ["State University", "Tech University", "City College", "Institute of Technology"]
     for i in range(edu_count):
         degree = random.choice(DEGREES)
         field = random.choice(FIELDS)
-        inst = f"{random.choice(institutions)} of {random.choice(['North','West','East','Central',''])}".strip()
+        inst = f"{random.choice(INSTITUTIONS)} of {random.choice(['North','West','East','Central',''])}".strip()
         year = grad_year - i
         gpa = round(random.uniform(3.2, 4.0), 2)
         edus.append(Education(institution=inst, degree=degree, field_of_study=field, year=year, gpa=gpa, location=location))
@@ -190,7 +229,7 @@ def generate_resume() -> ResumeStruct:
         company = random.choice(COMPANIES)
         job = random.choice(JOB_TITLES)
         start, end = rand_year_range()
-        exp_loc = f"{random.choice([city for city,_ in CITIES_ST])}, {random.choice([st for _,st in CITIES_ST])}"
+        exp_loc = f"{random.choice(EXP_CITIES)}, {random.choice(EXP_STATES)}"
         highs = [make_highlight() for _ in range(random.randint(2, 4))]
         exps.append(Experience(company=company, title=job, start=start, end=end, location=exp_loc, highlights=highs))
 
@@ -206,100 +245,132 @@ def generate_resume() -> ResumeStruct:
 # -------------------------------
 def render_markdown(r: ResumeStruct) -> str:
     # A stable, parser-friendly layout with explicit keys and separators
-    lines = []
-    lines.append(f"# {r.name}")
-    lines.append(f"Title: {r.title}")
-    lines.append("")
-    lines.append("## Contact")
-    lines.append(f"Email: {r.email}")
-    lines.append(f"Phone: {r.phone}")
-    lines.append(f"Location: {r.location}")
-    lines.append("")
-    lines.append("## Education")
+    # Fixed text goes out as whole f-string blocks; every piece ends in its own "\n"
+    parts = [
+        f"# {r.name}\nTitle: {r.title}\n\n"
+        f"## Contact\nEmail: {r.email}\nPhone: {r.phone}\nLocation: {r.location}\n\n"
+        "## Education\n"
+    ]
     for e in r.education:
         # One-per-line with pipe-separated fields (easy parse)
-        lines.append(f"- Institution: {e.institution} | Degree: {e.degree} | Field: {e.field_of_study} | Year: {e.year} | GPA: {e.gpa} | Location: {e.location}")
-    lines.append("")
-    lines.append("## Experience")
+        parts.append(f"- Institution: {e.institution} | Degree: {e.degree} | Field: {e.field_of_study} | Year: {e.year} | GPA: {e.gpa} | Location: {e.location}\n")
+    parts.append("\n## Experience\n")
     for x in r.experience:
-        lines.append(f"- Company: {x.company} | Title: {x.title} | Dates: {x.start} - {x.end} | Location: {x.location}")
-        lines.append(f"  Highlights:")
+        parts.append(f"- Company: {x.company} | Title: {x.title} | Dates: {x.start} - {x.end} | Location: {x.location}\n  Highlights:\n")
         for h in x.highlights:
-            lines.append(f"    - {h}")
-    lines.append("")
-    lines.append("## Skills")
+            parts.append(f"    - {h}\n")
+    parts.append("\n## Skills\n")
     for group, items in r.skills.items():
-        lines.append(f"- {group}: {', '.join(items)}")
-    lines.append("")
-    return "\n".join(lines)
+        parts.append(f"- {group}: {', '.join(items)}\n")
+    return "".join(parts)
+
+PDF_WRAP = 110         # characters per line (simple heuristic for LETTER width)
+PDF_LINE_HEIGHT = 12
+
+def wrap_pdf_line(line: str) -> List[str]:
+    """Naive word wrap at PDF_WRAP characters (blank lines give nothing)."""
+    out = []
+    while len(line) > PDF_WRAP:
+        break_at = line.rfind(" ", 0, PDF_WRAP)
+        if break_at == -1:
+            break_at = PDF_WRAP
+        out.append(line[:break_at])
+        line = line[break_at:].lstrip()
+    if line:
+        out.append(line)
+    return out
+
+def _draw_pdf_pages(c, text: str):
+    """Draw `text` onto canvas `c`, starting on a fresh page and ending with its last page shown."""
+    width, height = LETTER
+    left = 0.75 * inch
+    top = height - 0.75 * inch
+    per_page = int((top - 0.75 * inch) // PDF_LINE_HEIGHT) + 1
+
+    # Wrap everything up front, then draw each page as one text object instead of a drawString per line
+    lines = [piece for raw_line in text.splitlines() for piece in wrap_pdf_line(raw_line.expandtabs(2))]
+    for start in range(0, len(lines), per_page):
+        t = c.beginText(left, top)
+        t.setFont("Helvetica", 12, leading=PDF_LINE_HEIGHT)  # the canvas default font
+        for line in lines[start:start + per_page]:
+            t.textLine(line)
+        c.drawText(t)
+        c.showPage()
 
 def save_pdf_from_text(pdf_path: Path, text: str):
     if not HAVE_REPORTLAB:
         raise RuntimeError("reportlab not installed.")
     c = canvas.Canvas(str(pdf_path), pagesize=LETTER)
-    width, height = LETTER
-    left = 0.75 * inch
-    top = height - 0.75 * inch
-    line_height = 12
-    x, y = left, top
-
-    for raw_line in text.splitlines():
-        # naive word wrap
-        line = raw_line.expandtabs(2)
-        while len(line) > 0:
-            # wrap around ~100 chars based on width; simple heuristic
-            if len(line) <= 110:
-                draw = line
-                line = ""
-            else:
-                break_at = line.rfind(" ", 0, 110)
-                if break_at == -1:
-                    break_at = 110
-                draw = line[:break_at]
-                line = line[break_at:].lstrip()
-            c.drawString(x, y, draw)
-            y -= line_height
-            if y < 0.75 * inch:
-                c.showPage()
-                y = top
-    c.showPage()
+    _draw_pdf_pages(c, text)
+    c.save()
+
+def save_combined_pdf(pdf_path: Path, texts: Iterable[str]):
+    """All resumes in one multi-page PDF: a single Canvas (and document setup) instead of one per file."""
+    if not HAVE_REPORTLAB:
+        raise RuntimeError("reportlab not installed.")
+    c = canvas.Canvas(str(pdf_path), pagesize=LETTER)
+    for text in texts:
+        _draw_pdf_pages(c, text)
     c.save()
 
 # -------------------------------
 # Parser (deterministic)
 # -------------------------------
+# Patterns are compiled once per process, not once per resume
+_RE_HEADER_FIELD = {
+    name: re.compile(rf"^{re.escape(name)}:\s*(.+)$", re.M)
+    for name in ("Title", "Email", "Phone", "Location")
+}
+_RE_NAME = re.compile(r"^#\s+(.+)$", re.M)
+_RE_YEAR = re.compile(r"(?:19|20)\d{2}")
+
+def split_sections(md: str) -> Dict[str, str]:
+    """Map each "## Header" to the text up to the next one, in one pass (first occurrence wins)."""
+    parts = md.split("\n## ")
+    if md.startswith("## "):
+        parts[0] = parts[0][3:]
+    else:
+        parts = parts[1:]  # everything before the first section header
+    sections: Dict[str, str] = {}
+    for part in parts:
+        header, _, body = part.partition("\n")
+        sections.setdefault(header.strip(), body)
+    return sections
+
+def parse_pipe_kv(text: str) -> Dict[str, str]:
+    """Parse fields by " | " delimiters and "key: value" (keys lowercased; segments without ':' skipped)."""
+    return {
+        k.strip().lower(): v.strip()
+        for k, sep, v in (kv.partition(":") for kv in text.split("|"))
+        if sep
+    }
+
 def parse_markdown(md: str) -> ResumeStruct:
     # Extract simple sections based on headers and field prefixes
     # Assumes the template produced by render_markdown()
     def get(header: str) -> Optional[str]:
-        m = re.search(rf"^{re.escape(header)}:\s*(.+)$", md, flags=re.M)
+        m = _RE_HEADER_FIELD[header].search(md)
         return m.group(1).strip() if m else None
 
-    name_m = re.search(r"^#\s+(.+)$", md, flags=re.M)
+    name_m = _RE_NAME.search(md)
     name = name_m.group(1).strip() if name_m else ""
     title = get("Title") or ""
     email = get("Email") or ""
     phone = get("Phone") or ""
     location = get("Location") or ""
+    sections = split_sections(md)
 
     # Education lines
-    edu_sec = re.search(r"(?ms)^## Education\s*(.+?)^\s*## ", md + "\n## ", flags=0)
     edu_lines = []
-    if edu_sec:
-        for line in edu_sec.group(1).splitlines():
+    if "Education" in sections:
+        for line in sections["Education"].splitlines():
             line = line.strip()
             if line.startswith("- Institution:"):
                 edu_lines.append(line)
 
     educations: List[Education] = []
     for line in edu_lines:
-        # Parse fields by " | " delimiters and "key: value"
-        fields = [kv.strip() for kv in line[1:].split("|")]  # remove leading '-'
-        kvmap = {}
-        for kv in fields:
-            if ":" in kv:
-                k, v = kv.split(":", 1)
-                kvmap[k.strip().lower()] = v.strip()
+        kvmap = parse_pipe_kv(line[1:])  # remove leading '-'
         educations.append(Education(
             institution=kvmap.get("institution", ""),
             degree=kvmap.get("degree", ""),
@@ -310,11 +381,10 @@ def parse_markdown(md: str) -> ResumeStruct:
         ))
 
     # Experience
-    exp_sec = re.search(r"(?ms)^## Experience\s*(.+?)^\s*## ", md + "\n## ", flags=0)
     exp_lines = []
     exp_high_map = {}  # index -> highlights
-    if exp_sec:
-        lines = exp_sec.group(1).splitlines()
+    if "Experience" in sections:
+        lines = sections["Experience"].splitlines()
         current_idx = -1
         for ln in lines:
             s = ln.rstrip()
@@ -337,12 +407,7 @@ def parse_markdown(md: str) -> ResumeStruct:
 
     experiences: List[Experience] = []
     for idx, line in enumerate(exp_lines):
-        fields = [kv.strip() for kv in line[1:].split("|")]  # remove leading '-'
-        kvmap = {}
-        for kv in fields:
-            if ":" in kv:
-                k, v = kv.split(":", 1)
-                kvmap[k.strip().lower()] = v.strip()
+        kvmap = parse_pipe_kv(line[1:])  # remove leading '-'
         # Dates of form "Jan 2020 - Present"
         dates = kvmap.get("dates", "")
         start, end = "", ""
@@ -358,10 +423,9 @@ def parse_markdown(md: str) -> ResumeStruct:
         ))
 
     # Skills
-    skills_sec = re.search(r"(?ms)^## Skills\s*(.+)$", md)
     skills: Dict[str, List[str]] = {}
-    if skills_sec:
-        for line in skills_sec.group(1).splitlines():
+    if "Skills" in sections:
+        for line in sections["Skills"].splitlines():
             line = line.strip()
             if line.startswith("- ") and ":" in line:
                 k, v = line[2:].split(":", 1)
@@ -384,7 +448,14 @@ def summarize(data: ResumeStruct) -> str:
         # crude year pull from "Mon YYYY" or "YYYY"
         for token in (x.start, x.end):
             if token and token.strip() and token.strip() != "Present":
-                m = re.search(r"(19|20)\d{2}", token)
+                tail = token[-4:]
+                if (
+                    len(tail) == 4 and tail.isdigit() and tail[:2] in ("19", "20")
+                    and (len(token) == 4 or (token[-5] == " " and not any(c.isdigit() for c in token[:-5])))
+                ):
+                    yrs.add(int(tail))  # the generator's "Mon YYYY" / "YYYY": the token's only year
+                    continue
+                m = _RE_YEAR.search(token)  # anything else
                 if m:
                     yrs.add(int(m.group(0)))
     if yrs:
@@ -407,7 +478,42 @@ def summarize(data: ResumeStruct) -> str:
 # -------------------------------
 # Main flow
 # -------------------------------
-def generate_resumes(out_dir: Path, count: int, make_pdf: bool):
+# Below this many resumes, starting a process pool costs more than it saves
+PARALLEL_MIN = 64
+
+def _map_maybe_parallel(fn, items: Sequence, workers: Optional[int]) -> list:
+    """list(map(fn, items)), fanned out over processes when there are enough items."""
+    workers = min(workers or os.cpu_count() or 1, len(items))
+    if workers <= 1 or len(items) < PARALLEL_MIN:
+        return list(map(fn, items))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, items, chunksize=max(1, len(items) // (4 * workers))))
+
+def _gen_one(i: int, seed: int, md_dir: Path, txt_dir: Path, pdf_dir: Optional[Path]) -> None:
+    random.seed(seed + i)  # per-resume seed: the same output whichever process generates it
+    r = generate_resume()
+    md = render_markdown(r)
+    stem = f"resume_{i+1:02d}"
+
+    md_path = md_dir / f"{stem}.md"
+    md_path.write_text(md, encoding="utf-8")
+    # The .txt copy has the same bytes: hard-link it where the filesystem allows
+    txt_path = txt_dir / f"{stem}.txt"
+    try:
+        txt_path.unlink(missing_ok=True)
+        os.link(md_path, txt_path)
+    except OSError:
+        txt_path.write_text(md, encoding="utf-8")
+
+    if pdf_dir is not None:
+        try:
+            save_pdf_from_text(pdf_dir / f"{stem}.pdf", md)
+        except Exception as e:
+            print(f"PDF failed for {stem}: {e}")
+
+def generate_resumes(out_dir: Path, count: int, make_pdf: bool, workers: Optional[int] = None,
+                     combined_pdf: bool = False) -> int:
+    """Generate, render and write `count` resumes; returns the count (resumes are not kept in memory)."""
     md_dir = out_dir / "md"
     txt_dir = out_dir / "txt"
     pdf_dir = out_dir / "pdf"
@@ -420,49 +526,69 @@ def generate_resumes(out_dir: Path, count: int, make_pdf: bool):
         else:
             pdf_dir.mkdir(parents=True, exist_ok=True)
 
-    structs: List[ResumeStruct] = []
-
-    for i in range(count):
-        r = generate_resume()
-        structs.append(r)
-        md = render_markdown(r)
-        stem = f"resume_{i+1:02d}"
-
-        (md_dir / f"{stem}.md").write_text(md, encoding="utf-8")
-        (txt_dir / f"{stem}.txt").write_text(md, encoding="utf-8")
-
-        if make_pdf:
-            try:
-                save_pdf_from_text(pdf_dir / f"{stem}.pdf", md)
-            except Exception as e:
-                print(f"PDF failed for {stem}: {e}")
-
-    return structs
+    # Drawn from the caller's random state, so random.seed() still fixes the whole batch
+    seed = random.randrange(2**32)
+    per_file_pdf = make_pdf and not combined_pdf
+    gen = partial(_gen_one, seed=seed, md_dir=md_dir, txt_dir=txt_dir, pdf_dir=pdf_dir if per_file_pdf else None)
+    _map_maybe_parallel(gen, range(count), workers)
+
+    if make_pdf and combined_pdf:
+        md_paths = (md_dir / f"resume_{i+1:02d}.md" for i in range(count))
+        try:
+            save_combined_pdf(pdf_dir / "resumes.pdf", (p.read_text(encoding="utf-8") for p in md_paths))
+        except Exception as e:
+            print(f"Combined PDF failed: {e}")
+
+    return count
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> tuple:
+    return tuple(f.name for f in fields(cls))
+
+def json_default(o):
+    """json `default=` hook: dataclasses are encoded as they are reached, without asdict()'s deep copy."""
+    if is_dataclass(o):
+        return {name: getattr(o, name) for name in _field_names(type(o))}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+def write_json(path: Path, obj):
+    """Write `obj` as 2-space-indented JSON: orjson (dataclasses natively) when installed, else json streamed."""
+    if HAVE_ORJSON:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=json_default))
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2, default=json_default)
+
+def _parse_one(p: Path, parsed_dir: Path, generated_at: str) -> dict:
+    md = p.read_text(encoding="utf-8")
+    struct = parse_markdown(md)
+    summary = summarize(struct)
+    rec = {
+        "filename": p.name,
+        "generated_at": generated_at,
+        "data": struct,  # ResumeStruct; serialized through json_default
+        "summary": summary
+    }
+    write_json(parsed_dir / f"{p.stem}.json", rec)
+    return rec
 
-def parse_generated(out_dir: Path, use_md: bool = True):
+def parse_generated(out_dir: Path, use_md: bool = True, workers: Optional[int] = None):
     src_dir = out_dir / ("md" if use_md else "txt")
     parsed_dir = out_dir / "parsed"
     parsed_dir.mkdir(parents=True, exist_ok=True)
 
-    results = []
-    for p in sorted(src_dir.glob("*.md" if use_md else "*.txt")):
-        md = p.read_text(encoding="utf-8")
-        struct = parse_markdown(md)
-        summary = summarize(struct)
-        rec = {
-            "filename": p.name,
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "data": asdict(struct),
-            "summary": summary
-        }
-        results.append(rec)
-        (parsed_dir / f"{p.stem}.json").write_text(json.dumps(rec, indent=2), encoding="utf-8")
+    suffix = ".md" if use_md else ".txt"
+    with os.scandir(src_dir) as it:
+        names = sorted(e.name for e in it if e.name.endswith(suffix))
+    paths = [src_dir / name for name in names]
+    generated_at = datetime.utcnow().isoformat() + "Z"  # one timestamp for the whole run
+    results = _map_maybe_parallel(partial(_parse_one, parsed_dir=parsed_dir, generated_at=generated_at), paths, workers)
 
     combined = {
         "count": len(results),
         "results": results
     }
-    (parsed_dir / "combined.json").write_text(json.dumps(combined, indent=2), encoding="utf-8")
+    write_json(parsed_dir / "combined.json", combined)
     return results
 
 def main():
@@ -470,16 +596,18 @@ def main():
     ap.add_argument("--out", required=True, help="Output directory")
     ap.add_argument("--count", type=int, default=12, help="How many resumes to generate (10–15 recommended)")
     ap.add_argument("--make-pdf", action="store_true", help="Also generate PDFs (requires reportlab)")
+    ap.add_argument("--combined-pdf", action="store_true", help="With --make-pdf: one multi-page resumes.pdf instead of a PDF per resume")
+    ap.add_argument("--workers", type=int, default=None, help="Processes for large batches (default: all cores)")
     args = ap.parse_args()
 
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"🛠️  Generating {args.count} synthetic resumes -> {out_dir}")
-    generate_resumes(out_dir, args.count, args.make_pdf)
+    generate_resumes(out_dir, args.count, args.make_pdf, workers=args.workers, combined_pdf=args.combined_pdf)
 
     print("🔎 Parsing generated resumes (Markdown)...")
-    results = parse_generated(out_dir, use_md=True)
+    results = parse_generated(out_dir, use_md=True, workers=args.workers)
 
     print(f"✅ Done. Folders created:")
     print(f"   - {out_dir / 'md'} (Markdown)")
@@ -11,6 +11,7 @@ Key Features:
 - Fallback mechanisms when preferred providers fail
 - Support for both cloud (Groq) and local models
 - Consistent interface regardless of underlying provider
+- Semantic response cache: resubmitted (or near-identical) resumes reuse their summary
 
 Usage:
     from llm_summarizer import get_summarizer
@@ -19,16 +20,107 @@ Usage:
     summary = summarizer.summarize_resume(resume_data, max_length=200)
 """
 
+import asyncio
+import atexit
+import copy
+import importlib.util
+import json
 import logging
-from typing import Optional, Dict, Any
+import os
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, Iterator, List, Mapping, Tuple, Union
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from types import MappingProxyType
 
 from config import config
-from models import ResumeStruct, SummaryRequest
+from models import ResumeStruct, SummaryRequest, json_bytes
+from summary_cache import SemanticSummaryCache, request_scope
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# -------------------------
+# Optional dependency (direct Groq HTTP calls; HTTP/2 also needs h2)
+# -------------------------
+HAVE_HTTPX = False
+try:
+    import httpx
+    HAVE_HTTPX = True
+except Exception:
+    HAVE_HTTPX = False
+HAVE_H2 = importlib.util.find_spec("h2") is not None
+
+def resume_to_text(resume: ResumeStruct) -> str:
+    """
+    Convert resume structure to plain text for LLM processing.
+
+    Also the text the summary cache is keyed on.
+
+    Args:
+        resume: ResumeStruct object to convert
+
+    Returns:
+        Plain text representation of the resume
+    """
+    lines = []
+
+    # Basic information
+    if resume.name:
+        lines.append(f"Name: {resume.name}")
+    if resume.title:
+        lines.append(f"Title: {resume.title}")
+    if resume.email:
+        lines.append(f"Email: {resume.email}")
+    if resume.phone:
+        lines.append(f"Phone: {resume.phone}")
+    if resume.location:
+        lines.append(f"Location: {resume.location}")
+
+    lines.append("")  # Empty line for separation
+
+    # Education
+    if resume.education:
+        lines.append("Education:")
+        for edu in resume.education:
+            edu_text = f"- {edu.degree}"
+            if edu.institution:
+                edu_text += f" from {edu.institution}"
+            if edu.field_of_study:
+                edu_text += f" in {edu.field_of_study}"
+            if edu.year:
+                edu_text += f" ({edu.year})"
+            lines.append(edu_text)
+        lines.append("")
+
+    # Experience
+    if resume.experience:
+        lines.append("Experience:")
+        for exp in resume.experience:
+            exp_text = f"- {exp.title} at {exp.company}"
+            if exp.start or exp.end:
+                period = f" ({exp.start or 'Start'} - {exp.end or 'Present'})"
+                exp_text += period
+            if exp.location:
+                exp_text += f" in {exp.location}"
+            lines.append(exp_text)
+
+            if exp.highlights:
+                for highlight in exp.highlights:
+                    lines.append(f"  * {highlight}")
+        lines.append("")
+
+    # Skills
+    if resume.skills:
+        lines.append("Skills:")
+        for category, skills in resume.skills.items():
+            if skills:
+                lines.append(f"- {category}: {', '.join(skills)}")
+
+    return "\n".join(lines)
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -54,6 +146,42 @@ class LLMProvider(ABC):
         """
         pass
     
+    def summarize_batch(self, requests: List[SummaryRequest], texts: Optional[List[str]] = None) -> List[str]:
+        """
+        Generate summaries for several requests.
+        
+        Providers that can process a batch in one call override this; the
+        default summarizes the requests one by one. `texts` are the requests'
+        `resume_to_text` renderings when the caller already has them.
+        """
+        return [self.summarize(request) for request in requests]
+    
+    def summarize_stream(self, request: SummaryRequest) -> Iterator[str]:
+        """
+        Generate summary as a stream of text pieces.
+        
+        Providers that can stream override this; the default yields the whole
+        summary at once.
+        """
+        yield self.summarize(request)
+    
+    def clean_summary(self, text: str) -> str:
+        """The summary `summarize` would return for this raw generated text (used for streamed output)."""
+        return text.strip()
+    
+    def warmup(self) -> None:
+        """Prepare for the first request ahead of time (e.g. load a model); a no-op by default."""
+    
+    def is_ready(self) -> bool:
+        """True if a request would not first have to load a model (see `warmup`)."""
+        return True
+    
+    def after_fork(self) -> None:
+        """
+        Reset per-process state in a forked child (locks, network connections).
+        Loaded models are kept: their memory is shared copy-on-write with the parent.
+        """
+    
     @abstractmethod
     def is_available(self) -> bool:
         """
@@ -76,26 +204,86 @@ class GroqProvider(LLMProvider):
     - Reliable cloud-based service
     - Cost-effective pricing
     - Support for various model sizes
+    - Concurrent requests from async code (`summarize_many`)
+    - Direct HTTP calls over pooled (HTTP/2 when h2 is installed) httpx
+      connections; the groq SDK is only used when httpx is missing
+    - Batch API jobs for offline bulk summaries (`submit_batch`/`batch_results`)
     """
     
+    API_BASE = "https://api.groq.com/openai/v1"
+    _JSON = {"Content-Type": "application/json"}
+    BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+    SYSTEM_PROMPT = "Based on the resume, provide a summary of the candidate's skills, experience, and education."
+    
     def __init__(self):
         """
         Initialize the Groq provider.
         
-        Attempts to create a Groq client and sets availability based on
-        successful initialization and API key presence.
+        Checks that httpx (or the Groq library) is installed; the clients are
+        created on first use.
         """
-        try:
-            import groq
-            self.client = groq.Groq(api_key=config.groq_api_key)
-            self._available = True
-            logger.info("Groq client initialized successfully")
-        except ImportError:
+        # Identical for every request (config is immutable): built once. The system
+        # message leads every prompt byte-for-byte, which Groq's prefix caching relies on.
+        self._system_message = MappingProxyType({"role": "system", "content": self.SYSTEM_PROMPT})
+        self._call_defaults = {
+            "model": config.groq_model,
+            "max_tokens": config.groq_max_tokens,
+            "temperature": config.groq_temperature,
+        }
+        # Call arguments per prompt: retries, failover rounds and repeated resumes reuse them
+        self._args_for_prompt = lru_cache(maxsize=1024)(self._build_completion_args)
+        self._body_for_prompt = lru_cache(maxsize=1024)(self._build_request_body)
+        self._client = None
+        self._aclient = None
+        self._http = None
+        self._client_lock = threading.Lock()
+        self._available = HAVE_HTTPX or importlib.util.find_spec("groq") is not None
+        if not self._available:
             logger.warning("Groq library not installed. Install with: pip install groq")
-            self._available = False
-        except Exception as e:
-            logger.error(f"Failed to initialize Groq client: {e}")
-            self._available = False
+    
+    def after_fork(self) -> None:
+        # Sockets inherited from the parent must not be shared: reconnect lazily
+        self._client = self._aclient = self._http = None
+        self._client_lock = threading.Lock()
+    
+    def _http_options(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.API_BASE,
+            "headers": {"Authorization": f"Bearer {config.groq_api_key}"},
+            "timeout": httpx.Timeout(30.0, connect=5.0),
+            "limits": httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            "http2": HAVE_H2,
+        }
+    
+    @property
+    def http(self) -> "httpx.Client":
+        """Pooled synchronous HTTP client (created on first use)."""
+        if self._http is None:
+            with self._client_lock:
+                if self._http is None:
+                    self._http = httpx.Client(**self._http_options())
+        return self._http
+    
+    @property
+    def client(self):
+        """Synchronous Groq client (created on first use)."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import groq
+                    self._client = groq.Groq(api_key=config.groq_api_key)
+                    logger.info("Groq client initialized successfully")
+        return self._client
+    
+    @property
+    def aclient(self):
+        """Async Groq client (created on first use)."""
+        if self._aclient is None:
+            with self._client_lock:
+                if self._aclient is None:
+                    import groq
+                    self._aclient = groq.AsyncGroq(api_key=config.groq_api_key)
+        return self._aclient
     
     def is_available(self) -> bool:
         """
@@ -123,35 +311,231 @@ class GroqProvider(LLMProvider):
             raise RuntimeError("Groq provider not available")
         
         try:
-            # Create the prompt for the LLM
-            prompt = request.to_prompt()
-            
             # Make API call to Groq
-            response = self.client.chat.completions.create(
-                model=config.groq_model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "Based on the resume, provide a summary of the candidate's skills, experience, and education."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                max_tokens=config.groq_max_tokens,
-                temperature=config.groq_temperature
-            )
+            if HAVE_HTTPX:
+                response = self.http.post(
+                    "/chat/completions", content=self._body_for_prompt(request.to_prompt()), headers=self._JSON
+                )
+                content = self._response_content(response)
+            else:
+                content = self.client.chat.completions.create(**self._completion_args(request)).choices[0].message.content
             
             # Extract and return the generated text
-            summary = response.choices[0].message.content.strip()
+            summary = content.strip()
             logger.info(f"Successfully generated summary with Groq ({len(summary)} chars)")
             return summary
             
         except Exception as e:
             logger.error(f"Groq API error: {e}")
             raise RuntimeError(f"Failed to generate summary: {e}")
+    
+    def _completion_args(self, request: SummaryRequest) -> Mapping[str, Any]:
+        """Arguments of the chat completion call for `request` (shared: do not modify)."""
+        return self._args_for_prompt(request.to_prompt())
+    
+    def _build_completion_args(self, prompt: str) -> Mapping[str, Any]:
+        return MappingProxyType({
+            **self._call_defaults,
+            "messages": (self._system_message, MappingProxyType({"role": "user", "content": prompt})),
+        })
+    
+    def _build_request_body(self, prompt: str) -> bytes:
+        """Serialized chat completion request for `prompt` (the JSON the SDK would send)."""
+        return json_bytes({
+            **self._call_defaults,
+            "messages": [dict(self._system_message), {"role": "user", "content": prompt}],
+        }, indent=False)
+    
+    @staticmethod
+    def _response_content(response: "httpx.Response") -> str:
+        """Generated text of a chat completion response (raises on HTTP errors)."""
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+    
+    async def _create_async(self, request: SummaryRequest, http: Optional["httpx.AsyncClient"]) -> str:
+        if HAVE_HTTPX:
+            if http is None:
+                async with httpx.AsyncClient(**self._http_options()) as http:
+                    return await self._create_async(request, http)
+            response = await http.post(
+                "/chat/completions", content=self._body_for_prompt(request.to_prompt()), headers=self._JSON
+            )
+            return self._response_content(response)
+        response = await self.aclient.chat.completions.create(**self._completion_args(request))
+        return response.choices[0].message.content
+    
+    async def summarize_async(
+        self,
+        request: SummaryRequest,
+        slots: Optional[asyncio.Semaphore] = None,
+        http: Optional["httpx.AsyncClient"] = None,
+    ) -> str:
+        """
+        Generate summary with an async request.
+        
+        Args:
+            request: SummaryRequest object containing resume data and parameters
+            slots: Semaphore bounding the requests in flight, if any
+            http: Open async client to send it with (default: a client for this call only)
+            
+        Returns:
+            Generated summary text
+            
+        Raises:
+            RuntimeError: If provider is not available or API call fails
+        """
+        if not self.is_available():
+            raise RuntimeError("Groq provider not available")
+        
+        try:
+            if slots is None:
+                content = await self._create_async(request, http)
+            else:
+                async with slots:
+                    content = await self._create_async(request, http)
+            return content.strip()
+        except Exception as e:
+            logger.error(f"Groq API error: {e}")
+            raise RuntimeError(f"Failed to generate summary: {e}")
+    
+    async def summarize_many(
+        self, requests: List[SummaryRequest], concurrency: Optional[int] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Summarize several requests concurrently (at most `concurrency` in flight,
+        default `config.llm_concurrency`).
+        
+        Returns:
+            Summaries in request order; a failed request yields its exception
+        """
+        slots = asyncio.Semaphore(max(1, concurrency or config.llm_concurrency))
+        # One pooled client per call, closed with it: async connections belong to the
+        # running event loop, which may not outlive the call (asyncio.run in CLI callers)
+        if HAVE_HTTPX:
+            async with httpx.AsyncClient(**self._http_options()) as http:
+                summaries = await asyncio.gather(
+                    *[self.summarize_async(request, slots, http) for request in requests],
+                    return_exceptions=True
+                )
+        else:
+            summaries = await asyncio.gather(
+                *[self.summarize_async(request, slots) for request in requests],
+                return_exceptions=True
+            )
+        logger.info(f"Generated {sum(isinstance(s, str) for s in summaries)}/{len(requests)} summaries with Groq")
+        return summaries
 
+    
+    def summarize_stream(self, request: SummaryRequest) -> Iterator[str]:
+        """
+        Generate summary with a streamed request, yielding text as it arrives.
+        
+        The pieces are the raw deltas: leading/trailing whitespace is not
+        stripped as it is by `summarize`.
+        
+        Raises:
+            RuntimeError: If provider is not available or API call fails
+        """
+        if not self.is_available():
+            raise RuntimeError("Groq provider not available")
+        
+        try:
+            if HAVE_HTTPX:
+                body = self._body_for_prompt(request.to_prompt())
+                body = body[:-1] + b',"stream":true}'  # the memoized body is a JSON object
+                with self.http.stream("POST", "/chat/completions", content=body, headers=self._JSON) as response:
+                    response.raise_for_status()
+                    # Server-sent events: "data: <chunk JSON>" lines, ending with "data: [DONE]"
+                    for line in response.iter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        choices = json.loads(data).get("choices")
+                        delta = choices[0].get("delta", {}).get("content") if choices else None
+                        if delta:
+                            yield delta
+            else:
+                for chunk in self.client.chat.completions.create(**self._completion_args(request), stream=True):
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        yield delta
+        except Exception as e:
+            logger.error(f"Groq API error: {e}")
+            raise RuntimeError(f"Failed to generate summary: {e}")
+    
+    def submit_batch(self, requests: List[SummaryRequest]) -> str:
+        """
+        Submit `requests` as a Groq Batch API job (cheaper, not rate limited,
+        completed within 24h). Needs httpx.
+        
+        Returns:
+            The batch id (see `batch_results`)
+        """
+        if not (self.is_available() and HAVE_HTTPX):
+            raise RuntimeError("Groq batch API needs an API key and httpx")
+        
+        # One request per line, custom_id = index in `requests`; bodies are the memoized serialized ones
+        jsonl = b"".join([
+            b'{"custom_id":"%d","method":"POST","url":"/v1/chat/completions","body":%s}\n'
+            % (i, self._body_for_prompt(request.to_prompt()))
+            for i, request in enumerate(requests)
+        ])
+        try:
+            upload = self.http.post(
+                "/files", data={"purpose": "batch"}, files={"file": ("summaries.jsonl", jsonl, "application/jsonl")}
+            )
+            upload.raise_for_status()
+            batch = self.http.post("/batches", json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            })
+            batch.raise_for_status()
+        except Exception as e:
+            raise RuntimeError(f"Failed to submit Groq batch: {e}")
+        return batch.json()["id"]
+    
+    def batch_results(
+        self, batch_id: str, count: int, timeout: float, poll_interval: float = 30.0
+    ) -> List[Optional[str]]:
+        """
+        Wait up to `timeout` seconds for batch `batch_id` to finish (cancelling it
+        otherwise) and return its summaries by request index; requests without
+        a successful result are None.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                response = self.http.get(f"/batches/{batch_id}")
+                response.raise_for_status()
+                batch = response.json()
+                if batch["status"] in self.BATCH_FINAL_STATES:
+                    break
+                if time.monotonic() >= deadline:
+                    logger.warning(f"Groq batch {batch_id} not done after {timeout:.0f}s; cancelling it")
+                    self.http.post(f"/batches/{batch_id}/cancel").raise_for_status()
+                    break
+                time.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+            
+            summaries: List[Optional[str]] = [None] * count
+            if not batch.get("output_file_id"):
+                return summaries
+            output = self.http.get(f"/files/{batch['output_file_id']}/content")
+            output.raise_for_status()
+        except Exception as e:
+            raise RuntimeError(f"Failed to collect Groq batch {batch_id}: {e}")
+        
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") == 200:
+                summaries[int(result["custom_id"])] = response["body"]["choices"][0]["message"]["content"].strip()
+        logger.info(f"Groq batch {batch_id}: {sum(s is not None for s in summaries)}/{count} summaries")
+        return summaries
 
 class LocalProvider(LLMProvider):
     """
@@ -159,7 +543,8 @@ class LocalProvider(LLMProvider):
     
     This provider runs open-source LLM models locally using the Hugging Face
     transformers library. It supports both sequence-to-sequence and causal
-    language models, making it flexible for different model types.
+    language models, making it flexible for different model types. Prompts are
+    tokenized and generated as one padded batch (`summarize_batch`).
     
     Features:
     - Privacy: No data leaves your system
@@ -173,36 +558,68 @@ class LocalProvider(LLMProvider):
     - Local model files downloaded
     """
 
+    MAX_NEW_TOKENS = 256  # Summary length cap for causal models
+    SUMMARY_WORDS = 50    # Causal summaries are cut to this many words...
+    SUMMARY_TOKENS = int(SUMMARY_WORDS * 1.4)  # ...so generating (~1.4 tokens/word) beyond this is wasted
+
+    # Accepted `config.local_dtype` values -> torch dtype name
+    DTYPES = {
+        "float32": "float32", "fp32": "float32",
+        "float16": "float16", "fp16": "float16", "half": "float16",
+        "bfloat16": "bfloat16", "bf16": "bfloat16",
+    }
+
+    # Fixed prompt openings (everything before the resume text). Causal models
+    # prefill these once at load and reuse the KV cache for every request.
+    PROMPT_PREFIX = "Please provide a professional summary of the following resume:\n"
+    CHAT_PREFIX = (
+        "<|im_start|>system\n"
+        "You are a professional resume analyst. Provide concise, professional summaries of candidate resumes.\n"
+        "<|im_end|>\n"
+        "<|im_start|>user\n"
+    )
+
     def __init__(self):
         """
         Initialize the local provider.
         
-        Attempts to import required libraries and sets availability flag.
-        Model loading is deferred until first use to save memory.
+        Checks that the required libraries are installed and sets the
+        availability flag. Importing them (torch alone takes seconds) and
+        loading the model are deferred until first use.
         """
-        self._available = False
+        self._torch = None
         self._tok = None
         self._model = None
+        self._device = "cpu"
+        self._max_prompt = None  # Prompt tokens kept (context minus room for the summary)
         self._is_encdec = False  # Is this an encoder-decoder model?
         self._is_chat = False    # Is this a chat model?
+        self._prefix_ids = None  # (1, P) token ids of the prompt prefix
+        self._prefix_kv = None   # Their KV cache, copied per batch
+        self._load_lock = threading.Lock()  # summaries may be requested from several threads
         
-        try:
-            # Import required libraries
-            import torch
-            from transformers import AutoConfig, AutoTokenizer, AutoModel, pipeline
-            
-            self._torch = torch
-            self._AutoConfig = AutoConfig
-            self._AutoTokenizer = AutoTokenizer
-            self._AutoModel = AutoModel
-            self._pipeline = pipeline
-            self._available = True
-            
-            logger.info("Local provider dependencies imported successfully")
-        except ImportError as e:
-            logger.warning(f"Transformers/torch not installed: {e}")
+        missing = [name for name in ("torch", "transformers") if importlib.util.find_spec(name) is None]
+        self._available = not missing
+        if missing:
+            logger.warning(f"Transformers/torch not installed: missing {', '.join(missing)}")
             logger.info("Install with: pip install transformers torch sentencepiece")
-            self._available = False
+
+    def after_fork(self) -> None:
+        self._load_lock = threading.Lock()
+
+    def _import_dependencies(self) -> None:
+        """Import torch and transformers (once)."""
+        if self._torch is not None:
+            return
+        from transformers import AutoConfig, AutoTokenizer, AutoModelForCausalLM, AutoModelForSeq2SeqLM
+        
+        self._AutoConfig = AutoConfig
+        self._AutoTokenizer = AutoTokenizer
+        self._AutoModelForCausalLM = AutoModelForCausalLM
+        self._AutoModelForSeq2SeqLM = AutoModelForSeq2SeqLM
+        import torch
+        self._torch = torch  # assigned last: marks the imports done
+        logger.info("Local provider dependencies imported successfully")
 
     def is_available(self) -> bool:
         """
@@ -216,6 +633,10 @@ class LocalProvider(LLMProvider):
         
         # Check CUDA availability if GPU is requested
         if getattr(config, "local_device", "cpu") == "cuda":
+            try:
+                self._import_dependencies()
+            except ImportError:
+                return False
             return self._torch.cuda.is_available()
         
         return True
@@ -232,126 +653,228 @@ class LocalProvider(LLMProvider):
             return 0
         return -1
 
+    def _cpu_has_bf16(self) -> bool:
+        """True if this CPU computes bfloat16 natively (AVX512-BF16/AMX on x86, BF16 on ARM)."""
+        cpu = getattr(self._torch, "cpu", None)
+        for check in ("_is_avx512_bf16_supported", "_is_amx_tile_supported"):
+            try:
+                if getattr(cpu, check)():
+                    return True
+            except Exception:
+                pass
+        try:
+            with open("/proc/cpuinfo") as f:
+                flags = set(f.read().split())
+        except OSError:
+            return False
+        return bool(flags & {"avx512_bf16", "amx_bf16", "bf16"})
+
+    def _dtype_name(self) -> str:
+        """torch dtype name for `config.local_dtype` ("auto" unchanged); raises ValueError for others."""
+        name = getattr(config, "local_dtype", "auto")
+        if name == "auto":
+            return name
+        if name not in self.DTYPES:
+            raise ValueError(f"Unknown local dtype: {name} (expected auto, {', '.join(self.DTYPES)})")
+        return self.DTYPES[name]
+
+    def _resolve_dtype(self, gpu: bool):
+        """torch dtype to load the model with (see `config.local_dtype`)."""
+        name = self._dtype_name()
+        if name != "auto":
+            return getattr(self._torch, name)
+        if gpu:
+            return self._torch.float16
+        # Decoding is memory-bound: bf16 halves the traffic where the CPU has native support
+        return self._torch.bfloat16 if self._cpu_has_bf16() else self._torch.float32
+
+    def _quantization_config(self, gpu: bool, dtype):
+        """bitsandbytes settings for `config.local_quantization` (None: load unquantized)."""
+        mode = getattr(config, "local_quantization", "")
+        if not mode:
+            return None
+        if mode not in ("int8", "int4"):
+            raise ValueError(f"Unknown local quantization: {mode} (expected int8 or int4)")
+        if not gpu:
+            logger.warning("bitsandbytes quantization needs a GPU; loading unquantized (see the llamacpp provider for CPUs)")
+            return None
+        from transformers import BitsAndBytesConfig
+        if mode == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True)
+        # Decoding is memory-bound: 4-bit NF4 weights move a quarter of the fp16 bytes per token
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=dtype,
+            bnb_4bit_use_double_quant=True,
+        )
+
+    def _configure_cpu_threads(self) -> None:
+        """Apply `config.local_threads` to intra-op parallelism; generation needs no inter-op threads."""
+        threads = getattr(config, "local_threads", 0)
+        if threads > 0:
+            self._torch.set_num_threads(threads)
+        try:
+            self._torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # only settable before torch's first parallel work
+
+    def _compile(self, model, gpu: bool):
+        """
+        Wrap the model's forward in torch.compile (opt-in, `config.local_compile`).
+        
+        Compilation is lazy: only a missing torch.compile is caught here. Compile
+        errors, the compile time and recompiles for new shapes surface in generate().
+        """
+        if not getattr(config, "local_compile", False) or not hasattr(self._torch, "compile"):
+            return model
+        try:
+            # generate() calls forward, so that is what gets compiled (not the module wrapper).
+            # Shapes vary with batch and prompt length, hence dynamic; CUDA graphs only pay off on GPU.
+            model.forward = self._torch.compile(
+                model.forward, mode="reduce-overhead" if gpu else "default", dynamic=True, fullgraph=False
+            )
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, running the local model eagerly: {e}")
+        return model
+
     def _load_model(self):
         """
         Load the local model and tokenizer.
         
         This method is called lazily when first needed to save memory.
-        It detects the model type and sets up the appropriate pipeline.
+        It detects the model type and loads it with the matching generation head.
         """
         if self._model is not None:
-            return  # Already loaded
+            return  # Already loaded (the model is assigned last)
         
+        with self._load_lock:
+            if self._model is None:
+                self._load_model_locked()
+
+    def _load_model_locked(self):
+        """Load the model; the caller holds `_load_lock`."""
         model_path = getattr(config, "local_model_path", None)
         if not model_path:
             raise RuntimeError("Local model path not configured")
+        self._dtype_name()  # reject a bad RESUME_LOCAL_DTYPE before loading anything
         
         try:
             logger.info(f"Loading local model from: {model_path}")
+            self._import_dependencies()
             
             # Load model configuration to determine type
-            config_obj = self._AutoConfig.from_pretrained(model_path)
+            # A local checkpoint directory needs no Hub lookups (each worker process would repeat them)
+            local_only = os.path.isdir(model_path)
+            config_obj = self._AutoConfig.from_pretrained(model_path, local_files_only=local_only)
             self._is_encdec = hasattr(config_obj, "is_encoder_decoder") and config_obj.is_encoder_decoder
             
-            # Load tokenizer
-            self._tok = self._AutoTokenizer.from_pretrained(model_path)
-            if self._tok.pad_token is None:
-                self._tok.pad_token = self._tok.eos_token
+            # Load tokenizer (the Rust-backed fast one: batches are encoded in a single native call)
+            tok = self._AutoTokenizer.from_pretrained(model_path, use_fast=True, local_files_only=local_only)
+            if not getattr(tok, "is_fast", False):
+                logger.warning(f"No fast tokenizer for {model_path}; tokenization will be slower")
+            if tok.pad_token is None:
+                tok.pad_token = tok.eos_token
+            if not self._is_encdec:
+                tok.padding_side = "left"  # batched prompts must end where generation starts
+            self._tok = tok
             
-            # Load model
-            self._model = self._AutoModel.from_pretrained(
-                model_path,
-                device_map=self._resolve_device(),
-                torch_dtype=self._torch.float16 if self._resolve_device() >= 0 else self._torch.float32
-            )
+            # Tokenizers without a configured limit report a huge sentinel; fall back to the model's
+            context = tok.model_max_length
+            if not context or context > 1_000_000:
+                context = getattr(config_obj, "max_position_embeddings", None) or 2048
+            self._max_prompt = context if self._is_encdec else max(context // 2, context - self.MAX_NEW_TOKENS)
             
-            # Create pipeline based on model type
-            if self._is_encdec:
-                self._pipe = self._pipeline(
-                    "summarization",
-                    model=self._model,
-                    tokenizer=self._tok,
-                    device=self._resolve_device()
+            # Load model (AutoModel would have no LM head to generate with)
+            auto_model = self._AutoModelForSeq2SeqLM if self._is_encdec else self._AutoModelForCausalLM
+            gpu = self._resolve_device() >= 0
+            self._device = "cuda:0" if gpu else "cpu"
+            dtype = self._resolve_dtype(gpu)
+            quantization = self._quantization_config(gpu, dtype)
+            # safetensors weights are memory-mapped: processes loading the same file share its pages
+            if quantization is not None:
+                # bitsandbytes places the quantized weights itself; they cannot be moved afterwards
+                model = auto_model.from_pretrained(
+                    model_path, torch_dtype=dtype, quantization_config=quantization,
+                    device_map={"": 0}, local_files_only=local_only,
                 )
             else:
-                self._pipe = self._pipeline(
-                    "text-generation",
-                    model=self._model,
-                    tokenizer=self._tok,
-                    device=self._resolve_device()
-                )
+                model = auto_model.from_pretrained(
+                    model_path, torch_dtype=dtype, low_cpu_mem_usage=True, local_files_only=local_only
+                ).to(self._device)
+            if not gpu:
+                self._configure_cpu_threads()
+            model = self._compile(model.eval(), gpu)
+            if not self._is_encdec:
+                self._prefill_prefix(model)
+            self._model = model
             
-            logger.info(f"Local model loaded successfully (type: {'encoder-decoder' if self._is_encdec else 'causal'})")
+            weights = config.local_quantization if quantization is not None else dtype
+            logger.info(f"Local model loaded successfully (type: {'encoder-decoder' if self._is_encdec else 'causal'}, weights: {weights})")
             
         except Exception as e:
             logger.error(f"Failed to load local model: {e}")
             raise RuntimeError(f"Model loading failed: {e}")
 
-    def _resume_to_text(self, resume: ResumeStruct) -> str:
+    def warmup(self) -> None:
+        """
+        Load the model and run a one-token generation, so the first real request
+        pays neither the load nor the kernel/torch.compile warm-up.
+        """
+        if not self.is_available():
+            return
+        try:
+            started = time.perf_counter()
+            self._load_model()  # concurrent summarize calls wait on `_load_lock` instead of loading again
+            inputs = self._tok([self._tok.eos_token or "."], return_tensors="pt").to(self._device)
+            with self._torch.inference_mode():
+                self._model.generate(**inputs, max_new_tokens=1, pad_token_id=self._tok.pad_token_id)
+            logger.info(f"Local model warmed up in {time.perf_counter() - started:.1f}s")
+        except Exception as e:
+            logger.warning(f"Local model warm-up failed: {e}")
+
+    def is_ready(self) -> bool:
+        return self._model is not None
+
+    def _prefill_prefix(self, model) -> None:
+        """Run the fixed prompt prefix through the model once and keep its KV cache."""
+        prefix = self.CHAT_PREFIX if self._is_chat else self.PROMPT_PREFIX
+        try:
+            prefix_ids = self._tok(prefix, return_tensors="pt")["input_ids"].to(self._device)
+            with self._torch.inference_mode():
+                kv = model(input_ids=prefix_ids, use_cache=True, return_dict=True).past_key_values
+            if isinstance(kv, tuple):  # legacy per-layer (key, value) tuples
+                from transformers import DynamicCache
+                kv = DynamicCache.from_legacy_cache(kv)
+            if not hasattr(kv, "batch_repeat_interleave"):
+                raise TypeError(f"unsupported cache type {type(kv).__name__}")
+        except Exception as e:
+            logger.warning(f"Prompt prefix cache disabled: {e}")
+            return
+        self._prefix_ids, self._prefix_kv = prefix_ids, kv
+
+    def _prefixed_inputs(self, suffixes: List[str]) -> Dict[str, Any]:
         """
-        Convert resume structure to plain text for LLM processing.
+        `generate` inputs for prompts made of the cached prefix plus `suffixes`.
         
-        Args:
-            resume: ResumeStruct object to convert
-            
-        Returns:
-            Plain text representation of the resume
-        """
-        lines = []
-        
-        # Basic information
-        if resume.name:
-            lines.append(f"Name: {resume.name}")
-        if resume.title:
-            lines.append(f"Title: {resume.title}")
-        if resume.email:
-            lines.append(f"Email: {resume.email}")
-        if resume.phone:
-            lines.append(f"Phone: {resume.phone}")
-        if resume.location:
-            lines.append(f"Location: {resume.location}")
-        
-        lines.append("")  # Empty line for separation
-        
-        # Education
-        if resume.education:
-            lines.append("Education:")
-            for edu in resume.education:
-                edu_text = f"- {edu.degree}"
-                if edu.institution:
-                    edu_text += f" from {edu.institution}"
-                if edu.field_of_study:
-                    edu_text += f" in {edu.field_of_study}"
-                if edu.year:
-                    edu_text += f" ({edu.year})"
-                lines.append(edu_text)
-            lines.append("")
-        
-        # Experience
-        if resume.experience:
-            lines.append("Experience:")
-            for exp in resume.experience:
-                exp_text = f"- {exp.title} at {exp.company}"
-                if exp.start or exp.end:
-                    period = f" ({exp.start or 'Start'} - {exp.end or 'Present'})"
-                    exp_text += period
-                if exp.location:
-                    exp_text += f" in {exp.location}"
-                lines.append(exp_text)
-                
-                if exp.highlights:
-                    for highlight in exp.highlights:
-                        lines.append(f"  * {highlight}")
-            lines.append("")
-        
-        # Skills
-        if resume.skills:
-            lines.append("Skills:")
-            for category, skills in resume.skills.items():
-                if skills:
-                    lines.append(f"- {category}: {', '.join(skills)}")
-        
-        return "\n".join(lines)
+        Suffixes are left-padded after the prefix (masked out), and each batch
+        gets its own copy of the prefix cache, so only the suffixes are prefilled.
+        """
+        prefix_len = self._prefix_ids.shape[1]
+        enc = self._tok(
+            suffixes, return_tensors="pt", padding=True, truncation=True,
+            max_length=max(1, self._max_prompt - prefix_len), add_special_tokens=False
+        ).to(self._device)
+        n = enc["input_ids"].shape[0]
+        prefix_ids = self._prefix_ids.expand(n, -1)
+        kv = copy.deepcopy(self._prefix_kv)
+        if n > 1:
+            kv.batch_repeat_interleave(n)
+        return {
+            "input_ids": self._torch.cat([prefix_ids, enc["input_ids"]], dim=1),
+            "attention_mask": self._torch.cat([self._torch.ones_like(prefix_ids), enc["attention_mask"]], dim=1),
+            "past_key_values": kv,
+        }
 
     def _build_prompt(self, resume_text: str) -> str:
         """
@@ -363,8 +886,11 @@ class LocalProvider(LLMProvider):
         Returns:
             Formatted prompt for the model
         """
-        return f"""Please provide a professional summary of the following resume:
+        return self.PROMPT_PREFIX + self._build_prompt_suffix(resume_text)
 
+    def _build_prompt_suffix(self, resume_text: str) -> str:
+        """The resume-specific part of `_build_prompt`."""
+        return f"""
 {resume_text}
 
 Summary:"""
@@ -379,15 +905,54 @@ Summary:"""
         Returns:
             Chat-formatted prompt
         """
-        return f"""<|im_start|>system
-You are a professional resume analyst. Provide concise, professional summaries of candidate resumes.
-<|im_end|>
-<|im_start|>user
-Please summarize this resume: {resume_text}
+        return self.CHAT_PREFIX + self._chat_prompt_suffix(resume_text)
+
+    def _chat_prompt_suffix(self, resume_text: str) -> str:
+        """The resume-specific part of `_chat_prompt`."""
+        return f"""Please summarize this resume: {resume_text}
 <|im_end|>
 <|im_start|>assistant
 """
 
+    def _generate_ids(self, requests: List[SummaryRequest], texts: List[str], **generate_kwargs):
+        """Tokenize the prompts and generate; returns (new token ids per row, length limit per row)."""
+        if self._prefix_kv is not None:
+            suffix = self._chat_prompt_suffix if self._is_chat else self._build_prompt_suffix
+            inputs = self._prefixed_inputs([suffix(text) for text in texts])
+        else:
+            if self._is_chat and not self._is_encdec:
+                prompts = [self._chat_prompt(text) for text in texts]
+            else:
+                prompts = [self._build_prompt(text) for text in texts]
+            inputs = self._tok(
+                prompts, return_tensors="pt", padding=True, truncation=True, max_length=self._max_prompt
+            ).to(self._device)
+
+        # Generate summaries based on model type
+        if self._is_encdec:
+            limits = [min(request.max_length, 200) for request in requests]
+            sequences = self._model.generate(
+                **inputs,
+                max_length=max(limits),
+                min_length=40,
+                do_sample=False,
+                use_cache=True,
+                **generate_kwargs,
+            )
+        else:
+            limits = [min(request.max_length, self.MAX_NEW_TOKENS, self.SUMMARY_TOKENS) for request in requests]
+            sequences = self._model.generate(
+                **inputs,
+                max_new_tokens=max(limits),
+                do_sample=False,
+                use_cache=True,
+                eos_token_id=self._tok.eos_token_id,
+                pad_token_id=self._tok.pad_token_id,
+                **generate_kwargs,
+            )
+            sequences = sequences[:, inputs["input_ids"].shape[1]:]  # drop the (left-padded) prompts
+        return sequences, limits
+
     def summarize(self, request: SummaryRequest) -> str:
         """
         Generate summary using the local model.
@@ -398,54 +963,230 @@ Please summarize this resume: {resume_text}
         Returns:
             Generated summary text
             
+        Raises:
+            RuntimeError: If provider is not available or summarization fails
+        """
+        return self.summarize_batch([request])[0]
+
+    def summarize_batch(self, requests: List[SummaryRequest], texts: Optional[List[str]] = None) -> List[str]:
+        """
+        Generate summaries for several requests with a single `generate` call.
+        
+        Prompts are tokenized together (padded, truncated) and decoded with
+        `batch_decode`; each request keeps its own output-length limit.
+        
+        Args:
+            requests: SummaryRequest objects to summarize
+            texts: Their `resume_to_text` renderings, if already computed
+            
+        Returns:
+            Generated summaries, in request order
+            
         Raises:
             RuntimeError: If provider is not available or summarization fails
         """
         if not self.is_available():
             raise RuntimeError("Local provider not available")
+        if not requests:
+            return []
 
         # Load model if not already loaded
         self._load_model()
         
-        # Convert resume to text
-        resume_text = self._resume_to_text(request.resume_data)
+        # Convert resumes to prompts
+        if texts is None:
+            texts = [resume_to_text(request.resume_data) for request in requests]
+        
+        # No autograd bookkeeping (version counters, view tracking) for any tensor made here
+        with self._torch.inference_mode():
+            sequences, limits = self._generate_ids(requests, texts)
+        
+        results = self._tok.batch_decode(
+            [row[:limit] for row, limit in zip(sequences, limits)], skip_special_tokens=True
+        )
+        
+        summaries = [self.clean_summary(result) for result in results]
+        
+        logger.info(f"Successfully generated {len(summaries)} summaries with local model")
+        return summaries
 
-        # Generate summary based on model type
+
+    def clean_summary(self, text: str) -> str:
         if self._is_encdec:
-            # Use summarization pipeline for encoder-decoder models
-            result = self._pipe(
-                self._build_prompt(resume_text),
-                max_length=min(getattr(request, "max_length", 120), 200),
-                min_length=40,
-                do_sample=False,
-                truncation=True
-            )
-            summary = result[0]["generated_text"].strip()
-        else:
-            # Use text generation pipeline for causal models
-            prompt = self._chat_prompt(resume_text) if self._is_chat else self._build_prompt(resume_text)
-            result = self._pipe(
-                prompt,
-                max_new_tokens=min(getattr(request, "max_length", 160), 256),
-                do_sample=False,
-                temperature=0.0,
-                eos_token_id=getattr(self._tok, "eos_token_id", None),
-                pad_token_id=getattr(self._tok, "eos_token_id", None),
-                truncation=True
-            )[0]["generated_text"]
+            return text.strip()
+        
+        # Clean up the generated text
+        if "Summary:" in text:
+            text = text.split("Summary:", 1)[-1]
+        words = text.split(None, self.SUMMARY_WORDS)
+        if len(words) > self.SUMMARY_WORDS:  # rare now that generation is capped
+            return " ".join(words[:self.SUMMARY_WORDS])
+        return text.strip()
+
+    def summarize_stream(self, request: SummaryRequest) -> Iterator[str]:
+        """
+        Generate summary with the local model, yielding text as tokens are decoded.
+        
+        Generation runs on a background thread feeding a transformers
+        TextIteratorStreamer. The pieces are the raw decoded text; `clean_summary`
+        of their concatenation is what `summarize` would have returned.
+        """
+        if not self.is_available():
+            raise RuntimeError("Local provider not available")
+        
+        self._load_model()
+        from transformers import TextIteratorStreamer
+        streamer = TextIteratorStreamer(self._tok, skip_prompt=True, skip_special_tokens=True)
+        errors = []
+        
+        def run() -> None:
+            try:
+                with self._torch.inference_mode():  # thread-local: entered in the generating thread
+                    self._generate_ids([request], [resume_to_text(request.resume_data)], streamer=streamer)
+            except Exception as e:
+                errors.append(e)
+                streamer.end()  # unblock the consumer
+        
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        for piece in streamer:
+            if piece:
+                yield piece
+        worker.join()
+        if errors:
+            raise RuntimeError(f"Failed to generate summary: {errors[0]}")
+
+class LlamaCppProvider(LLMProvider):
+    """
+    Quantized GGUF model summarization provider (llama.cpp).
+    
+    For CPU hosts: llama.cpp runs 4-bit (e.g. Q4_K_M) weights with native
+    SIMD int4 kernels, several times the throughput of the transformers
+    model in float32. The GGUF's own chat template formats the prompt.
+    
+    Requirements:
+    - llama-cpp-python installed
+    - A GGUF model file (RESUME_LLAMACPP_MODEL_PATH)
+    """
+
+    def __init__(self):
+        """
+        Initialize the llama.cpp provider.
+        
+        Only checks that llama-cpp-python is installed; the model is loaded on
+        first use (or by `warmup`).
+        """
+        self._llm = None
+        self._load_lock = threading.Lock()
+        self._call_lock = threading.Lock()  # a Llama instance runs one generation at a time
+        self._available = importlib.util.find_spec("llama_cpp") is not None
+        if not self._available:
+            logger.info("llama-cpp-python not installed. Install with: pip install llama-cpp-python")
 
-            # Clean up the generated text
-            if result.startswith(prompt):
-                result = result[len(prompt):]
+    def after_fork(self) -> None:
+        self._load_lock = threading.Lock()
+        self._call_lock = threading.Lock()
 
-            if "Summary:" in result:
-                result = result.split("Summary:", 1)[-1].strip()
+    def is_available(self) -> bool:
+        """
+        Check if llama.cpp provider is available.
+        
+        Returns:
+            True if llama-cpp-python is installed and a GGUF path is configured
+        """
+        return self._available and bool(getattr(config, "llamacpp_model_path", ""))
 
-            summary = " ".join(result.strip().split()[:50])  # Quick length control
+    def _load_model(self):
+        """Load the GGUF model (once)."""
+        if self._llm is not None:
+            return self._llm
         
-        logger.info(f"Successfully generated summary with local model ({len(summary)} chars)")
-        return summary
+        with self._load_lock:
+            if self._llm is None:
+                model_path = config.llamacpp_model_path
+                try:
+                    logger.info(f"Loading GGUF model from: {model_path}")
+                    from llama_cpp import Llama
+                    self._llm = Llama(
+                        model_path=model_path,
+                        n_ctx=config.llamacpp_ctx,
+                        n_threads=config.local_threads or os.cpu_count(),
+                        verbose=False,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to load GGUF model: {e}")
+                    raise RuntimeError(f"Model loading failed: {e}")
+        return self._llm
 
+    def is_ready(self) -> bool:
+        return self._llm is not None
+
+    def _messages(self, request: SummaryRequest) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": GroqProvider.SYSTEM_PROMPT},
+            {"role": "user", "content": request.to_prompt()},
+        ]
+
+    def warmup(self) -> None:
+        if not self.is_available():
+            return
+        try:
+            self._load_model()
+        except Exception as e:
+            logger.warning(f"GGUF model warm-up failed: {e}")
+
+    def summarize(self, request: SummaryRequest) -> str:
+        """
+        Generate summary with the GGUF model.
+        
+        Args:
+            request: SummaryRequest object containing resume data and parameters
+            
+        Returns:
+            Generated summary text
+            
+        Raises:
+            RuntimeError: If provider is not available or generation fails
+        """
+        if not self.is_available():
+            raise RuntimeError("llama.cpp provider not available")
+        
+        llm = self._load_model()
+        try:
+            with self._call_lock:
+                response = llm.create_chat_completion(
+                    messages=self._messages(request),
+                    max_tokens=config.local_max_tokens,
+                    temperature=config.local_temperature,
+                )
+            summary = response["choices"][0]["message"]["content"].strip()
+            logger.info(f"Successfully generated summary with llama.cpp ({len(summary)} chars)")
+            return summary
+        except Exception as e:
+            logger.error(f"llama.cpp generation error: {e}")
+            raise RuntimeError(f"Failed to generate summary: {e}")
+
+    def summarize_stream(self, request: SummaryRequest) -> Iterator[str]:
+        """Generate summary with the GGUF model, yielding text as tokens are sampled."""
+        if not self.is_available():
+            raise RuntimeError("llama.cpp provider not available")
+        
+        llm = self._load_model()
+        try:
+            with self._call_lock:
+                for chunk in llm.create_chat_completion(
+                    messages=self._messages(request),
+                    max_tokens=config.local_max_tokens,
+                    temperature=config.local_temperature,
+                    stream=True,
+                ):
+                    choices = chunk.get("choices")
+                    piece = choices[0]["delta"].get("content") if choices else None
+                    if piece:
+                        yield piece
+        except Exception as e:
+            logger.error(f"llama.cpp generation error: {e}")
+            raise RuntimeError(f"Failed to generate summary: {e}")
 
 class LLMSummarizer:
     """
@@ -458,70 +1199,132 @@ class LLMSummarizer:
     Features:
     - Automatic provider selection based on availability
     - Easy provider switching
-    - Fallback mechanisms
+    - Fallback mechanisms: a failing provider is backed off (exponentially,
+      with jitter) and its requests go to the other available providers that are
+      ready (see `_failover_order`), fastest (by smoothed latency) first
     - Consistent interface across providers
     """
     
+    # Provider name -> class; providers are only instantiated when first needed
+    PROVIDER_FACTORIES = {
+        "groq": GroqProvider,
+        "local": LocalProvider,
+        "llamacpp": LlamaCppProvider,
+    }
+    
+    # Failover tuning
+    BACKOFF_BASE = 1.0     # Seconds a provider is skipped after its first failure, doubled per further failure
+    BACKOFF_MAX = 60.0
+    LATENCY_ALPHA = 0.2    # Weight of the newest sample in the latency moving average
+    
     def __init__(self):
         """
         Initialize the summarizer with available providers.
         
-        Creates provider instances and automatically selects the best available
-        provider based on configuration and availability.
+        Automatically selects the best available provider based on configuration
+        and availability. Only the providers looked at are instantiated.
         """
-        # Initialize all available providers
-        self.providers = {
-            "groq": GroqProvider(),
-            "local": LocalProvider()
-        }
-        self._current_provider = None
+        self._providers: Dict[str, LLMProvider] = {}
+        self._providers_lock = threading.Lock()
+        self._current_name: Optional[str] = None
+        
+        # Provider health, for failover
+        self._latency_ema: Dict[str, float] = {}  # provider -> smoothed seconds per summary
+        self._retry_at: Dict[str, float] = {}     # provider -> monotonic time it may be tried again
+        self._failures: Dict[str, int] = {}       # provider -> consecutive failures
+        self._health_lock = threading.Lock()
+        
+        # Summaries for resumes seen before (optionally persisted across restarts)
+        self.cache = SemanticSummaryCache(
+            threshold=config.cache_sim_threshold,
+            max_entries=config.cache_size,
+            ttl_seconds=config.cache_ttl,
+            embed_model=config.cache_embed_model,
+        )
+        if config.cache_path:
+            loaded = self.cache.load(config.cache_path)
+            if loaded:
+                logger.info(f"Loaded {loaded} cached summaries from {config.cache_path}")
+            atexit.register(self.save_cache)
         
         # Auto-select provider based on configuration
         try:
-            from config import config
             preferred_provider = config.provider
             
             # Try to use the preferred provider if it's available
-            if preferred_provider in self.providers and self.providers[preferred_provider].is_available():
-                self._current_provider = self.providers[preferred_provider]
+            if preferred_provider in self.PROVIDER_FACTORIES and self._get(preferred_provider).is_available():
+                self._current_name = preferred_provider
                 logger.info(f"Auto-selected preferred provider: {preferred_provider}")
             else:
                 # Fallback to first available provider
-                for name, provider in self.providers.items():
-                    if provider.is_available():
-                        self._current_provider = provider
-                        logger.info(f"Fallback to provider: {name}")
-                        break
+                self._current_name = self._first_available()
+                if self._current_name:
+                    logger.info(f"Fallback to provider: {self._current_name}")
                         
         except Exception as e:
             logger.warning(f"Could not auto-select provider: {e}")
             # Fallback to first available provider
-            for name, provider in self.providers.items():
-                if provider.is_available():
-                    self._current_provider = provider
-                    logger.info(f"Fallback to provider: {name}")
-                    break
+            self._current_name = self._first_available()
+            if self._current_name:
+                logger.info(f"Fallback to provider: {self._current_name}")
+        
+        if self._current_name:
+            self._start_warmup(self._current_name)
+        for name in config.failover_providers:
+            if name != self._current_name and name in self.PROVIDER_FACTORIES and self._get(name).is_available():
+                self._start_warmup(name)
+    
+    def _start_warmup(self, name: str) -> None:
+        """Warm provider `name` up on a background thread (see `config.warmup`)."""
+        if not config.warmup:
+            return
+        threading.Thread(target=self._get(name).warmup, name=f"{name}-warmup", daemon=True).start()
+    
+    def after_fork(self) -> None:
+        """Reset locks and connections in a forked child; cached summaries and loaded models are kept."""
+        self._providers_lock = threading.Lock()
+        self._health_lock = threading.Lock()
+        self.cache.after_fork()
+        for provider in self._providers.values():
+            provider.after_fork()
+    
+    def _get(self, name: str) -> LLMProvider:
+        """The provider called `name`, instantiated on first use."""
+        provider = self._providers.get(name)
+        if provider is None:
+            with self._providers_lock:
+                provider = self._providers.get(name)
+                if provider is None:
+                    provider = self._providers[name] = self.PROVIDER_FACTORIES[name]()
+        return provider
+    
+    def _first_available(self) -> Optional[str]:
+        """Name of the first available provider, if any."""
+        for name in self.PROVIDER_FACTORIES:
+            if self._get(name).is_available():
+                return name
+        return None
     
     def set_provider(self, provider_name: str) -> None:
         """
         Set the current LLM provider.
         
         Args:
-            provider_name: Name of the provider to use ('groq' or 'local')
+            provider_name: Name of the provider to use ('groq', 'local' or 'llamacpp')
             
         Raises:
             ValueError: If provider name is unknown
             RuntimeError: If provider is not available
         """
-        if provider_name not in self.providers:
-            raise ValueError(f"Unknown provider: {provider_name}. Available: {list(self.providers.keys())}")
+        if provider_name not in self.PROVIDER_FACTORIES:
+            raise ValueError(f"Unknown provider: {provider_name}. Available: {list(self.PROVIDER_FACTORIES)}")
         
-        provider = self.providers[provider_name]
-        if not provider.is_available():
+        if not self._get(provider_name).is_available():
             raise RuntimeError(f"Provider {provider_name} is not available")
         
-        self._current_provider = provider
+        self._current_name = provider_name
         logger.info(f"Set LLM provider to: {provider_name}")
+        self._start_warmup(provider_name)
     
     def get_available_providers(self) -> Dict[str, bool]:
         """
@@ -530,7 +1333,7 @@ class LLMSummarizer:
         Returns:
             Dictionary mapping provider names to availability status
         """
-        return {name: provider.is_available() for name, provider in self.providers.items()}
+        return {name: self._get(name).is_available() for name in self.PROVIDER_FACTORIES}
     
     def get_current_provider_name(self) -> str:
         """
@@ -539,19 +1342,108 @@ class LLMSummarizer:
         Returns:
             Name of the current provider, or 'none' if no provider is set
         """
-        if self._current_provider is None:
-            return "none"
+        return self._current_name or "none"
+    
+    def save_cache(self) -> None:
+        """Persist the summary cache to `config.cache_path` (no-op when unset)."""
+        if not config.cache_path:
+            return
+        try:
+            self.cache.save(config.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not save summary cache to {config.cache_path}: {e}")
+    
+    def _select_provider(self) -> LLMProvider:
+        """Return the current provider, auto-selecting the first available one if none is set."""
+        if self._current_name is None:
+            # Auto-select first available provider
+            name = self._first_available()
+            if name is None:
+                raise RuntimeError("No LLM providers available")
+            self._current_name = name
+            logger.info(f"Auto-selected provider: {name}")
         
-        for name, provider in self.providers.items():
-            if provider is self._current_provider:
-                return name
+        return self._get(self._current_name)
+    
+    def _failover_order(self) -> List[str]:
+        """
+        Providers to try, in order: the current one, then the other available
+        ones, fastest first. Providers backing off after a failure are skipped
+        (unless all are, in which case the current one is tried anyway).
         
-        return "unknown"
+        A fallback that still has to load its model (a multi-GB local model,
+        on the request thread) is only tried if `config.failover_providers`
+        lists it; those are warmed up at startup.
+        """
+        current = self.get_current_provider_name()
+        others = sorted(
+            (
+                name for name in self.PROVIDER_FACTORIES
+                if name != current and self._get(name).is_available()
+                and (name in config.failover_providers or self._get(name).is_ready())
+            ),
+            key=lambda name: self._latency_ema.get(name, 0.0)
+        )
+        now = time.monotonic()
+        return [name for name in [current, *others] if self._retry_at.get(name, 0.0) <= now] or [current]
+    
+    def _record(self, name: str, seconds: Optional[float]) -> None:
+        """Record a provider call: its latency per summary, or None if it failed."""
+        with self._health_lock:
+            if seconds is None:
+                failures = self._failures[name] = self._failures.get(name, 0) + 1
+                delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (failures - 1))
+                self._retry_at[name] = time.monotonic() + delay * random.uniform(0.5, 1.0)
+            else:
+                self._failures.pop(name, None)
+                self._retry_at.pop(name, None)
+                previous = self._latency_ema.get(name)
+                self._latency_ema[name] = seconds if previous is None else (
+                    (1 - self.LATENCY_ALPHA) * previous + self.LATENCY_ALPHA * seconds
+                )
+    
+    def _generate(self, requests: List[SummaryRequest], texts: List[str]) -> List[Tuple[str, str]]:
+        """
+        Summarize `requests` with the first provider in failover order that succeeds.
+        
+        Returns:
+            (summary, provider name) pairs, in request order
+            
+        Raises:
+            RuntimeError: If every provider failed
+        """
+        error = None
+        for name in self._failover_order():
+            start = time.monotonic()
+            try:
+                summaries = self._get(name).summarize_batch(requests, texts=texts)
+            except Exception as e:
+                self._record(name, None)
+                logger.warning(f"Provider {name} failed ({e}), trying the next one")
+                error = e
+                continue
+            self._record(name, (time.monotonic() - start) / len(requests))
+            return [(summary, name) for summary in summaries]
+        raise RuntimeError(f"All LLM providers failed: {error}")
+    
+    def _cache_keys(self, requests: List[SummaryRequest]) -> List[str]:
+        """The cache text of each request (see `_scope` for the rest of the key)."""
+        return [resume_to_text(request.resume_data) for request in requests]
+    
+    @staticmethod
+    def _scope(request: SummaryRequest, provider_name: str):
+        return request_scope(
+            request.resume_data.name, provider_name, request.max_length, request.tone, request.focus_areas
+        )
     
     def summarize(self, request: SummaryRequest) -> str:
         """
         Generate summary using the current provider.
         
+        The summary of the same (or a near-identical) resume, requested with the
+        same provider and parameters, is served from the cache. If the provider
+        fails, the other available providers are tried.
+        
         Args:
             request: SummaryRequest object containing resume data and parameters
             
@@ -561,17 +1453,196 @@ class LLMSummarizer:
         Raises:
             RuntimeError: If no providers are available or summarization fails
         """
-        if self._current_provider is None:
-            # Auto-select first available provider
-            for name, provider in self.providers.items():
-                if provider.is_available():
-                    self._current_provider = provider
-                    logger.info(f"Auto-selected provider: {name}")
-                    break
-            else:
-                raise RuntimeError("No LLM providers available")
+        return self.summarize_with_provider(request)[0]
+    
+    def summarize_with_provider(self, request: SummaryRequest) -> Tuple[str, str]:
+        """Like `summarize`, but returns (summary, name of the provider that produced it)."""
+        return self._summarize_batch([request])[0]
+    
+    def summarize_batch(self, requests: List[SummaryRequest]) -> List[str]:
+        """
+        Generate summaries for several requests using the current provider.
+        
+        Cached summaries are reused; the rest go to the provider as one batch
+        (or to the next provider, if it fails).
         
-        return self._current_provider.summarize(request)
+        Args:
+            requests: SummaryRequest objects to summarize
+            
+        Returns:
+            Generated summaries, in request order
+        """
+        return [summary for summary, _ in self._summarize_batch(requests)]
+    
+    def _summarize_batch(self, requests: List[SummaryRequest]) -> List[Tuple[str, str]]:
+        self._select_provider()
+        provider_name = self.get_current_provider_name()
+        texts = self._cache_keys(requests)
+        results: List[Any] = []
+        for request, text in zip(requests, texts):
+            summary = self.cache.lookup(text, self._scope(request, provider_name))
+            results.append(None if summary is None else (summary, provider_name))
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            generated = self._generate([requests[i] for i in missing], [texts[i] for i in missing])
+            for i, (summary, name) in zip(missing, generated):
+                results[i] = (summary, name)
+                self.cache.insert(texts[i], self._scope(requests[i], name), summary)
+        return results
+    
+    async def summarize_many_async(
+        self, requests: List[SummaryRequest]
+    ) -> List[Union[Tuple[str, str], BaseException]]:
+        """
+        Generate summaries for several requests from async code.
+        
+        Cached summaries are reused. The rest are requested concurrently from
+        providers with an async client (Groq); other providers get them in
+        batches of `config.llm_concurrency` via `summarize_batch`, off the event loop.
+        Requests that fail are retried on the next provider in failover order.
+        
+        Args:
+            requests: SummaryRequest objects to summarize
+            
+        Returns:
+            (summary, provider name) pairs in request order; a failed request yields its exception
+        """
+        self._select_provider()
+        provider_name = self.get_current_provider_name()
+        texts = self._cache_keys(requests)
+        results: List[Any] = []
+        for request, text in zip(requests, texts):
+            summary = self.cache.lookup(text, self._scope(request, provider_name))
+            results.append(None if summary is None else (summary, provider_name))
+        
+        def store(i: int, summary: str, name: str) -> None:
+            results[i] = (summary, name)
+            self.cache.insert(texts[i], self._scope(requests[i], name), summary)
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        name = self._failover_order()[0]
+        provider = self._get(name)
+        if pending and hasattr(provider, "summarize_many"):
+            start = time.monotonic()
+            generated = await provider.summarize_many([requests[i] for i in pending])
+            done = [(i, summary) for i, summary in zip(pending, generated) if isinstance(summary, str)]
+            if done:
+                self._record(name, (time.monotonic() - start) / len(pending))
+            if len(done) < len(pending):
+                self._record(name, None)
+            for i, summary in done:
+                store(i, summary, name)
+            pending = [i for i in pending if results[i] is None]
+        
+        size = max(1, config.llm_concurrency)
+        for start in range(0, len(pending), size):
+            chunk = pending[start:start + size]
+            try:
+                generated = await asyncio.to_thread(
+                    self._generate, [requests[i] for i in chunk], [texts[i] for i in chunk]
+                )
+            except Exception as e:
+                for i in chunk:
+                    results[i] = e
+                continue
+            for i, (summary, name) in zip(chunk, generated):
+                store(i, summary, name)
+        return results
+    
+    def summarize_batch_offline(
+        self,
+        requests: List[SummaryRequest],
+        timeout: float = 24 * 3600.0,
+        poll_interval: float = 30.0,
+        batch_id: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Summarize a large set of requests through the Groq Batch API (about half
+        the per-token price, no rate limits, but results can take hours).
+        
+        Cached summaries are reused; the rest are submitted as one batch job and
+        waited for. Whatever the job did not return within `timeout` (it is then
+        cancelled) is summarized with regular requests. Without Groq batch
+        support, everything goes through `summarize_batch`.
+        
+        Args:
+            requests: SummaryRequest objects to summarize
+            timeout: Seconds to wait for the batch job
+            poll_interval: Seconds between status checks
+            batch_id: Id of a job already submitted for these same requests
+                (logged at submission), to resume waiting after an interruption
+            
+        Returns:
+            Generated summaries, in request order
+        """
+        groq_provider = self._get("groq")
+        if not (HAVE_HTTPX and groq_provider.is_available()):
+            return self.summarize_batch(requests)
+        
+        texts = self._cache_keys(requests)
+        summaries: List[Optional[str]] = [
+            self.cache.lookup(text, self._scope(request, "groq")) for request, text in zip(requests, texts)
+        ]
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        if missing:
+            if batch_id is None:
+                batch_id = groq_provider.submit_batch([requests[i] for i in missing])
+                logger.info(f"Submitted Groq batch {batch_id} ({len(missing)} requests); "
+                            f"pass batch_id='{batch_id}' to resume waiting for it")
+            results = groq_provider.batch_results(batch_id, len(missing), timeout, poll_interval)
+            for i, summary in zip(missing, results):
+                if summary is not None:
+                    summaries[i] = summary
+                    self.cache.insert(texts[i], self._scope(requests[i], "groq"), summary)
+        
+        leftover = [i for i, summary in enumerate(summaries) if summary is None]
+        if leftover:
+            for i, summary in zip(leftover, self.summarize_batch([requests[i] for i in leftover])):
+                summaries[i] = summary
+        return summaries
+    
+    def summarize_stream(self, request: SummaryRequest) -> Iterator[str]:
+        """
+        Generate summary as a stream of text pieces, so callers can start on
+        partial output before generation finishes.
+        
+        A cached summary is yielded whole. A provider that fails before
+        yielding anything is failed over like in `summarize`; the complete
+        streamed summary is cached.
+        
+        Args:
+            request: SummaryRequest object containing resume data and parameters
+            
+        Yields:
+            Pieces of the summary text, in order
+        """
+        self._select_provider()
+        text = resume_to_text(request.resume_data)
+        cached = self.cache.lookup(text, self._scope(request, self.get_current_provider_name()))
+        if cached is not None:
+            yield cached
+            return
+        
+        error = None
+        for name in self._failover_order():
+            pieces: List[str] = []
+            start = time.monotonic()
+            try:
+                for piece in self._get(name).summarize_stream(request):
+                    pieces.append(piece)
+                    yield piece
+            except Exception as e:
+                if pieces:
+                    raise  # part of the summary is already out: it cannot come from another provider
+                self._record(name, None)
+                logger.warning(f"Provider {name} failed ({e}), trying the next one")
+                error = e
+                continue
+            self._record(name, time.monotonic() - start)
+            self.cache.insert(text, self._scope(request, name), self._get(name).clean_summary("".join(pieces)))
+            return
+        raise RuntimeError(f"All LLM providers failed: {error}")
     
     def summarize_resume(self, resume: ResumeStruct, **kwargs) -> str:
         """
@@ -591,14 +1662,33 @@ class LLMSummarizer:
         return self.summarize(request)
 
 
-# Global summarizer instance for easy access
-summarizer = LLMSummarizer()
+# Global summarizer instance, created on first use (see get_summarizer)
+_summarizer: Optional[LLMSummarizer] = None
+_summarizer_lock = threading.Lock()
 
 def get_summarizer() -> LLMSummarizer:
     """
-    Get the global summarizer instance.
+    Get the global summarizer instance (created on first call).
+    
+    Processes forked after it was created keep it (a loaded local model is
+    shared copy-on-write rather than loaded again) with fresh locks and
+    connections.
     
     Returns:
         Global LLMSummarizer instance
     """
-    return summarizer
+    global _summarizer
+    if _summarizer is None:
+        with _summarizer_lock:
+            if _summarizer is None:
+                _summarizer = LLMSummarizer()
+    return _summarizer
+
+def _after_fork_in_child() -> None:
+    global _summarizer_lock
+    _summarizer_lock = threading.Lock()
+    if _summarizer is not None:
+        _summarizer.after_fork()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
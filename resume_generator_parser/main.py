@@ -54,6 +54,8 @@ class ResumeProcessor:
                 llm_model = config.groq_model
             elif llm_provider == "local":
                 llm_model = config.local_model_path or "local"
+            elif llm_provider == "llamacpp":
+                llm_model = config.llamacpp_model_path or "llamacpp"
             else:
                 llm_model = "unknown"
         except Exception as e:
@@ -156,7 +158,7 @@ def main():
     parser = argparse.ArgumentParser(description="Resume Parser with LLM Summarization")
     parser.add_argument("--input", "-i", required=True, help="Input file or directory")
     parser.add_argument("--output", "-o", required=True, help="Output directory")
-    parser.add_argument("--provider", "-p", help="LLM provider (groq, local)")
+    parser.add_argument("--provider", "-p", help="LLM provider (groq, local, llamacpp)")
     parser.add_argument("--pattern", default="*.md", help="File pattern for directory processing")
     parser.add_argument("--max-length", type=int, default=200, help="Maximum summary length")
     parser.add_argument("--tone", choices=["professional", "casual", "technical"], default="professional", help="Summary tone")
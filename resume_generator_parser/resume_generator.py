@@ -2,10 +2,13 @@
 Synthetic resume generator module.
 Generates consistent, parser-friendly resumes in markdown format.
 """
+import os
 import random
 import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from models import ResumeStruct, Education, Experience
 
@@ -292,41 +295,67 @@ class ResumeRenderer:
             logger.error(f"PDF generation failed: {e}")
             return False
 
-def generate_resumes(output_dir: Path, count: int, make_pdf: bool = False) -> List[ResumeStruct]:
-    """Generate multiple resumes and save them to the output directory."""
-    generator = ResumeGenerator()
+def _save_resume(resume: ResumeStruct, stem: str, md_dir: Path, txt_dir: Path, pdf_dir: Optional[Path]) -> None:
+    """Write one resume in every requested format (module-level so it can run in a worker process)."""
     renderer = ResumeRenderer()
     
+    # Save markdown and text (same rendering)
+    text = renderer.to_markdown(resume)
+    (md_dir / f"{stem}.md").write_text(text, encoding="utf-8")
+    (txt_dir / f"{stem}.txt").write_text(text, encoding="utf-8")
+    
+    # Save PDF if requested
+    if pdf_dir is not None:
+        pdf_path = pdf_dir / f"{stem}.pdf"
+        if not renderer.to_pdf(resume, pdf_path):
+            logger.warning(f"Failed to generate PDF for {stem}")
+
+def generate_resumes(
+    output_dir: Path, count: int, make_pdf: bool = False, pool: Optional[Executor] = None
+) -> List[ResumeStruct]:
+    """
+    Generate multiple resumes and save them to the output directory.
+    
+    PDFs are rendered in `pool` if given, else in processes started for this call.
+    """
+    generator = ResumeGenerator()
+    
     # Create output directories
     md_dir = output_dir / "markdown"
     txt_dir = output_dir / "text"
-    pdf_dir = output_dir / "pdf"
+    pdf_dir = output_dir / "pdf" if make_pdf else None
     
     md_dir.mkdir(parents=True, exist_ok=True)
     txt_dir.mkdir(parents=True, exist_ok=True)
     
-    if make_pdf:
+    if pdf_dir is not None:
         pdf_dir.mkdir(parents=True, exist_ok=True)
     
-    # Generate resumes
+    # Generate resumes (sequentially, so the seeded output stays reproducible)
     resumes = generator.generate_multiple(count)
+    stems = [f"resume_{i+1:02d}" for i in range(count)]
+    n = len(resumes)
     
-    for i, resume in enumerate(resumes):
-        stem = f"resume_{i+1:02d}"
-        
-        # Save markdown
-        md_path = md_dir / f"{stem}.md"
-        md_path.write_text(renderer.to_markdown(resume), encoding="utf-8")
-        
-        # Save text
-        txt_path = txt_dir / f"{stem}.txt"
-        txt_path.write_text(renderer.to_text(resume), encoding="utf-8")
-        
-        # Save PDF if requested
-        if make_pdf:
-            pdf_path = pdf_dir / f"{stem}.pdf"
-            if not renderer.to_pdf(resume, pdf_path):
-                logger.warning(f"Failed to generate PDF for {stem}")
+    # PDF rendering is CPU-bound, so spread it over processes; markdown/text alone is cheap
+    workers = min(os.cpu_count() or 1, n)
+    if make_pdf and workers > 1:
+        own_pool = pool is None
+        if own_pool:
+            # Spawned, not forked: the caller may run threads (e.g. the summarizer's
+            # model warm-up) whose locks a forked child could inherit held
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            list(pool.map(
+                _save_resume, resumes, stems,
+                [md_dir] * n, [txt_dir] * n, [pdf_dir] * n,
+                chunksize=max(1, n // (4 * workers)),
+            ))
+        finally:
+            if own_pool:
+                pool.shutdown()
+    else:
+        for resume, stem in zip(resumes, stems):
+            _save_resume(resume, stem, md_dir, txt_dir, pdf_dir)
     
     logger.info(f"Generated {count} resumes in {output_dir}")
     return resumes
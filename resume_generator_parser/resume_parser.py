@@ -18,11 +18,8 @@ class ResumeParser:
     """Parser for resume files in markdown and text formats (sample-compatible)."""
 
     def __init__(self):
-        # Headings (tolerate ## or ###)
-        self.h_contact = re.compile(r"^#{2,3}\s*Contact\s*$", re.I)
-        self.h_education = re.compile(r"^#{2,3}\s*Education\s*$", re.I)
-        self.h_experience = re.compile(r"^#{2,3}\s*Experience\s*$", re.I)
-        self.h_skills = re.compile(r"^#{2,3}\s*Skills\s*$", re.I)
+        # Section headings (tolerate ## or ###), one alternation so each line is tested once
+        self.h_section = re.compile(r"^#{2,3}\s*(Contact|Education|Experience|Skills)\s*$", re.I)
 
         # Top matter
         self.rx_name = re.compile(r"^#\s*(.+)$")                       # e.g., "# Emerson Wilson"
@@ -61,10 +58,11 @@ class ResumeParser:
         name = self._extract_name(lines)
         title = self._extract_title(lines)
 
-        email, phone, location = self._extract_contact(lines)
-        education = self._extract_education(lines)
-        experience = self._extract_experience(lines)
-        skills = self._extract_skills(lines)
+        sections = self._section_bounds(lines)
+        email, phone, location = self._extract_contact(lines, sections.get("contact"))
+        education = self._extract_education(lines, sections.get("education"))
+        experience = self._extract_experience(lines, sections.get("experience"))
+        skills = self._extract_skills(lines, sections.get("skills"))
 
         return ResumeStruct(
             name=name or "Unknown",
@@ -93,32 +91,26 @@ class ResumeParser:
                 return m.group(1).strip()
         return None
 
-    def _section_bounds(self, lines: List[str], header_rx: re.Pattern) -> Optional[range]:
-        """Return range(start, end) of a section body (between this header and the next header)."""
-        start = end = None
+    def _section_bounds(self, lines: List[str]) -> Dict[str, range]:
+        """
+        Map each section name (lowercased) to the range of its body: from its first
+        header to the next section header. One pass over the lines.
+        """
+        headers = []
         for i, line in enumerate(lines):
-            if header_rx.match(line.strip()):
-                start = i + 1
-                break
-        if start is None:
-            return None
-        # find next top-level section header
-        for j in range(start, len(lines)):
-            if (
-                self.h_contact.match(lines[j].strip())
-                or self.h_education.match(lines[j].strip())
-                or self.h_experience.match(lines[j].strip())
-                or self.h_skills.match(lines[j].strip())
-            ):
-                end = j
-                break
-        if end is None:
-            end = len(lines)
-        return range(start, end)
-
-    def _extract_contact(self, lines: List[str]) -> (Optional[str], Optional[str], Optional[str]):
+            m = self.h_section.match(line.strip())
+            if m:
+                headers.append((i, m.group(1).lower()))
+
+        bounds: Dict[str, range] = {}
+        ends = [i for i, _ in headers[1:]] + [len(lines)]
+        for (i, name), end in zip(headers, ends):
+            if name not in bounds:
+                bounds[name] = range(i + 1, end)
+        return bounds
+
+    def _extract_contact(self, lines: List[str], rng: Optional[range]) -> (Optional[str], Optional[str], Optional[str]):
         email = phone = location = None
-        rng = self._section_bounds(lines, self.h_contact)
         if rng is None:
             # fall back: scan all lines (lenient)
             for line in lines:
@@ -158,9 +150,8 @@ class ResumeParser:
                 out[k.strip().lower()] = v.strip()
         return out
 
-    def _extract_education(self, lines: List[str]) -> List[Education]:
+    def _extract_education(self, lines: List[str], rng: Optional[range]) -> List[Education]:
         result: List[Education] = []
-        rng = self._section_bounds(lines, self.h_education)
         if rng is None:
             return result
 
@@ -189,9 +180,8 @@ class ResumeParser:
             )
         return result
 
-    def _extract_experience(self, lines: List[str]) -> List[Experience]:
+    def _extract_experience(self, lines: List[str], rng: Optional[range]) -> List[Experience]:
         result: List[Experience] = []
-        rng = self._section_bounds(lines, self.h_experience)
         if rng is None:
             return result
 
@@ -251,9 +241,8 @@ class ResumeParser:
             result.append(current)
         return result
 
-    def _extract_skills(self, lines: List[str]) -> Dict[str, List[str]]:
+    def _extract_skills(self, lines: List[str], rng: Optional[range]) -> Dict[str, List[str]]:
         skills: Dict[str, List[str]] = {}
-        rng = self._section_bounds(lines, self.h_skills)
         if rng is None:
             return skills
 
@@ -303,3 +292,10 @@ def get_parser() -> ResumeParser:
     if _parser is None:
         _parser = ResumeParser()
     return _parser
+
+def parse_text(content: str) -> ResumeStruct:
+    """
+    Parse resume text with the process-wide parser.
+    Module-level and light on imports so it can run in a worker process.
+    """
+    return get_parser().parse_content(content)
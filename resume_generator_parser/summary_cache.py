@@ -0,0 +1,225 @@
+"""
+Semantic cache for LLM resume summaries.
+
+Summarizing a resume costs a full LLM round trip, yet the same resume is often
+submitted again (re-uploads, batch re-runs). Entries are keyed by the resume
+text and bucketed by the request parameters (max_length, tone, focus areas,
+provider) plus the parsed candidate name, so a summary is only ever reused for
+the same person under the same settings.
+
+Lookup order:
+1. Exact match on a BLAKE2b hash of the text (no model needed).
+2. Near-duplicate match (opt-in): cosine similarity of sentence embeddings >= threshold.
+   Needs sentence-transformers; without it the cache works in exact-match mode.
+   Off by default: an updated resume of the same person (new job, title or
+   skills) is a near duplicate, and would get the summary of the old version.
+
+Entries expire after a TTL and are evicted LRU-first. `save`/`load` persist them
+(pickle) so a restarted process keeps its summaries.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Optional dependency (embeddings)
+# -------------------------
+HAVE_ST = False
+try:
+    from sentence_transformers import SentenceTransformer
+    HAVE_ST = True
+except Exception:
+    HAVE_ST = False
+
+DEFAULT_EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def request_scope(
+    name: str,
+    provider: str,
+    max_length: int,
+    tone: str,
+    focus_areas: Optional[Sequence[str]],
+) -> Tuple:
+    """Bucket key: only entries produced for the same candidate and settings are comparable."""
+    return (name, provider, int(max_length), tone, tuple(sorted(focus_areas or ())))
+
+
+class SemanticSummaryCache:
+    """Exact + cosine-similarity keyed LRU/TTL cache of resume summaries."""
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        embed_model: str = DEFAULT_EMBED_MODEL,
+    ):
+        self.threshold = None if threshold is None else float(threshold)
+        self.max_entries = int(max_entries)
+        self.ttl = float(ttl_seconds)
+        self.embed_model = embed_model
+        self._model = None                                   # loaded on first use
+        self._semantic = HAVE_ST and self.threshold is not None and self.threshold <= 1.0  # else exact hits only
+        self._vecs: Optional[np.ndarray] = None              # (max_entries, d), one row per slot
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # slot -> (digest, scope, value, stored_at)
+        self._by_digest: Dict[Tuple[str, Hashable], int] = {}     # (digest, scope) -> slot
+        self._free = list(range(self.max_entries))
+        self._lock = threading.Lock()
+        self.hits = self.semantic_hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        if not self._semantic:
+            return None
+        try:
+            if self._model is None:
+                logger.info(f"Loading summary cache embedder: {self.embed_model}")
+                self._model = SentenceTransformer(self.embed_model, device="cpu")
+            return self._model.encode([text], normalize_embeddings=True, show_progress_bar=False)[0].astype(np.float32)
+        except Exception as e:
+            logger.warning(f"Summary cache embedder unavailable, using exact matches only: {e}")
+            self._semantic = False
+            return None
+
+    def _drop(self, slot: int) -> None:
+        digest, scope, _, _ = self._entries.pop(slot)
+        self._by_digest.pop((digest, scope), None)
+        self._free.append(slot)
+
+    def _expire(self, now: float) -> None:
+        for slot in [s for s, (_, _, _, ts) in self._entries.items() if now - ts > self.ttl]:
+            self._drop(slot)
+
+    def lookup(self, text: str, scope: Hashable) -> Optional[Any]:
+        """Return the value cached for this text (or a near duplicate) in `scope`, if any."""
+        if self.max_entries <= 0:
+            return None
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        with self._lock:
+            self._expire(time.monotonic())
+            slot = self._by_digest.get((digest, scope))
+            if slot is not None:
+                self._entries.move_to_end(slot)
+                self.hits += 1
+                return self._entries[slot][2]
+            slots = [s for s, (_, sc, _, _) in self._entries.items() if sc == scope]
+
+        vec = self._embed(text) if slots and self._vecs is not None else None
+        with self._lock:
+            if vec is not None:
+                slots = [s for s in slots if s in self._entries]  # may have changed meanwhile
+                if slots:
+                    sims = self._vecs[slots] @ vec
+                    best = int(np.argmax(sims))
+                    if sims[best] >= self.threshold:
+                        self._entries.move_to_end(slots[best])
+                        self.hits += 1
+                        self.semantic_hits += 1
+                        return self._entries[slots[best]][2]
+            self.misses += 1
+        return None
+
+    def insert(self, text: str, scope: Hashable, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        vec = self._embed(text)
+        with self._lock:
+            self._expire(time.monotonic())
+            old = self._by_digest.get((digest, scope))
+            if old is not None:
+                self._drop(old)
+            if not self._free:
+                self._drop(next(iter(self._entries)))
+            slot = self._free.pop()
+            if vec is not None:
+                if self._vecs is None:
+                    self._vecs = np.zeros((self.max_entries, vec.shape[0]), dtype=np.float32)
+                self._vecs[slot] = vec
+            elif self._vecs is not None:
+                self._vecs[slot] = 0.0  # never a semantic match
+            self._entries[slot] = (digest, scope, value, time.monotonic())
+            self._by_digest[(digest, scope)] = slot
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "threshold": self.threshold,
+                "ttl_seconds": self.ttl,
+                "semantic": self._semantic,
+            }
+
+    def save(self, path: str) -> None:
+        """Write all live entries to `path` (atomically replaced)."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            entries = [
+                (digest, scope, value, now - ts, None if self._vecs is None else self._vecs[slot].copy())
+                for slot, (digest, scope, value, ts) in self._entries.items()
+            ]
+        tmp = f"{path}.{os.getpid()}.tmp"  # processes sharing the path must not share the temp file
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": 1, "entries": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def load(self, path: str) -> int:
+        """Add the entries saved at `path` (if any, and not expired); returns how many were loaded."""
+        try:
+            with open(path, "rb") as f:
+                entries = pickle.load(f)["entries"]
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable summary cache file {path}: {e}")
+            return 0
+        if self.max_entries <= 0:
+            return 0
+
+        loaded = 0
+        with self._lock:
+            now = time.monotonic()
+            for digest, scope, value, age, vec in entries[-self.max_entries:]:  # saved oldest first
+                if age > self.ttl or (digest, scope) in self._by_digest:
+                    continue
+                if not self._free:
+                    self._drop(next(iter(self._entries)))
+                slot = self._free.pop()
+                if vec is not None and self._semantic:
+                    if self._vecs is None:
+                        self._vecs = np.zeros((self.max_entries, vec.shape[0]), dtype=np.float32)
+                    self._vecs[slot] = vec
+                elif self._vecs is not None:
+                    self._vecs[slot] = 0.0
+                self._entries[slot] = (digest, scope, value, now - age)
+                self._by_digest[(digest, scope)] = slot
+                loaded += 1
+        return loaded
+
+    def after_fork(self) -> None:
+        """Give a forked child its own lock (the parent's may have been held while forking)."""
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_digest.clear()
+            self._free = list(range(self.max_entries))